@@ -11,12 +11,13 @@ in tests/test_import_lightness.py enforces it.
 from __future__ import annotations
 
 import click
+import functools
 import os
 import sys
 import io
 import json
 import re
-import tempfile
+from operator import itemgetter
 from typing import Optional, Tuple, List
 
 from colorama import init, Fore, Style
@@ -25,11 +26,11 @@ from colorama import init, Fore, Style
 from . import __version__
 
 # Light modular components (no heavy transitive imports)
-from .config import cloud_config, SKIP_PATTERNS, FORMAT_EXTENSION_MAP
+from .config import cloud_config, SKIP_PATTERNS, FORMAT_EXTENSIONS, COMPRESSION_EXTENSIONS, MULTIREAD_WORKERS
 from .compression import (
+    classify_path,
     detect_compression,
     decompress_stream,
-    strip_compression_extension,
     get_streaming_decompressor,
     supports_streaming_decompression,
 )
@@ -40,7 +41,9 @@ from .storage.base import (
     parse_cloud_path,
     get_stream,
     list_directory,
+    iter_directory,
     get_file_size,
+    get_range,
 )
 from .completion import complete_path as _complete_path
 
@@ -69,40 +72,138 @@ def _configure_color(no_color: bool) -> None:
     init(strip=not use_color)
 
 
-def _get_reader(input_format: str):
-    """Resolve the non-streaming reader for a format (lazy import).
+# Format -> reader function in the readers package. Each has a
+# "<name>_streaming" variant taking stream/num_rows/columns/stats/where
+# keywords (plus delimiter for CSV).
+_READER_NAMES = {
+    'csv': 'read_csv_data',
+    'json': 'read_json_data',
+    'parquet': 'read_parquet_data',
+    'avro': 'read_avro_data',
+    'orc': 'read_orc_data',
+    'text': 'read_text_data',
+}
+
+
+def _get_reader(input_format: str, delimiter: Optional[str] = None, streaming: bool = False):
+    """Resolve the reader for a format (lazy import).
 
     Resolves through the readers package at call time so tests can patch
     cloudcat.readers.read_<fmt>_data, and so importing this module never
-    pulls pandas/pyarrow.
+    pulls pandas/pyarrow. The CSV delimiter is bound here, so callers invoke
+    every format's reader the same way.
+
+    Returns:
+        The reader callable, or None for an unsupported format.
     """
+    name = _READER_NAMES.get(input_format)
+    if name is None:
+        return None
     from . import readers
-    table = {
-        'csv': lambda stream, n, columns, delimiter: readers.read_csv_data(stream, n, columns, delimiter),
-        'json': lambda stream, n, columns, delimiter: readers.read_json_data(stream, n, columns),
-        'parquet': lambda stream, n, columns, delimiter: readers.read_parquet_data(stream, n, columns),
-        'avro': lambda stream, n, columns, delimiter: readers.read_avro_data(stream, n, columns),
-        'orc': lambda stream, n, columns, delimiter: readers.read_orc_data(stream, n, columns),
-        'text': lambda stream, n, columns, delimiter: readers.read_text_data(stream, n, columns),
-    }
-    return table.get(input_format)
-
-
-def _list_non_empty_files(service: str, bucket: str, prefix: str) -> List[Tuple[str, int]]:
+    reader = getattr(readers, name + '_streaming' if streaming else name)
+    if input_format == 'csv':
+        return functools.partial(reader, delimiter=delimiter)
+    return reader
+
+
+# Directory listings can hold thousands of objects, so per-file matching
+# avoids the regex engine where it can. Skip patterns that are plain
+# "<literal>$" anchors become one str.endswith() tuple check; anything else
+# is fused into a single precompiled alternation.
+_REGEX_METACHARS = frozenset('\\^$.*+?()[]{}|')
+
+
+def _split_skip_patterns(patterns: List[str]) -> Tuple[Tuple[str, ...], Optional[re.Pattern]]:
+    """Split skip patterns into literal suffixes and a fused regex remainder."""
+    suffixes = []
+    remainder = []
+    for pattern in patterns:
+        body = pattern[:-1] if pattern.endswith('$') else None
+        if body is not None and not (_REGEX_METACHARS & set(body.replace('\\.', ''))):
+            suffixes.append(body.replace('\\.', '.'))
+        else:
+            remainder.append(pattern)
+    regex = re.compile('|'.join(f'(?:{p})' for p in remainder)) if remainder else None
+    return tuple(suffixes), regex
+
+
+_SKIP_SUFFIXES, _SKIP_RE = _split_skip_patterns(SKIP_PATTERNS)
+
+# Lowercase "<ext>[<compression>]" suffixes per format, e.g. '.csv', '.csv.gz'.
+_FORMAT_SUFFIXES = {
+    fmt: tuple(ext + comp for ext in exts for comp in ('', *COMPRESSION_EXTENSIONS))
+    for fmt, exts in FORMAT_EXTENSIONS.items()
+}
+_ANY_FORMAT_SUFFIXES = tuple(s for suffixes in _FORMAT_SUFFIXES.values() for s in suffixes)
+
+
+def _is_metadata_file(name: str) -> bool:
+    """True if the filename is a metadata/marker file (e.g. _SUCCESS, .crc)."""
+    if name.endswith(_SKIP_SUFFIXES):
+        return True
+    return _SKIP_RE is not None and _SKIP_RE.search(name) is not None
+
+
+# Per-invocation LIST cache. main() enables it so the multi-file path's format
+# inference, preview selection and --count share a single listing of the
+# directory instead of issuing one LIST round-trip each. None means disabled
+# (library callers and tests always get a fresh listing).
+_listing_cache: Optional[dict] = None
+
+
+def _list_directory_sorted(
+    service: str, bucket: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> List[Tuple[str, int]]:
+    """List a directory sorted by name (deterministic file selection)."""
+    if suffixes:
+        files = list(list_directory(service, bucket, prefix, suffixes))
+    else:
+        files = list(list_directory(service, bucket, prefix))
+    files.sort(key=itemgetter(0))
+    return files
+
+
+def _list_directory_cached(
+    service: str, bucket: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> List[Tuple[str, int]]:
+    """List a directory sorted by name, reusing this invocation's listing if any.
+
+    Sorting happens once here, so the filters downstream (which keep order)
+    never re-sort a listing that may hold 100k+ objects. A suffix-filtered
+    request is answered from the full listing when one is already cached.
+    """
+    if _listing_cache is None:
+        return _list_directory_sorted(service, bucket, prefix, suffixes)
+    full_key = (service, bucket, prefix, None)
+    if suffixes and full_key in _listing_cache:
+        return [f for f in _listing_cache[full_key] if f[0].lower().endswith(suffixes)]
+    key = (service, bucket, prefix, suffixes or None)
+    if key not in _listing_cache:
+        _listing_cache[key] = _list_directory_sorted(service, bucket, prefix, suffixes)
+    return _listing_cache[key]
+
+
+def _list_non_empty_files(
+    service: str, bucket: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> List[Tuple[str, int]]:
     """List a directory and return its non-empty files, sorted by name.
 
+    With ``suffixes``, only matching files are listed; if none of them is
+    non-empty the full listing is used instead, so callers can still warn
+    and fall back to whatever the directory holds.
+
     Raises:
         ValueError: If the directory has no files (or only empty ones).
     """
-    files = list_directory(service, bucket, prefix)
+    files = _list_directory_cached(service, bucket, prefix, suffixes)
+    if suffixes and not any(size > 0 for _name, size in files):
+        files = _list_directory_cached(service, bucket, prefix)
     if not files:
         raise ValueError(f"No files found in {service}://{bucket}/{prefix}")
 
     non_empty_files = [f for f in files if f[1] > 0]
     if not non_empty_files:
         raise ValueError(f"No non-empty files found in {service}://{bucket}/{prefix}")
-
-    non_empty_files.sort(key=lambda x: x[0])
     return non_empty_files
 
 
@@ -113,7 +214,7 @@ def _drop_metadata_files(files: List[Tuple[str, int]]) -> Tuple[List[Tuple[str,
         (files, only_metadata) where only_metadata is True if dropping would
         empty the list, in which case the original list is returned unchanged.
     """
-    non_metadata = [f for f in files if not any(re.search(p, f[0]) for p in SKIP_PATTERNS)]
+    non_metadata = [f for f in files if not _is_metadata_file(f[0])]
     if non_metadata:
         return non_metadata, False
     return files, True
@@ -131,22 +232,49 @@ def _filter_by_format(
     """
     if not input_format:
         return files, True
-    format_regex = FORMAT_EXTENSION_MAP.get(input_format)
-    if not format_regex:
+    suffixes = _FORMAT_SUFFIXES.get(input_format)
+    if not suffixes:
         return files, True
-    matching = [f for f in files if re.search(format_regex, f[0], re.IGNORECASE)]
+    matching = [f for f in files if f[0].lower().endswith(suffixes)]
     if matching:
         return matching, True
     return files, False
 
 
+def _select_up_to_size(files, max_size_bytes: int) -> Tuple[List[Tuple[str, int]], int]:
+    """Take files in order until the next one would exceed max_size_bytes.
+
+    The first file is always taken, even if it alone exceeds the limit.
+    ``files`` may be a lazy listing; it is consumed only as far as needed.
+
+    Returns:
+        (selected_files, total_size).
+    """
+    selected_files = []
+    total_size = 0
+    for file_name, file_size in files:
+        if selected_files and total_size + file_size > max_size_bytes:
+            break
+        selected_files.append((file_name, file_size))
+        total_size += file_size
+    return selected_files, total_size
+
+
+def _is_listing_cached(service: str, bucket: str, prefix: str) -> bool:
+    """True if this invocation already holds a listing of the prefix."""
+    return _listing_cache is not None and any(
+        key[:3] == (service, bucket, prefix) for key in _listing_cache
+    )
+
+
 def get_files_for_multiread(
     service: str,
     bucket: str,
     prefix: str,
     input_format: Optional[str] = None,
     max_size_mb: int = 25,
-    quiet: bool = False
+    quiet: bool = False,
+    stop_listing_early: bool = False
 ) -> List[Tuple[str, int]]:
     """Get a list of files to read up to max_size_mb.
 
@@ -157,6 +285,10 @@ def get_files_for_multiread(
         input_format: Optional format filter.
         max_size_mb: Maximum total size in MB.
         quiet: If True, suppress progress messages.
+        stop_listing_early: With an input_format on a name-ordered service
+            (S3, GCS), stop paging through the listing once max_size_mb is
+            selected. The partial listing is not cached, so leave this off
+            when the full listing is needed afterwards (e.g. --count).
 
     Returns:
         List of (filename, size) tuples.
@@ -164,7 +296,26 @@ def get_files_for_multiread(
     Raises:
         ValueError: If no suitable files are found.
     """
-    non_empty_files = _list_non_empty_files(service, bucket, prefix)
+    max_size_bytes = max_size_mb * 1024 * 1024
+    suffixes = _FORMAT_SUFFIXES.get(input_format) if input_format else None
+
+    if stop_listing_early and suffixes and not _is_listing_cached(service, bucket, prefix):
+        listing = iter_directory(service, bucket, prefix, suffixes)
+        if listing is not None:
+            # Same selection as below whenever at least one matching data
+            # file exists; otherwise fall through for the full listing and
+            # its fallbacks and warnings.
+            candidates = (
+                f for f in listing if f[1] > 0 and not _is_metadata_file(f[0])
+            )
+            selected_files, total_size = _select_up_to_size(candidates, max_size_bytes)
+            if selected_files:
+                if not quiet:
+                    total_mb = total_size / (1024 * 1024)
+                    info(Fore.BLUE + f"Reading {len(selected_files)} files totaling {total_mb:.2f} MB" + Style.RESET_ALL)
+                return selected_files
+
+    non_empty_files = _list_non_empty_files(service, bucket, prefix, suffixes)
 
     filtered_files, only_metadata = _drop_metadata_files(non_empty_files)
     if only_metadata:
@@ -175,21 +326,8 @@ def get_files_for_multiread(
         info(Fore.YELLOW + f"No files matching format '{input_format}' found in "
              f"{service}://{bucket}/{prefix}. Using all available files." + Style.RESET_ALL)
 
-    # Sort by name for deterministic behavior
-    filtered_files.sort(key=lambda x: x[0])
-
-    # Select files up to max_size_mb
-    max_size_bytes = max_size_mb * 1024 * 1024
-    selected_files = []
-    total_size = 0
-
-    for file_name, file_size in filtered_files:
-        # Always include at least the first file even if it exceeds the limit
-        if selected_files and total_size + file_size > max_size_bytes:
-            break
-
-        selected_files.append((file_name, file_size))
-        total_size += file_size
+    # Select files up to max_size_mb (the listing is already sorted by name)
+    selected_files, total_size = _select_up_to_size(filtered_files, max_size_bytes)
 
     if not selected_files:
         raise ValueError(f"No suitable files found in {service}://{bucket}/{prefix}")
@@ -219,6 +357,8 @@ def _find_nested_tables(files: List[Tuple[str, int]]) -> dict:
             if root:  # empty means the listing prefix IS the table root
                 tables.setdefault(root, 'delta')
             continue
+        if not name.endswith('.metadata.json'):
+            continue  # cheap suffix check before the (backtracking) regex
         match = _ICEBERG_NESTED_RE.match(name)
         if match and match.group(1):
             tables.setdefault(match.group(1), 'iceberg')
@@ -227,8 +367,7 @@ def _find_nested_tables(files: List[Tuple[str, int]]) -> dict:
 
 def _has_known_extension(name: str) -> bool:
     """True if the filename matches any recognized data-format extension."""
-    return any(re.search(regex, name, re.IGNORECASE)
-               for regex in FORMAT_EXTENSION_MAP.values())
+    return name.lower().endswith(_ANY_FORMAT_SUFFIXES)
 
 
 def find_first_non_empty_file(
@@ -253,7 +392,9 @@ def find_first_non_empty_file(
     Raises:
         ValueError: If no suitable files are found.
     """
-    non_empty_files = _list_non_empty_files(service, bucket, prefix)
+    non_empty_files = _list_non_empty_files(
+        service, bucket, prefix, _FORMAT_SUFFIXES.get(input_format) if input_format else None
+    )
 
     # Filter by input format if specified
     if input_format:
@@ -285,7 +426,7 @@ def find_first_non_empty_file(
             )
 
         for file_name, file_size in non_empty_files:
-            if any(re.search(pattern, file_name) for pattern in SKIP_PATTERNS):
+            if _is_metadata_file(file_name):
                 continue
             if not _has_known_extension(file_name):
                 continue  # e.g. catalog.db, .lock — can't infer a format from it
@@ -303,7 +444,7 @@ def find_first_non_empty_file(
 
     # Explicit format requested but unmatched: first non-metadata file.
     for file_name, file_size in non_empty_files:
-        if not any(re.search(pattern, file_name) for pattern in SKIP_PATTERNS):
+        if not _is_metadata_file(file_name):
             if not quiet:
                 info(Fore.BLUE + f"Selected file: {file_name} ({file_size} bytes)" + Style.RESET_ALL)
             return file_name, file_size
@@ -327,24 +468,72 @@ def detect_format_from_path(path: str) -> str:
     Raises:
         ValueError: If format cannot be determined.
     """
-    # Strip compression extension first to get actual file format
-    base_path = strip_compression_extension(path)
-    path_lower = base_path.lower()
-
-    if path_lower.endswith('.json') or path_lower.endswith('.jsonl') or path_lower.endswith('.ndjson'):
-        return 'json'
-    elif path_lower.endswith('.csv'):
-        return 'csv'
-    elif path_lower.endswith('.parquet'):
-        return 'parquet'
-    elif path_lower.endswith('.avro'):
-        return 'avro'
-    elif path_lower.endswith('.orc'):
-        return 'orc'
-    elif path_lower.endswith('.txt') or path_lower.endswith('.log'):
-        return 'text'
-    else:
+    # The format comes from the extension left after stripping compression
+    input_format = classify_path(path)[0]
+    if input_format is None:
         raise ValueError(f"Could not infer format from path: {path}. Please specify --input-format.")
+    return input_format
+
+
+# Concurrent downloads in the multi-file read path.
+_MULTIREAD_WORKERS = MULTIREAD_WORKERS
+
+
+def _merge_dtypes(left, right):
+    """Common dtype for a column whose type differs between files.
+
+    Numeric types promote the way pandas.concat does (int64 + float64 ->
+    float64); any other mismatch becomes object.
+    """
+    from pandas.api.types import is_bool_dtype, is_numeric_dtype
+    import numpy as np
+
+    if all(is_numeric_dtype(d) and not is_bool_dtype(d) for d in (left, right)):
+        try:
+            return np.promote_types(left, right)
+        except TypeError:
+            pass  # extension dtypes (e.g. Int64) have no numpy promotion
+    return 'object'
+
+
+def _slice_rows(part, start: int, stop: Optional[int] = None):
+    """Rows [start, stop) of a per-file result (DataFrame or Arrow table)."""
+    if hasattr(part, 'iloc'):
+        return part.iloc[start:stop]
+    return part.slice(start, None if stop is None else stop - start)
+
+
+def _concat_parts(parts: list) -> pd.DataFrame:
+    """Concatenate per-file results into one DataFrame.
+
+    Arrow tables are concatenated without copying their buffers and
+    converted to pandas once. Frames, a mix of both, or tables whose schemas
+    differ beyond missing columns go through pandas.concat and its usual
+    type promotion instead.
+    """
+    import pandas as pd
+
+    if not any(hasattr(part, 'iloc') for part in parts):
+        import pyarrow as pa
+        # ArrowTypeError subclasses TypeError, so it must be caught first.
+        try:
+            table = pa.concat_tables(parts, promote_options='default')
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            table = None
+        except TypeError:  # pyarrow < 14 has no promote_options
+            try:
+                table = pa.concat_tables(parts, promote=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                table = None
+        if table is not None:
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    frames = [part if hasattr(part, 'iloc') else part.to_pandas() for part in parts]
+    # A single frame (the usual row-limited preview, satisfied by the first
+    # file) needs no concat copy at all.
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+    return pd.concat(frames, ignore_index=True)
 
 
 def read_data_from_multiple_files(
@@ -376,13 +565,114 @@ def read_data_from_multiple_files(
     """
     import pandas as pd
 
+    from concurrent.futures import ThreadPoolExecutor
+
     dfs = []
     schemas = []
     rows_read = 0
     rows_skipped = 0
     total_rows = 0
 
-    def process_file(file_info, remaining_to_skip, remaining_to_read, file_index, total_files):
+    # Row-limited previews of row formats keep the body lazy: the chunked
+    # readers stop pulling bytes (and decompressing) once they have enough
+    # rows, so a 10-row preview never transfers whole objects.
+    stream_lazily = num_rows > 0 and input_format not in ('parquet', 'orc')
+
+    # Row-limited previews of columnar files are read in place through a
+    # native PyArrow filesystem: only the footer and the row groups/stripes
+    # covering the needed rows are fetched, and once the first file covers
+    # the preview the remaining files are never opened.
+    native_fs = None
+    if num_rows > 0 and input_format in ('parquet', 'orc'):
+        from .streaming import get_pyarrow_filesystem, supports_pyarrow_fs
+        if supports_pyarrow_fs():
+            try:
+                native_fs, _ = get_pyarrow_filesystem(
+                    service,
+                    aws_profile=cloud_config.aws_profile,
+                    gcp_project=cloud_config.gcp_project,
+                    gcp_credentials=cloud_config.gcp_credentials,
+                    azure_account=cloud_config.azure_account,
+                    azure_access_key=cloud_config.azure_access_key
+                )
+            except Exception:
+                native_fs = None  # download whole files instead
+
+    def read_native(file_name, rows):
+        """Read one uncompressed Parquet/ORC file via the native filesystem."""
+        from .readers import read_parquet_data_streaming, read_orc_data_streaming
+        read = read_parquet_data_streaming if input_format == 'parquet' else read_orc_data_streaming
+        pyarrow_path = f"{bucket}/{file_name}" if bucket else file_name
+        df, schema, _ = read(num_rows=rows, columns=columns, pyarrow_fs=native_fs, pyarrow_path=pyarrow_path)
+        return df, schema
+
+    def native_row_count(file_name):
+        """Row count and full dtypes of a Parquet/ORC file, from its footer only."""
+        from .readers.schema import arrow_schema_to_pandas_dtypes
+        pyarrow_path = f"{bucket}/{file_name}" if bucket else file_name
+        if input_format == 'parquet':
+            import pyarrow.parquet as pq
+            parquet_file = pq.ParquetFile(pyarrow_path, filesystem=native_fs)
+            return parquet_file.metadata.num_rows, arrow_schema_to_pandas_dtypes(parquet_file.schema_arrow)
+        import pyarrow.orc as orc
+        with native_fs.open_input_file(pyarrow_path) as f:
+            orc_file = orc.ORCFile(f)
+            return orc_file.nrows, arrow_schema_to_pandas_dtypes(orc_file.schema)
+
+    def download_file(file_name, compression):
+        """Open (or download) and decompress one file."""
+        stream = get_stream(service, bucket, file_name)
+        if stream_lazily:
+            if compression and supports_streaming_decompression(compression):
+                stream, _ = get_streaming_decompressor(stream, compression)
+            elif compression:
+                stream = decompress_stream(stream, compression)
+            return stream, compression
+        if service != 'local' and not isinstance(stream, (io.BytesIO, io.StringIO)):
+            # Drain lazy network bodies (e.g. an S3 StreamingBody) here so the
+            # transfer itself overlaps with the other files' downloads.
+            stream = io.BytesIO(stream.read())
+        if compression:
+            stream = decompress_stream(stream, compression)
+        return stream, compression
+
+    # Resolved once for every file; an unsupported format fails here,
+    # before any file is downloaded.
+    reader = _get_reader(input_format, delimiter)
+    if reader is None:
+        raise ValueError(f"Unsupported format: {input_format}")
+
+    # Downloaded Parquet/ORC files are also decoded on the workers: Arrow
+    # releases the GIL while decoding, so those parses truly overlap (the
+    # row-format parsers mostly hold it and stay on the main thread). Which
+    # rows are kept depends on the files before, so a worker decodes the
+    # most any file can contribute (offset + limit) and the main thread
+    # trims in order.
+    # These decode to Arrow tables, which are concatenated and converted to
+    # pandas once at the end.
+    parse_ahead = input_format in ('parquet', 'orc')
+    parse_ahead_rows = offset + num_rows if num_rows > 0 else 0
+    table_reader = None
+    if parse_ahead:
+        from . import readers
+        table_reader = getattr(readers, f'read_{input_format}_table')
+
+    def fetch_file(file_name):
+        """Open (or download) and decompress one file; runs on a worker thread.
+
+        Returns (stream, compression, parsed) where parsed is (table, schema)
+        for files decoded ahead, else None. stream is None for files
+        read_native() will read in place.
+        """
+        compression = detect_compression(file_name)
+        if native_fs is not None and compression is None:
+            return None, None, None
+        stream, compression = download_file(file_name, compression)
+        if parse_ahead:
+            return None, compression, table_reader(stream, parse_ahead_rows, columns)
+        return stream, compression, None
+
+    def process_file(file_info, fetched, remaining_to_skip, remaining_to_read, file_index, total_files):
         file_name, file_size = file_info
         if not quiet:
             info(Fore.BLUE + f"Reading file: {file_name} ({file_size/1024:.1f} KB)" + Style.RESET_ALL)
@@ -391,14 +681,12 @@ def read_data_from_multiple_files(
             short_name = file_name.split('/')[-1]
             update_progress(f"Reading file {file_index + 1}/{total_files}: {short_name}")
 
-        stream = get_stream(service, bucket, file_name)
-
-        # Check for compression and decompress if needed
-        compression = detect_compression(file_name)
-        if compression:
-            if not quiet:
-                info(Fore.BLUE + f"Detected {compression} compression, decompressing..." + Style.RESET_ALL)
-            stream = decompress_stream(stream, compression)
+        stream, compression, parsed = fetched.result()
+        if compression and not quiet:
+            info(Fore.BLUE + f"Detected {compression} compression, decompressing..." + Style.RESET_ALL)
+        if parsed is not None:
+            df, schema = parsed
+            return df, schema, len(df)
 
         # Calculate how many rows to read from this file. When num_rows == 0
         # (read all), remaining_to_read is 0, which the readers treat as "all".
@@ -408,52 +696,89 @@ def read_data_from_multiple_files(
         else:
             rows_to_read_from_file = 0  # read all rows from this file
 
-        reader = _get_reader(input_format)
-        if reader is None:
-            raise ValueError(f"Unsupported format: {input_format}")
-        df, schema = reader(stream, rows_to_read_from_file, columns, delimiter)
+        if stream is None:
+            try:
+                if remaining_to_skip > 0:
+                    # A file the offset skips entirely is never read: its
+                    # footer row count is enough to move past it.
+                    file_rows, schema = native_row_count(file_name)
+                    if file_rows <= remaining_to_skip:
+                        return pd.DataFrame(), schema, file_rows
+                df, schema = read_native(file_name, rows_to_read_from_file)
+                return df, schema, len(df)
+            except Exception as e:
+                if not quiet:
+                    info(Fore.YELLOW + f"Native filesystem unavailable, using stream: {str(e)}" + Style.RESET_ALL)
+                stream, _ = download_file(file_name, None)
+
+        df, schema = reader(stream, rows_to_read_from_file, columns)
 
         return df, schema, len(df)
 
-    # Process files in order until we have enough rows
+    # Process files in order until we have enough rows. Downloads (and
+    # columnar decoding) run ahead on a small thread pool (object-store
+    # reads are latency-bound), but results are consumed strictly in listing
+    # order so the offset/limit accounting below is unchanged. At most
+    # _MULTIREAD_WORKERS files are in flight beyond the one being consumed,
+    # bounding wasted work once the row limit is reached.
     remaining_offset = offset
     remaining_rows = num_rows if num_rows > 0 else 0  # 0 == read all
     total_files = len(file_list)
     failures = []
 
-    for file_index, file_info in enumerate(file_list):
-        try:
-            df, schema, file_rows = process_file(
-                file_info, remaining_offset, remaining_rows, file_index, total_files
-            )
-
-            if not df.empty:
-                total_rows += len(df)
-
-                # Handle offset: skip rows from the beginning
-                if remaining_offset > 0:
-                    if remaining_offset >= len(df):
-                        # Skip entire file
-                        remaining_offset -= len(df)
-                        rows_skipped += len(df)
-                        schemas.append(schema)  # Still track schema
-                        continue
-                    else:
-                        # Skip partial rows from this file
-                        df = df.iloc[remaining_offset:]
-                        rows_skipped += remaining_offset
-                        remaining_offset = 0
-
-                dfs.append(df)
-                schemas.append(schema)
-                rows_read += len(df)
+    pool = ThreadPoolExecutor(max_workers=max(1, min(_MULTIREAD_WORKERS, total_files)))
+    fetches = {}
+    next_fetch = 0
+    try:
+        for file_index, file_info in enumerate(file_list):
+            while next_fetch < total_files and next_fetch <= file_index + _MULTIREAD_WORKERS:
+                fetches[next_fetch] = pool.submit(fetch_file, file_list[next_fetch][0])
+                next_fetch += 1
+            fetched = fetches.pop(file_index)
+            try:
+                df, schema, file_rows = process_file(
+                    file_info, fetched, remaining_offset, remaining_rows, file_index, total_files
+                )
 
-                # Stop if we've read enough rows
-                if num_rows > 0 and rows_read >= num_rows:
-                    break
-        except Exception as e:
-            failures.append((file_info[0], e))
-            info(Fore.YELLOW + f"Warning: Error reading file {file_info[0]}: {str(e)}" + Style.RESET_ALL)
+                # file_rows is len(df), except for a file skipped by its
+                # metadata row count alone, whose rows were never read.
+                if file_rows:
+                    total_rows += file_rows
+
+                    # Handle offset: skip rows from the beginning
+                    if remaining_offset > 0:
+                        if remaining_offset >= file_rows:
+                            # Skip entire file
+                            remaining_offset -= file_rows
+                            rows_skipped += file_rows
+                            schemas.append(schema)  # Still track schema
+                            continue
+                        else:
+                            # Skip partial rows from this file
+                            df = _slice_rows(df, remaining_offset)
+                            rows_skipped += remaining_offset
+                            remaining_offset = 0
+
+                    # Keep only the rows still needed, so the final concat
+                    # copies at most num_rows rows rather than every row read.
+                    if num_rows > 0 and rows_read + len(df) > num_rows:
+                        df = _slice_rows(df, 0, num_rows - rows_read)
+
+                    dfs.append(df)
+                    schemas.append(schema)
+                    rows_read += len(df)
+
+                    # Stop if we've read enough rows
+                    if num_rows > 0 and rows_read >= num_rows:
+                        break
+            except Exception as e:
+                failures.append((file_info[0], e))
+                info(Fore.YELLOW + f"Warning: Error reading file {file_info[0]}: {str(e)}" + Style.RESET_ALL)
+    finally:
+        # Drop downloads that are no longer needed once the limit is reached.
+        for pending in fetches.values():
+            pending.cancel()
+        pool.shutdown(wait=True)
 
     if not dfs:
         if rows_skipped > 0:
@@ -468,26 +793,27 @@ def read_data_from_multiple_files(
             ) from first_exc
         raise ValueError("No data could be read from any of the files")
 
-    # Concatenate the dataframes
-    result_df = pd.concat(dfs, ignore_index=True)
+    result_df = _concat_parts(dfs)
 
-    # For the full schema, merge all schemas
+    # For the full schema, merge all schemas. Files of one dataset nearly
+    # always share a schema, so only distinct schemas are walked. The key is
+    # built from tolist() (one C-level conversion each for names and dtypes)
+    # rather than Series.items(), which boxes every entry on the way.
     all_columns = {}
+    seen_schemas = set()
     for schema in schemas:
-        for col, dtype in schema.items():
-            if col in all_columns:
-                # If the same column has different types, use object type
-                if all_columns[col] != dtype:
-                    all_columns[col] = 'object'
-            else:
+        key = (tuple(schema.index.tolist()), tuple(schema.tolist()))
+        if key in seen_schemas:
+            continue
+        seen_schemas.add(key)
+        for col, dtype in zip(*key):
+            if col not in all_columns:
                 all_columns[col] = dtype
+            elif all_columns[col] != dtype:
+                all_columns[col] = _merge_dtypes(all_columns[col], dtype)
 
     full_schema = pd.Series(all_columns)
 
-    # If we read more rows than requested, truncate the result
-    if num_rows > 0 and len(result_df) > num_rows:
-        result_df = result_df.iloc[:num_rows]
-
     return result_df, full_schema, total_rows
 
 
@@ -526,16 +852,13 @@ def read_data_streaming(
     Returns:
         Tuple of (DataFrame, schema, StreamingStats).
     """
-    from .readers import (
-        read_csv_data_streaming,
-        read_json_data_streaming,
-        read_parquet_data_streaming,
-        read_avro_data_streaming,
-        read_orc_data_streaming,
-        read_text_data_streaming,
-    )
+    from .readers import read_parquet_data_streaming, read_orc_data_streaming
     from .streaming import StreamingStats, get_pyarrow_filesystem, supports_pyarrow_fs
 
+    reader = _get_reader(input_format, delimiter, streaming=True)
+    if reader is None:
+        raise ValueError(f"Unsupported format: {input_format}")
+
     # Get file size for stats
     try:
         file_size = get_file_size(service, bucket, object_path)
@@ -552,10 +875,14 @@ def read_data_streaming(
     # Calculate how many rows to read including offset
     rows_to_read = (offset + num_rows) if num_rows > 0 else 0
 
-    # For columnar formats without external compression, try native PyArrow filesystem
+    # For columnar formats without external compression, try native PyArrow
+    # filesystem. Without it, a preview is still read through ranged GETs:
+    # only the footer and the row groups/stripes the reader needs are fetched.
     use_native_fs = input_format in ('parquet', 'orc') and compression is None
+    ranged_preview = use_native_fs and (num_rows > 0 or bool(columns))
     if use_native_fs and not supports_pyarrow_fs():
-        info(Fore.YELLOW + "Note: pyarrow.fs not available, downloading full file instead of streaming" + Style.RESET_ALL)
+        if not ranged_preview:
+            info(Fore.YELLOW + "Note: pyarrow.fs not available, downloading full file instead of streaming" + Style.RESET_ALL)
         use_native_fs = False
 
     if use_native_fs:
@@ -605,7 +932,12 @@ def read_data_streaming(
             info(Fore.YELLOW + f"Native filesystem unavailable, using stream: {str(e)}" + Style.RESET_ALL)
 
     # Get stream for non-native filesystem approach
-    stream = get_stream(service, bucket, object_path)
+    ranged = _open_ranged(service, bucket, object_path, file_size) if ranged_preview else None
+    if ranged is not None:
+        import pyarrow as pa
+        stream = pa.PythonFile(ranged, mode='r')
+    else:
+        stream = _open_object(service, bucket, object_path, file_size)
 
     # Handle compression with streaming decompression where possible
     if compression:
@@ -618,33 +950,443 @@ def read_data_streaming(
             stream = decompress_stream(stream, compression)
             stats.is_streaming = False
 
+    # Skip offset rows of row formats by scanning for newlines, so they are
+    # never parsed; any rows that could not be skipped that way are dropped
+    # after the read as before.
+    skipped = skipped_bytes = 0
+    if offset > 0 and not where and (
+        input_format in ('csv', 'json') or (input_format == 'text' and num_rows > 0)
+    ):
+        stream, skipped, skipped_bytes = _skip_leading_rows(stream, input_format, offset)
+        if num_rows > 0:
+            rows_to_read -= skipped
+
     # Read based on format using streaming readers
-    if input_format == 'csv':
-        df, schema, stats = read_csv_data_streaming(stream, rows_to_read, columns, delimiter, stats, where=where)
-    elif input_format == 'json':
-        df, schema, stats = read_json_data_streaming(stream, rows_to_read, columns, stats, where=where)
-    elif input_format == 'parquet':
-        df, schema, stats = read_parquet_data_streaming(stream=stream, num_rows=rows_to_read, columns=columns, stats=stats, where=where)
-    elif input_format == 'avro':
-        df, schema, stats = read_avro_data_streaming(stream, rows_to_read, columns, stats, where=where)
-    elif input_format == 'orc':
-        df, schema, stats = read_orc_data_streaming(stream=stream, num_rows=rows_to_read, columns=columns, stats=stats, where=where)
-    elif input_format == 'text':
-        df, schema, stats = read_text_data_streaming(stream, rows_to_read, columns, stats, where=where)
-    else:
-        raise ValueError(f"Unsupported format: {input_format}")
+    df, schema, stats = reader(stream=stream, num_rows=rows_to_read, columns=columns, stats=stats, where=where)
+    if ranged is not None:
+        stats.bytes_read = ranged.bytes_fetched
+        stats.is_streaming = True
+    stats.bytes_read += skipped_bytes
+    if skipped and 'line_number' in df.columns:
+        df['line_number'] += skipped
 
     # Apply offset - skip first N rows
-    if offset > 0 and not df.empty:
-        if offset >= len(df):
-            info(Fore.YELLOW + f"Warning: Offset ({offset}) >= total rows read ({len(df)}). No data to display." + Style.RESET_ALL)
+    total_rows = skipped + len(df)
+    if offset > 0 and total_rows:
+        if offset >= total_rows:
+            info(Fore.YELLOW + f"Warning: Offset ({offset}) >= total rows read ({total_rows}). No data to display." + Style.RESET_ALL)
             df = df.iloc[0:0]
-        else:
-            df = df.iloc[offset:].reset_index(drop=True)
+        elif offset > skipped:
+            df = df.iloc[offset - skipped:].reset_index(drop=True)
 
     return df, schema, stats
 
 
+def _count_from_complete_read(df: pd.DataFrame, num_rows: int, offset: int, where: Optional[str]) -> Optional[int]:
+    """Return a file's record count when the preview read already covered it.
+
+    Readers stop after ``offset + num_rows`` rows, so getting fewer back (or
+    reading without a limit) means they reached end of file and a second,
+    full-file counting pass would only repeat the work.
+
+    Returns:
+        The record count, or None if it is not known from the read (a WHERE
+        filter dropped rows, the limit was hit, or the offset swallowed every
+        row).
+    """
+    if where:
+        return None
+    if num_rows > 0 and len(df) >= num_rows:
+        return None
+    if offset > 0 and df.empty:
+        return None
+    return offset + len(df)
+
+
+# Per-invocation download sharing. Cloud objects up to this size are
+# downloaded whole when a record count of them follows the preview (--count),
+# so the count reuses the bytes instead of fetching the object a second time.
+# Keyed by (service, bucket, path); None marks an object whose next download
+# should be kept. main() clears it on exit.
+_SHARED_DOWNLOAD_MAX_BYTES = 64 * 1024 * 1024
+_shared_downloads = {}
+
+
+def _share_download(service: str, bucket: str, object_path: str) -> None:
+    """Keep the next download of an object for the record count that follows."""
+    _shared_downloads.setdefault((service, bucket, object_path), None)
+
+
+def _open_object(service: str, bucket: str, object_path: str, size: int = 0):
+    """Open an object, served from a shared download when one is kept.
+
+    Args:
+        service: Cloud service identifier.
+        bucket: Bucket or container name.
+        object_path: Object path.
+        size: Object size, if known; objects marked by _share_download() and
+            no larger than _SHARED_DOWNLOAD_MAX_BYTES are downloaded whole
+            and kept.
+
+    Returns:
+        Binary stream over the (still compressed) object.
+    """
+    key = (service, bucket, object_path)
+    data = _shared_downloads.get(key)
+    if data is not None:
+        return io.BytesIO(data)
+    stream = get_stream(service, bucket, object_path)
+    if key in _shared_downloads and service != 'local' and 0 < size <= _SHARED_DOWNLOAD_MAX_BYTES:
+        data = stream.read()
+        _shared_downloads[key] = data
+        return io.BytesIO(data)
+    return stream
+
+
+def _as_seekable(stream):
+    """Return a seekable file object for columnar readers that jump to the footer.
+
+    Local files and decompressed buffers already are; network bodies are
+    read into memory (no temp-file round trip through the local disk).
+    """
+    if getattr(stream, 'seekable', lambda: False)():
+        return stream
+    return io.BytesIO(stream.read())
+
+
+# Parquet ends with <footer><4-byte little-endian footer length>PAR1. The
+# first range GET takes this much of the tail, which holds the whole footer
+# for all but very wide or very many-row-group files.
+_PARQUET_TAIL_BYTES = 64 * 1024
+
+
+def _parquet_footer_file(service: str, bucket: str, object_path: str):
+    """Open a Parquet file's footer alone, fetched via range requests.
+
+    Transfers only the footer (usually one ~64 KB GET) instead of the file.
+    The returned ParquetFile answers metadata and schema questions; it
+    cannot read rows.
+
+    Raises:
+        ValueError: If the object does not end with a Parquet footer.
+    """
+    import pyarrow.parquet as pq
+
+    size = get_file_size(service, bucket, object_path)
+    if size < 12:
+        raise ValueError("file too small to be Parquet")
+    tail = get_range(service, bucket, object_path, max(0, size - _PARQUET_TAIL_BYTES), size)
+    if tail[-4:] != b'PAR1':
+        raise ValueError("not a Parquet file (missing PAR1 footer magic)")
+    footer_len = int.from_bytes(tail[-8:-4], 'little')
+    if footer_len + 8 > len(tail):
+        tail = get_range(service, bucket, object_path, size - footer_len - 8, size)
+    return pq.ParquetFile(io.BytesIO(tail))
+
+
+def _parquet_footer_row_count(service: str, bucket: str, object_path: str) -> int:
+    """Read a Parquet row count from the file footer via range requests."""
+    return _parquet_footer_file(service, bucket, object_path).metadata.num_rows
+
+
+class _RangeFile(io.RawIOBase):
+    """Seekable read-only view of an object that fetches byte ranges on demand.
+
+    Each read is one get_range() call, so a reader that only seeks to the
+    end of a file (an ORC tail) transfers just the bytes it reads;
+    ``bytes_fetched`` totals them.
+    """
+
+    def __init__(self, service: str, bucket: str, object_path: str, size: int):
+        super().__init__()
+        self._location = (service, bucket, object_path)
+        self._size = size
+        self._pos = 0
+        self.bytes_fetched = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        end = min(self._pos + len(buffer), self._size)
+        if end <= self._pos:
+            return 0
+        data = get_range(*self._location, self._pos, end)
+        buffer[:len(data)] = data
+        self._pos += len(data)
+        self.bytes_fetched += len(data)
+        return len(data)
+
+
+def _open_ranged(service: str, bucket: str, object_path: str, size: int) -> Optional[_RangeFile]:
+    """Open a cloud object for random access over range reads.
+
+    Returns:
+        A _RangeFile, or None when a plain stream serves better: local
+        files, unknown sizes, objects already downloaded for sharing, or no
+        pyarrow to read through.
+    """
+    if service == 'local' or size <= 0:
+        return None
+    if _shared_downloads.get((service, bucket, object_path)) is not None:
+        return None
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    return _RangeFile(service, bucket, object_path, size)
+
+
+def _orc_tail_row_count(service: str, bucket: str, object_path: str) -> int:
+    """Read an ORC row count from the file tail via range requests.
+
+    The postscript and footer sit at the end of the file; pyarrow reads
+    them through _RangeFile, typically in one or two small GETs.
+    """
+    import pyarrow as pa
+    import pyarrow.orc as orc
+
+    size = get_file_size(service, bucket, object_path)
+    with pa.PythonFile(_RangeFile(service, bucket, object_path, size), mode='r') as f:
+        return orc.ORCFile(f).nrows
+
+
+def _read_footer_schema(service: str, bucket: str, object_path: str, input_format: str):
+    """Full schema of an uncompressed Parquet or ORC file, from its footer.
+
+    The readers take these schemas from the footer too, so --schema
+    schema_only can skip the preview read entirely: no row-group head
+    (Parquet) or whole stripe (ORC) is downloaded and decoded.
+
+    Returns:
+        Series mapping column name to pandas dtype, or None when the footer
+        cannot answer (other formats, compressed files, read errors); the
+        caller then reads the file as usual.
+    """
+    if input_format not in ('parquet', 'orc') or detect_compression(object_path):
+        return None
+    try:
+        from .readers.schema import arrow_schema_to_pandas_dtypes
+        if input_format == 'parquet':
+            arrow_schema = _parquet_footer_file(service, bucket, object_path).schema_arrow
+        else:
+            import pyarrow as pa
+            import pyarrow.orc as orc
+            size = get_file_size(service, bucket, object_path)
+            with pa.PythonFile(_RangeFile(service, bucket, object_path, size), mode='r') as f:
+                arrow_schema = orc.ORCFile(f).schema
+        return arrow_schema_to_pandas_dtypes(arrow_schema)
+    except Exception:
+        return None
+
+
+# Row counting reads raw bytes in chunks this large.
+_COUNT_CHUNK_BYTES = 1024 * 1024
+_BLANK_LINE_RE = re.compile(rb'^[ \t\r]*\n', re.M)
+
+
+def _count_lines(
+    stream, head: bytes = b'', stop: Optional[bytes] = None, skip_blank: bool = True
+) -> Optional[int]:
+    """Count lines by scanning raw byte chunks for newlines.
+
+    An unterminated last line is counted. Nothing is decoded or split into
+    line objects, so memory stays constant whatever the file size.
+
+    Args:
+        stream: Binary stream, positioned just after ``head``.
+        head: Bytes the caller already read from the stream.
+        stop: Byte whose presence makes newline counting unreliable (e.g. a
+            CSV quote); counting gives up as soon as it is seen.
+        skip_blank: Leave blank and whitespace-only lines out of the count.
+
+    Returns:
+        The line count, or None if ``stop`` was seen, the stream yields
+        text, or the data uses bare-CR line endings.
+    """
+    lines = 0
+    tail = b''
+    chunk = head
+    while True:
+        if not chunk:
+            chunk = stream.read(_COUNT_CHUNK_BYTES)
+            if not chunk:
+                break
+        if not isinstance(chunk, bytes) or (stop is not None and stop in chunk):
+            return None
+        # Count whole lines only; the partial last line carries over.
+        block = tail + chunk
+        chunk = b''
+        cut = block.rfind(b'\n') + 1
+        block, tail = block[:cut], block[cut:]
+        lines += block.count(b'\n')
+        if skip_blank and (block[:1] in (b'\n', b'\r', b' ', b'\t') or any(
+            p in block for p in (b'\n\n', b'\n\r', b'\n ', b'\n\t')
+        )):
+            lines -= len(_BLANK_LINE_RE.findall(block))
+    if tail.strip() if skip_blank else tail:
+        if lines == 0 and b'\r' in tail:
+            return None
+        lines += 1
+    return lines
+
+
+def _count_csv_rows_fast(stream) -> Optional[int]:
+    """Count CSV data rows without tokenizing.
+
+    Matches pandas' defaults: the first non-blank line is the header and
+    blank lines are not rows. Returns None when a quote character shows up
+    (a quoted field may contain newlines) so the caller can use a parser.
+    """
+    lines = _count_lines(stream, stop=b'"')
+    return None if lines is None else max(lines - 1, 0)
+
+
+def _count_json_records_fast(stream):
+    """Count JSON Lines records without parsing every line.
+
+    Only the first line is parsed, as a probe that the file really is JSON
+    Lines; the rest are counted as non-blank lines.
+
+    Returns:
+        Tuple of (count, head). count is None if the content is not JSON
+        Lines (a JSON array, a pretty-printed document, or a text stream);
+        head then holds everything read so far, minus any BOM, so the caller
+        can decide from it, or keep reading after it, without opening the
+        object again.
+    """
+    head = stream.read(_COUNT_CHUNK_BYTES)
+    if not isinstance(head, bytes):
+        return None, head
+    if head.startswith(b'\xef\xbb\xbf'):
+        head = head[3:]  # UTF-8 BOM
+    body = head.lstrip()
+    if not body.startswith(b'{'):
+        return None, head
+    while b'\n' not in body:
+        more = stream.read(_COUNT_CHUNK_BYTES)
+        if not more:
+            break
+        head += more
+        body += more
+    try:
+        json.loads(body.split(b'\n', 1)[0])
+    except ValueError:
+        return None, head
+    return _count_lines(stream, head=head), head
+
+
+def _skip_leading_rows(stream, input_format: str, count: int):
+    """Skip up to ``count`` rows of a CSV, JSON Lines or text stream unparsed.
+
+    Rows are skipped by counting newlines in raw byte chunks, as the record
+    counters do, so an offset costs a scan instead of a parse of every
+    skipped row. The CSV header is kept; blank lines are not rows except in
+    text files. Skipping stops early at the first chunk where newlines may
+    not delimit rows: a CSV quote (a quoted field may contain newlines),
+    bare-CR line endings, JSON that is not JSON Lines, or a text stream.
+
+    Args:
+        stream: Binary stream positioned at the start of the data.
+        input_format: 'csv', 'json' or 'text'.
+        count: Number of rows to skip.
+
+    Returns:
+        Tuple of (stream, rows_skipped, bytes_skipped). The stream replays
+        the header, if any, followed by everything after the skipped rows;
+        the caller drops the remaining ``count - rows_skipped`` rows itself.
+    """
+    from .streaming import PrefixedStream
+
+    skipped = 0
+    skipped_bytes = 0
+    header = b''
+    tail = b''
+    want_first = input_format in ('csv', 'json')
+    skip_blank = input_format != 'text'
+    while skipped < count or want_first:
+        chunk = stream.read(_COUNT_CHUNK_BYTES)
+        if not chunk:
+            break
+        if not isinstance(chunk, bytes):
+            return PrefixedStream(chunk, stream), 0, 0
+        block = tail + chunk
+        cut = block.rfind(b'\n') + 1
+        if (input_format == 'csv' and b'"' in chunk) or \
+                block.count(b'\r', 0, cut) != block.count(b'\r\n', 0, cut):
+            return PrefixedStream(header + block, stream), skipped, skipped_bytes
+        block, tail = block[:cut], block[cut:]
+
+        pos = 0
+        while want_first and pos < len(block):
+            end = block.index(b'\n', pos) + 1
+            if not _BLANK_LINE_RE.match(block, pos):
+                want_first = False
+                if input_format == 'csv':
+                    header, pos = block[pos:end], end
+                    break
+                try:
+                    record = json.loads(block[pos:end].decode('utf-8-sig'))
+                except ValueError:
+                    record = None
+                if not isinstance(record, dict):
+                    return PrefixedStream(block[pos:] + tail, stream), 0, skipped_bytes
+                break  # a JSON Lines record: skipped like any other below
+            skipped_bytes += end - pos
+            pos = end
+
+        rest = block[pos:]
+        rows = rest.count(b'\n')
+        if skip_blank:
+            rows -= len(_BLANK_LINE_RE.findall(rest))
+        if skipped + rows <= count:
+            skipped += rows
+            skipped_bytes += len(rest)
+            continue
+        # The last row to skip ends inside this block: find it line by line.
+        end = 0
+        while skipped < count:
+            next_end = rest.index(b'\n', end) + 1
+            if not (skip_blank and _BLANK_LINE_RE.match(rest, end)):
+                skipped += 1
+            end = next_end
+        skipped_bytes += end
+        tail = rest[end:] + tail
+        break
+
+    if skipped < count and not want_first and b'\r' not in tail and (
+        tail.strip() if skip_blank else tail
+    ):
+        skipped += 1  # unterminated last row
+        skipped_bytes += len(tail)
+        tail = b''
+    while skip_blank and skipped:
+        # Start the reader at a row, not at blank lines before it.
+        blank = _BLANK_LINE_RE.match(tail)
+        if blank:
+            skipped_bytes += blank.end()
+            tail = tail[blank.end():]
+        elif tail.strip() or b'\n' in tail:
+            break
+        else:
+            chunk = stream.read(_COUNT_CHUNK_BYTES)
+            if not chunk:
+                break
+            tail += chunk
+    return PrefixedStream(header + tail, stream), skipped, skipped_bytes
+
+
 def get_record_count(
     service: str,
     bucket: str,
@@ -668,7 +1410,7 @@ def get_record_count(
     """
     import pandas as pd
     from .readers import HAS_PARQUET, HAS_AVRO, HAS_ORC
-    from .streaming import get_pyarrow_filesystem, supports_pyarrow_fs
+    from .streaming import PrefixedStream, get_pyarrow_filesystem, supports_pyarrow_fs
     try:
         import pyarrow.parquet as pq
     except ImportError:
@@ -682,6 +1424,21 @@ def get_record_count(
     # Detect compression from file path
     compression = detect_compression(object_path)
 
+    def open_decompressed():
+        """Open the object for a sequential count.
+
+        Row formats are counted chunk by chunk, so streamable codecs are
+        decoded as the bytes arrive instead of into one in-memory buffer.
+        Columnar formats need to seek to their footer and get the buffer.
+        """
+        stream = _open_object(service, bucket, object_path)
+        if not compression:
+            return stream
+        if input_format not in ('parquet', 'orc') and supports_streaming_decompression(compression):
+            stream, _ = get_streaming_decompressor(stream, compression)
+            return stream
+        return decompress_stream(stream, compression)
+
     # Columnar formats keep the row count in their footer metadata. Over a
     # native PyArrow filesystem that is a few-KB range request — never
     # download the whole file just to read a number.
@@ -705,41 +1462,37 @@ def get_record_count(
         except Exception:
             pass  # fall back to the full-download path below
 
-    if input_format == 'parquet' and HAS_PARQUET:
-        # For Parquet, we can get count from metadata
-        stream = get_stream(service, bucket, object_path)
-        if compression:
-            stream = decompress_stream(stream, compression)
-
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_path = temp_file.name
-
+    # Without a native filesystem (or when it fails, e.g. credentials it
+    # cannot resolve), still read only the footer via our own range reads.
+    if input_format == 'parquet' and HAS_PARQUET and compression is None:
         try:
-            if hasattr(stream, 'read'):
-                with open(temp_path, 'wb') as f:
-                    f.write(stream.read())
-            else:
-                temp_path = stream
+            return _parquet_footer_row_count(service, bucket, object_path)
+        except Exception:
+            pass  # fall back to the full-download path below
+    if input_format == 'orc' and HAS_ORC and compression is None:
+        try:
+            return _orc_tail_row_count(service, bucket, object_path)
+        except Exception:
+            pass  # fall back to the full-download path below
 
-            parquet_file = pq.ParquetFile(temp_path)
-            return parquet_file.metadata.num_rows
-        finally:
-            import os
-            try:
-                if hasattr(stream, 'read'):
-                    os.unlink(temp_path)
-            except OSError:
-                pass  # Ignore cleanup errors
+    if input_format == 'parquet' and HAS_PARQUET:
+        # For Parquet, we can get count from metadata
+        stream = open_decompressed()
+        return pq.ParquetFile(_as_seekable(stream)).metadata.num_rows
     else:
         # For CSV and JSON, we need to count the rows
         if not quiet:
             info(Fore.YELLOW + "Counting records (this might take a while for large files)..." + Style.RESET_ALL)
 
-        stream = get_stream(service, bucket, object_path)
-        if compression:
-            stream = decompress_stream(stream, compression)
+        stream = open_decompressed()
 
         if input_format == 'csv':
+            count = _count_csv_rows_fast(stream)
+            if count is not None:
+                return count
+
+            # Quoted fields may span lines: re-open and let pandas parse.
+            stream = open_decompressed()
             chunk_count = 0
 
             # Add delimiter if specified
@@ -751,7 +1504,19 @@ def get_record_count(
                 chunk_count += len(chunk)
             return chunk_count
         elif input_format == 'json':
-            # Read content to detect format
+            count, head = _count_json_records_fast(stream)
+            if count is not None:
+                return count
+
+            if isinstance(head, bytes):
+                # Not JSON Lines. A document opening with '{' is a single
+                # (pretty-printed) object, so only an array needs the rest
+                # of the file -- which continues from the bytes already read.
+                if head.lstrip().startswith(b'{'):
+                    return 1
+                stream = PrefixedStream(head, stream)
+            else:
+                stream = open_decompressed()
             content = stream.read()
             if isinstance(content, bytes):
                 content = content.decode('utf-8', errors='replace')
@@ -763,21 +1528,15 @@ def get_record_count(
             if not content_stripped:
                 return 0
 
-            # Check if it's JSON Lines or regular JSON
             first_char = content_stripped[0]
             if first_char == '[':
                 # Regular JSON array
-                parsed = json.loads(content)
+                from .readers.json import load_json
+                parsed = load_json(content)
                 return len(parsed) if isinstance(parsed, list) else 1
             elif first_char == '{':
-                # Could be JSON Lines or single object
-                lines = [line.strip() for line in content_stripped.split('\n') if line.strip()]
-                if len(lines) > 1 and all(line.startswith('{') for line in lines[:min(5, len(lines))]):
-                    # JSON Lines - count lines
-                    return len(lines)
-                else:
-                    # Single JSON object
-                    return 1
+                # A single (pretty-printed) JSON object
+                return 1
             else:
                 # Try JSON Lines as fallback
                 content_stream = io.StringIO(content)
@@ -796,21 +1555,14 @@ def get_record_count(
             if not HAS_ORC:
                 return "Unknown (pyarrow ORC not installed)"
             import pyarrow.orc as orc
-            with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                temp_path = temp_file.name
-            try:
-                if hasattr(stream, 'read'):
-                    with open(temp_path, 'wb') as f:
-                        f.write(stream.read())
-                orc_file = orc.ORCFile(temp_path)
-                return orc_file.nrows
-            finally:
-                import os
-                try:
-                    os.unlink(temp_path)
-                except OSError:
-                    pass  # Ignore cleanup errors
+            return orc.ORCFile(_as_seekable(stream)).nrows
         elif input_format == 'text':
+            count = _count_lines(stream, skip_blank=False)
+            if count is not None:
+                return count
+
+            # Bare-CR line endings: re-open and split the decoded text.
+            stream = open_decompressed()
             content = stream.read()
             if isinstance(content, bytes):
                 content = content.decode('utf-8')
@@ -1014,18 +1766,53 @@ def _column_stats(df):
     return pd.DataFrame(rows)
 
 
-def _render_data(df, output_format: str) -> str:
-    """Render a DataFrame to the requested output format string."""
-    from .formatters import colorize_json, format_table_with_colored_header
+# Row-based output is rendered this many rows at a time.
+_RENDER_CHUNK_ROWS = 10_000
+
+
+def _iter_rendered(df, output_format: str):
+    """Render a DataFrame to the requested output format in pieces.
+
+    json, jsonp and csv output is produced a chunk of rows at a time so a
+    large preview is never held in memory a second time as one string; the
+    table format needs column widths from every row and is rendered whole.
+    """
+    from .formatters import colorize_json, format_table_with_colored_header, iter_colorized_json_array
+    chunks = (df.iloc[start:start + _RENDER_CHUNK_ROWS] for start in range(0, len(df), _RENDER_CHUNK_ROWS))
     if output_format == 'table':
-        return format_table_with_colored_header(df)
+        yield format_table_with_colored_header(df)
     elif output_format == 'jsonp':
-        return colorize_json(df.to_json(orient='records'))
+        if df.empty:
+            yield colorize_json(df.to_json(orient='records'))
+            return
+        from .readers.json import load_json
+        records = (record for chunk in chunks for record in load_json(chunk.to_json(orient='records')))
+        yield from iter_colorized_json_array(records)
     elif output_format == 'json':
-        return df.to_json(orient='records', lines=True)
+        for chunk in chunks:
+            yield chunk.to_json(orient='records', lines=True)
     elif output_format == 'csv':
-        return df.to_csv(index=False)
-    raise ValueError(f"Unsupported output format: {output_format}")
+        yield df.iloc[0:0].to_csv(index=False)
+        for chunk in chunks:
+            yield chunk.to_csv(index=False, header=False)
+    else:
+        raise ValueError(f"Unsupported output format: {output_format}")
+
+
+def _render_data(df, output_format: str) -> str:
+    """Render a DataFrame to the requested output format string."""
+    return ''.join(_iter_rendered(df, output_format))
+
+
+def _write_rendered(pieces, write) -> None:
+    """Pass rendered pieces to write(), ending the output with one newline."""
+    last = ''
+    for piece in pieces:
+        if piece:
+            write(piece)
+            last = piece
+    if not last.endswith('\n'):
+        write('\n')
 
 
 @click.command()
@@ -1143,6 +1930,8 @@ def main(path_arg, path_opt, output_format, output_file, input_format, columns,
 
     from .filtering import parse_where_clause, apply_where_filter, where_columns
 
+    global _listing_cache
+
     # Enable color only for an interactive stdout; writing to a file is never
     # colored. This must run before any colored output is produced.
     _configure_color(no_color or bool(output_file))
@@ -1174,6 +1963,7 @@ def main(path_arg, path_opt, output_format, output_file, input_format, columns,
         # from a previous in-process invocation (tests, library use) never
         # leak into this one.
         cloud_config.reset()
+        _listing_cache = {}
         if profile:
             cloud_config.aws_profile = profile
         if project:
@@ -1244,8 +2034,11 @@ def main(path_arg, path_opt, output_format, output_file, input_format, columns,
                 start_progress(f"Reading {file_name}...")
 
                 # Read the data from the single file with streaming
+                if count:
+                    _share_download(service, bucket, object_path)
                 df, full_schema, streaming_stats = read_data_streaming(service, bucket, object_path, input_format, num_rows, read_columns, delimiter, offset, where=where)
-                total_record_count = None  # Will be computed later if needed
+                # Known already if the read reached end of file; else --count computes it
+                total_record_count = _count_from_complete_read(df, num_rows, offset, where)
 
                 # Stop progress
                 stop_progress()
@@ -1263,7 +2056,13 @@ def main(path_arg, path_opt, output_format, output_file, input_format, columns,
                 else:
                     update_progress(f"Selecting {input_format} files...")
 
-                file_list = get_files_for_multiread(service, bucket, object_path, input_format, max_size_mb, quiet=True)
+                file_list = get_files_for_multiread(
+                    service, bucket, object_path, input_format, max_size_mb, quiet=True,
+                    stop_listing_early=not count,
+                )
+
+                # Record count already known from the preview read, if any
+                preview_count = None
 
                 # For a single file, use streaming read for efficiency
                 if len(file_list) == 1:
@@ -1272,6 +2071,8 @@ def main(path_arg, path_opt, output_format, output_file, input_format, columns,
                     update_progress(f"Reading {file_name}...")
 
                     # Use streaming read for all formats
+                    if count:
+                        _share_download(service, bucket, single_file_path)
                     df, full_schema, streaming_stats = read_data_streaming(
                         service, bucket, single_file_path, input_format, num_rows, read_columns, delimiter, offset, where=where
                     )
@@ -1280,6 +2081,7 @@ def main(path_arg, path_opt, output_format, output_file, input_format, columns,
                     info(Fore.BLUE + f"Inferred input format: {input_format}" + Style.RESET_ALL)
                     multi_file_list = file_list
                     total_record_count = None
+                    preview_count = _count_from_complete_read(df, num_rows, offset, where)
                 elif len(file_list) > 1:
                     # Read data from multiple files with progress updates
                     update_progress(f"Reading {len(file_list)} files...")
@@ -1300,6 +2102,12 @@ def main(path_arg, path_opt, output_format, output_file, input_format, columns,
                     # total_record_count will be computed later if --count is specified
                     total_record_count = None
                     multi_file_list = file_list
+                    # Every selected file was read to its end unless the row
+                    # limit cut the reading short.
+                    if multi_read_rows == 0 or rows_in_files < offset + multi_read_rows:
+                        preview_count = rows_in_files
+                    else:
+                        preview_count = None
 
                 # For --count, get ALL files (not limited by max_size_mb)
                 # so we can count records across the entire directory
@@ -1308,8 +2116,14 @@ def main(path_arg, path_opt, output_format, output_file, input_format, columns,
                     all_files_size = sum(f[1] for f in all_files)
                     all_files_size_mb = all_files_size / (1024 * 1024)
 
+                    # The preview may already have read every file of the
+                    # directory to its end; then the count is known and no
+                    # file needs to be scanned again.
+                    if len(all_files) == len(file_list) and preview_count is not None:
+                        total_record_count = preview_count
+
                     # Warn user about counting all files in directory
-                    if not yes:
+                    if not yes and total_record_count is None:
                         info(Fore.YELLOW + f"\nWarning: --count will scan {len(all_files)} files ({all_files_size_mb:.1f} MB total)." + Style.RESET_ALL)
                         if not click.confirm("Continue?", default=True, err=True):
                             info("Aborted.")
@@ -1336,9 +2150,20 @@ def main(path_arg, path_opt, output_format, output_file, input_format, columns,
             file_name = object_path.split('/')[-1]
             start_progress(f"Reading {file_name}...")
 
-            # Read the data with streaming
-            df, full_schema, streaming_stats = read_data_streaming(service, bucket, object_path, input_format, num_rows, read_columns, delimiter, offset, where=where)
-            total_record_count = None  # Will be computed later if needed
+            # Schema-only output needs no rows when the footer has the schema
+            footer_schema = None
+            if schema == 'schema_only' and not where:
+                footer_schema = _read_footer_schema(service, bucket, object_path, input_format)
+            if footer_schema is not None:
+                df, full_schema = None, footer_schema
+                total_record_count = None  # --count reads the footer as well
+            else:
+                # Read the data with streaming
+                if count:
+                    _share_download(service, bucket, object_path)
+                df, full_schema, streaming_stats = read_data_streaming(service, bucket, object_path, input_format, num_rows, read_columns, delimiter, offset, where=where)
+                # Known already if the read reached end of file; else --count computes it
+                total_record_count = _count_from_complete_read(df, num_rows, offset, where)
 
             stop_progress()
 
@@ -1424,17 +2249,15 @@ def main(path_arg, path_opt, output_format, output_file, input_format, columns,
         # write it to the output file or stdout.
         if show_stats:
             info(Fore.CYAN + f"Column statistics over {len(df)} retrieved rows:" + Style.RESET_ALL)
-            rendered = _render_data(_column_stats(df), output_format)
+            pieces = _iter_rendered(_column_stats(df), output_format)
         else:
-            rendered = _render_data(df, output_format)
+            pieces = _iter_rendered(df, output_format)
         if output_file:
             with open(output_file, 'w', encoding='utf-8', newline='') as f:
-                f.write(_strip_ansi(rendered))
-                if not rendered.endswith('\n'):
-                    f.write('\n')
+                _write_rendered(pieces, lambda piece: f.write(_strip_ansi(piece)))
             info(Fore.GREEN + f"Wrote output to {output_file}" + Style.RESET_ALL)
         else:
-            click.echo(rendered)
+            _write_rendered(pieces, lambda piece: click.echo(piece, nl=False))
 
         # Show record count only if --count flag is specified
         if count:
@@ -1448,6 +2271,9 @@ def main(path_arg, path_opt, output_format, output_file, input_format, columns,
         stop_progress()  # Make sure progress is stopped on error
         click.echo(Fore.RED + f"Error: {str(e)}" + Style.RESET_ALL, err=True)
         sys.exit(1)
+    finally:
+        _listing_cache = None
+        _shared_downloads.clear()
 
 
 if __name__ == '__main__':
@@ -1,33 +1,80 @@
 """Compression detection and decompression utilities."""
 
 import bz2
+import functools
 import gzip
 import io
+import os
+import shutil
+import threading
+from importlib.util import find_spec
 from typing import Optional, Union, BinaryIO, Tuple
 
-from .config import COMPRESSION_EXTENSIONS
+from .config import FORMAT_EXTENSIONS
 
-# Optional compression library imports
-try:
-    import lz4.frame as lz4
-    HAS_LZ4 = True
-except ImportError:
-    lz4 = None
-    HAS_LZ4 = False
+# Optional compression libraries. Only their presence is checked here; each
+# is imported where a file actually needs it, since the CLI (and shell
+# completion) imports this module on every run and the codecs together
+# cost several milliseconds to load.
+HAS_LZ4 = find_spec('lz4') is not None
+HAS_ZSTD = find_spec('zstandard') is not None
+HAS_SNAPPY = find_spec('snappy') is not None
+# ISA-L's SIMD inflate (python-isal) decodes gzip several times faster than
+# zlib; the stdlib gzip module is used without it.
+HAS_ISAL = find_spec('isal') is not None
+# rapidgzip decompresses one large gzip member on several cores at once.
+HAS_RAPIDGZIP = find_spec('rapidgzip') is not None
 
-try:
-    import zstandard as zstd
-    HAS_ZSTD = True
-except ImportError:
-    zstd = None
-    HAS_ZSTD = False
 
-try:
-    import snappy
-    HAS_SNAPPY = True
-except ImportError:
-    snappy = None
-    HAS_SNAPPY = False
+# Codec for each entry of config.COMPRESSION_EXTENSIONS.
+_CODEC_BY_EXTENSION = {
+    '.gz': 'gzip', '.gzip': 'gzip',
+    '.zst': 'zstd', '.zstd': 'zstd',
+    '.lz4': 'lz4',
+    '.snappy': 'snappy',
+    '.bz2': 'bz2',
+}
+
+# Final extension -> format (without compression suffixes).
+_EXT_TO_FORMAT = {ext: fmt for fmt, exts in FORMAT_EXTENSIONS.items() for ext in exts}
+
+
+@functools.lru_cache(maxsize=4096)
+def classify_path(path: str) -> Tuple[Optional[str], Optional[str], str]:
+    """Classify a path by its extensions in a single pass.
+
+    Multi-file reads classify every listed file, often more than once, so
+    the result is cached per path.
+
+    For Parquet and ORC, snappy is an internal codec handled by PyArrow,
+    not external compression: .snappy.parquet (Spark) is left as-is and
+    .parquet.snappy is treated as plain .parquet.
+
+    Args:
+        path: File path to classify.
+
+    Returns:
+        Tuple of (format or None, compression or None, path with the
+        compression extension removed).
+    """
+    path_lower = path.lower()
+    compression = None
+    base = path
+
+    if path_lower.endswith(('.snappy.parquet', '.snappy.orc')):
+        pass  # Already ends with the format extension
+    elif path_lower.endswith(('.parquet.snappy', '.orc.snappy')):
+        base = path[:-len('.snappy')]
+    else:
+        # One dict probe on the final extension instead of an endswith()
+        # scan per codec; no codec extension contains a second dot.
+        ext = path_lower[path_lower.rfind('.'):]
+        compression = _CODEC_BY_EXTENSION.get(ext)
+        if compression:
+            base = path[:-len(ext)]
+
+    input_format = _EXT_TO_FORMAT.get(os.path.splitext(path_lower[:len(base)])[1])
+    return input_format, compression, base
 
 
 def detect_compression(path: str) -> Optional[str]:
@@ -43,30 +90,51 @@ def detect_compression(path: str) -> Optional[str]:
     Returns:
         Compression type string ('gzip', 'zstd', 'lz4', 'snappy', 'bz2') or None.
     """
-    path_lower = path.lower()
+    return classify_path(path)[1]
+
+
+# Copy size when draining a streaming decompressor into the result buffer.
+_DECOMPRESS_CHUNK_BYTES = 1024 * 1024
+
+# Seekable gzip inputs at least this large are decompressed in parallel
+# with rapidgzip (when installed); below it, its indexing pass and thread
+# start-up cost more than they save.
+_PARALLEL_GZIP_MIN_BYTES = 16 * 1024 * 1024
+
 
-    # For Parquet and ORC, snappy is an internal codec - PyArrow handles it
-    # Files like .snappy.parquet (Spark convention) or .parquet.snappy don't need external decompression
-    if (path_lower.endswith('.snappy.parquet') or path_lower.endswith('.parquet.snappy') or
-        path_lower.endswith('.snappy.orc') or path_lower.endswith('.orc.snappy')):
+def _remaining_bytes(stream) -> Optional[int]:
+    """Bytes left in a seekable stream, or None if it cannot seek."""
+    if not getattr(stream, 'seekable', lambda: False)():
         return None
+    position = stream.tell()
+    end = stream.seek(0, io.SEEK_END)
+    stream.seek(position)
+    return end - position
 
-    if path_lower.endswith('.gz') or path_lower.endswith('.gzip'):
-        return 'gzip'
-    elif path_lower.endswith('.zst') or path_lower.endswith('.zstd'):
-        return 'zstd'
-    elif path_lower.endswith('.lz4'):
-        return 'lz4'
-    elif path_lower.endswith('.snappy'):
-        return 'snappy'
-    elif path_lower.endswith('.bz2'):
-        return 'bz2'
-    return None
+# One reusable ZstdDecompressor per thread (a context is not safe for
+# concurrent use). Only decompress_stream uses it: it drains each reader
+# before returning, whereas get_streaming_decompressor's readers outlive the
+# call and may still be mid-read when the same thread opens the next file.
+_zstd_local = threading.local()
+
+
+def _thread_zstd_decompressor():
+    """Return this thread's cached ZstdDecompressor, creating it on first use."""
+    dctx = getattr(_zstd_local, 'dctx', None)
+    if dctx is None:
+        import zstandard as zstd
+        dctx = _zstd_local.dctx = zstd.ZstdDecompressor()
+    return dctx
 
 
 def decompress_stream(stream: Union[BinaryIO, bytes], compression: str) -> io.BytesIO:
     """Decompress a stream based on compression type.
 
+    The result is a seekable in-memory buffer (Parquet/ORC and the record
+    counters need one). Streamable codecs are drained chunk by chunk from
+    the source, so the compressed payload is never held in memory alongside
+    the decompressed one.
+
     Args:
         stream: File-like object or bytes to decompress.
         compression: Compression type ('gzip', 'zstd', 'lz4', 'snappy', 'bz2').
@@ -77,43 +145,40 @@ def decompress_stream(stream: Union[BinaryIO, bytes], compression: str) -> io.By
     Raises:
         ValueError: If required compression library is not installed.
     """
+    if supports_streaming_decompression(compression):
+        source = stream if hasattr(stream, 'read') else io.BytesIO(stream)
+        # The streaming readers decode every frame/member of concatenated
+        # zstd, lz4, gzip and bz2 data, not just the first.
+        if compression == 'zstd' and HAS_ZSTD:
+            reader = _thread_zstd_decompressor().stream_reader(source)
+        elif (compression == 'gzip' and HAS_RAPIDGZIP
+              and (_remaining_bytes(source) or 0) >= _PARALLEL_GZIP_MIN_BYTES):
+            import rapidgzip
+            reader = rapidgzip.open(source, parallelization=os.cpu_count() or 1)
+        else:
+            reader, _ = get_streaming_decompressor(source, compression)
+        decompressed = io.BytesIO()
+        shutil.copyfileobj(reader, decompressed, _DECOMPRESS_CHUNK_BYTES)
+        decompressed.seek(0)
+        return decompressed
+
     if hasattr(stream, 'read'):
         data = stream.read()
     else:
         data = stream
 
-    if compression == 'gzip':
-        decompressed = gzip.decompress(data)
-    elif compression == 'zstd':
-        if not HAS_ZSTD:
-            raise ValueError("zstandard package is required for .zst files. Install with: pip install zstandard")
-        dctx = zstd.ZstdDecompressor()
-        # Use stream_reader (not decompress()) so multi-frame zstd data is fully
-        # decoded. dctx.decompress() only reads the first frame, silently
-        # truncating concatenated-frame files (or raising when frames omit the
-        # content size from their header).
-        decompressed = dctx.stream_reader(io.BytesIO(data)).read()
-    elif compression == 'lz4':
-        if not HAS_LZ4:
-            raise ValueError("lz4 package is required for .lz4 files. Install with: pip install lz4")
-        # Read via a frame file (not lz4.decompress()) so multi-frame lz4 data
-        # is fully decoded — decompress() stops after the first frame, silently
-        # dropping the rest of concatenated-frame files.
-        decompressed = lz4.open(io.BytesIO(data), mode='rb').read()
-    elif compression == 'snappy':
+    if compression == 'snappy':
         if not HAS_SNAPPY:
             raise ValueError("python-snappy package is required for .snappy files. Install with: pip install python-snappy")
-        decompressed = snappy.decompress(data)
-    elif compression == 'bz2':
-        decompressed = bz2.decompress(data)
-    else:
-        # No compression or unknown - return original as BytesIO
-        if hasattr(stream, 'read'):
-            stream.seek(0)
-            return stream
-        return io.BytesIO(data)
+        import snappy
+        # Raw snappy has no streaming form: decompress the whole buffer.
+        return io.BytesIO(snappy.decompress(data))
 
-    return io.BytesIO(decompressed)
+    # No compression or unknown - return original as BytesIO
+    if hasattr(stream, 'read'):
+        stream.seek(0)
+        return stream
+    return io.BytesIO(data)
 
 
 def strip_compression_extension(path: str) -> str:
@@ -128,22 +193,7 @@ def strip_compression_extension(path: str) -> str:
     Returns:
         Path with compression extension removed.
     """
-    path_lower = path.lower()
-
-    # For Parquet/ORC with snappy naming conventions, snappy is internal codec
-    # .snappy.parquet (Spark) - already ends in .parquet, return as-is
-    # .parquet.snappy - strip .snappy to get .parquet
-    if path_lower.endswith('.snappy.parquet') or path_lower.endswith('.snappy.orc'):
-        return path  # Already ends with format extension
-    if path_lower.endswith('.parquet.snappy'):
-        return path[:-len('.snappy')]
-    if path_lower.endswith('.orc.snappy'):
-        return path[:-len('.snappy')]
-
-    for ext in COMPRESSION_EXTENSIONS:
-        if path_lower.endswith(ext):
-            return path[:-len(ext)]
-    return path
+    return classify_path(path)[2]
 
 
 def supports_streaming_decompression(compression: str) -> bool:
@@ -182,7 +232,11 @@ def get_streaming_decompressor(
         ValueError: If required compression library is not installed.
     """
     if compression == 'gzip':
-        # gzip.GzipFile wraps a stream and decompresses on-demand
+        # GzipFile wraps a stream and decompresses on-demand; isal's
+        # IGzipFile is a drop-in replacement with a faster inflate.
+        if HAS_ISAL:
+            from isal import igzip
+            return igzip.IGzipFile(fileobj=stream, mode='rb'), True
         return gzip.GzipFile(fileobj=stream, mode='rb'), True
 
     elif compression == 'bz2':
@@ -198,6 +252,7 @@ def get_streaming_decompressor(
         # ZstdDecompressor.stream_reader() provides streaming decompression.
         # Wrap it in a BufferedReader: the raw zstd reader only supports
         # read(), and the JSON/text readers iterate their stream by lines.
+        import zstandard as zstd
         dctx = zstd.ZstdDecompressor()
         return io.BufferedReader(dctx.stream_reader(stream)), True
 
@@ -207,6 +262,7 @@ def get_streaming_decompressor(
                 "lz4 package is required for .lz4 files. "
                 "Install with: pip install lz4"
             )
+        import lz4.frame as lz4
         # lz4.frame.open() can wrap a stream for streaming decompression
         # We need to use LZ4FrameDecompressor for streaming
         return lz4.open(stream, mode='rb'), True
@@ -217,6 +273,7 @@ def get_streaming_decompressor(
                 "python-snappy package is required for .snappy files. "
                 "Install with: pip install python-snappy"
             )
+        import snappy
         # Snappy does NOT support streaming - must decompress fully
         data = stream.read()
         decompressed = snappy.decompress(data)
@@ -1,5 +1,6 @@
 """Configuration management for cloudcat."""
 
+import re
 from typing import Optional
 
 
@@ -29,6 +30,10 @@ class CloudConfig:
 # Global configuration instance
 cloud_config = CloudConfig()
 
+# Concurrent object downloads in the multi-file read path. Object-store GETs
+# are latency-bound, so this is sized for round-trip overlap, not CPU count.
+MULTIREAD_WORKERS = 16
+
 
 # Patterns for files to skip when scanning directories
 SKIP_PATTERNS = [
@@ -43,14 +48,22 @@ SKIP_PATTERNS = [
 COMPRESSION_EXTENSIONS = ['.gz', '.gzip', '.zst', '.zstd', '.lz4', '.snappy', '.bz2']
 
 # Compression suffix pattern for matching compressed files
-_COMPRESSION_SUFFIX = r'(\.gz|\.gzip|\.zst|\.zstd|\.lz4|\.snappy|\.bz2)?$'
+_COMPRESSION_SUFFIX = '(' + '|'.join(re.escape(ext) for ext in COMPRESSION_EXTENSIONS) + ')?$'
+
+# Data-file extensions per format (without compression suffixes). This is
+# the single source for every per-format lookup table (FORMAT_EXTENSION_MAP
+# below, the CLI's suffix tuples, format detection).
+FORMAT_EXTENSIONS = {
+    'csv': ['.csv'],
+    'json': ['.json', '.jsonl', '.ndjson'],
+    'parquet': ['.parquet'],
+    'avro': ['.avro'],
+    'orc': ['.orc'],
+    'text': ['.txt', '.log'],
+}
 
-# Format extension mappings (includes optional compression extensions)
+# Format extension regexes (include optional compression extensions)
 FORMAT_EXTENSION_MAP = {
-    'csv': r'\.csv' + _COMPRESSION_SUFFIX,
-    'json': r'\.(json|jsonl|ndjson)' + _COMPRESSION_SUFFIX,
-    'parquet': r'\.parquet' + _COMPRESSION_SUFFIX,
-    'avro': r'\.avro' + _COMPRESSION_SUFFIX,
-    'orc': r'\.orc' + _COMPRESSION_SUFFIX,
-    'text': r'\.(txt|log)' + _COMPRESSION_SUFFIX
+    fmt: '(' + '|'.join(re.escape(ext) for ext in exts) + ')' + _COMPRESSION_SUFFIX
+    for fmt, exts in FORMAT_EXTENSIONS.items()
 }
@@ -1,5 +1,6 @@
 """WHERE clause parsing and filtering utilities."""
 
+from functools import lru_cache
 from typing import Tuple, List, Any
 import pandas as pd
 
@@ -124,6 +125,23 @@ def _split_outside_quotes(text: str, keyword: str) -> List[str]:
     return parts
 
 
+@lru_cache(maxsize=64)
+def _parse_where_groups(where_clause: str) -> Tuple[Tuple[Tuple[str, str, str], ...], ...]:
+    """Parse a WHERE expression once; immutable so the cached result is shared.
+
+    Streaming readers filter every chunk/batch/row group with the same
+    expression, so without the cache the character-level quote scan and
+    operator search re-ran per chunk.
+    """
+    return tuple(
+        tuple(
+            parse_where_clause(leaf.strip())
+            for leaf in _split_outside_quotes(group_text, 'and')
+        )
+        for group_text in _split_outside_quotes(where_clause, 'or')
+    )
+
+
 def parse_where_expression(where_clause: str) -> List[List[Tuple[str, str, str]]]:
     """Parse a WHERE expression with optional AND/OR into condition groups.
 
@@ -135,26 +153,34 @@ def parse_where_expression(where_clause: str) -> List[List[Tuple[str, str, str]]
     Raises:
         ValueError: If any single condition is malformed.
     """
-    or_groups = []
-    for group_text in _split_outside_quotes(where_clause, 'or'):
-        leaves = [
-            parse_where_clause(leaf.strip())
-            for leaf in _split_outside_quotes(group_text, 'and')
-        ]
-        or_groups.append(leaves)
-    return or_groups
+    return [list(group) for group in _parse_where_groups(where_clause)]
 
 
 def where_columns(where_clause: str) -> List[str]:
     """Return every column referenced by a WHERE expression (deduplicated)."""
     seen = []
-    for group in parse_where_expression(where_clause):
+    for group in _parse_where_groups(where_clause):
         for column, _op, _value in group:
             if column not in seen:
                 seen.append(column)
     return seen
 
 
+def _as_text(series: pd.Series) -> pd.Series:
+    """Return the column as strings for the text operators, copying only if needed.
+
+    String-dtype columns (Arrow-backed by default on recent pandas) and
+    object columns that hold only strings are used as-is, so their .str
+    methods run without an astype(str) copy; missing values stay missing
+    instead of becoming the text 'nan'.
+    """
+    if isinstance(series.dtype, pd.StringDtype):
+        return series
+    if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) in ('string', 'empty'):
+        return series
+    return series.astype(str)
+
+
 def _leaf_mask(df: pd.DataFrame, column: str, op: str, value: str) -> pd.Series:
     """Build the boolean mask for a single (column, op, value) condition."""
     if column not in df.columns:
@@ -188,13 +214,15 @@ def _leaf_mask(df: pd.DataFrame, column: str, op: str, value: str) -> pd.Series:
     elif op == '>=':
         return df[column] >= converted_value
     elif op == 'contains':
-        return df[column].astype(str).str.contains(str(value), case=False, na=False)
+        # Plain substring match (regex=False): the value is literal text, and
+        # Arrow-backed strings dispatch to a vectorized kernel.
+        return _as_text(df[column]).str.contains(str(value), case=False, regex=False, na=False)
     elif op == 'not contains':
-        return ~df[column].astype(str).str.contains(str(value), case=False, na=False)
+        return ~_as_text(df[column]).str.contains(str(value), case=False, regex=False, na=False)
     elif op == 'startswith':
-        return df[column].astype(str).str.lower().str.startswith(str(value).lower(), na=False)
+        return _as_text(df[column]).str.lower().str.startswith(str(value).lower(), na=False)
     elif op == 'endswith':
-        return df[column].astype(str).str.lower().str.endswith(str(value).lower(), na=False)
+        return _as_text(df[column]).str.lower().str.endswith(str(value).lower(), na=False)
     raise ValueError(f"Unsupported operator: {op}")
 
 
@@ -215,7 +243,7 @@ def apply_where_filter(df: pd.DataFrame, where_clause: str) -> pd.DataFrame:
         return df
 
     or_mask = None
-    for group in parse_where_expression(where_clause):
+    for group in _parse_where_groups(where_clause):
         and_mask = None
         for column, op, value in group:
             leaf = _leaf_mask(df, column, op, value)
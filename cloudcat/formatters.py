@@ -6,6 +6,9 @@ piped, when --no-color is set, or when writing to a file.
 """
 
 import json
+from json.encoder import encode_basestring_ascii
+from typing import Iterable, Iterator
+
 import pandas as pd
 from tabulate import tabulate
 from colorama import Fore, Style
@@ -48,19 +51,100 @@ def _column_kind(dtype) -> str:
     return "other"
 
 
-def _format_table_cell(value, kind: str) -> str:
-    """Colorize a single table cell based on its column kind / value type."""
+def _table_cell_parts(value, kind: str):
+    """Split a table cell into (color prefix, plain text); '' is uncolored."""
     if _is_null(value):
-        return f"{_NULL}{_NULL_MARKER}{_RESET}"
+        return _NULL, _NULL_MARKER
 
     if kind == "bool" or isinstance(value, bool):
-        return f"{_TRUE}true{_RESET}" if value else f"{_FALSE}false{_RESET}"
+        return (_TRUE, "true") if value else (_FALSE, "false")
 
     if kind == "num" or (isinstance(value, (int, float)) and not isinstance(value, bool)):
-        return f"{_NUM}{_num_to_str(value)}{_RESET}"
+        return _NUM, _num_to_str(value)
 
     # Strings and everything else: default terminal color.
-    return str(value)
+    return "", str(value)
+
+
+def _format_table_cell(value, kind: str) -> str:
+    """Colorize a single table cell based on its column kind / value type."""
+    prefix, text = _table_cell_parts(value, kind)
+    return f"{prefix}{text}{_RESET}" if prefix else text
+
+
+def _table_column_parts(column: pd.Series, kind: str):
+    """Return (prefixes, texts) for every cell of one column.
+
+    The null mask is computed once per column instead of a pd.isna() call
+    per cell, and typed columns skip the per-value type dispatch.
+    """
+    nulls = column.isna().tolist()
+    values = column.tolist()
+
+    if kind == "num":
+        texts = [_NULL_MARKER if null else _num_to_str(v) for v, null in zip(values, nulls)]
+        prefixes = [_NULL if null else _NUM for null in nulls]
+    elif kind == "bool":
+        texts = [_NULL_MARKER if null else ("true" if v else "false") for v, null in zip(values, nulls)]
+        prefixes = [_NULL if null else (_TRUE if v else _FALSE) for v, null in zip(values, nulls)]
+    else:
+        parts = [(_NULL, _NULL_MARKER) if null else _table_cell_parts(v, kind)
+                 for v, null in zip(values, nulls)]
+        prefixes = [prefix for prefix, _ in parts]
+        texts = [text for _, text in parts]
+    return prefixes, texts
+
+
+def _is_plain(texts: list) -> bool:
+    """True if every text is one line of printable ASCII with no edge spaces.
+
+    For such cells the visible width is simply len() (the ∘ marker is one
+    column wide too), which is what lets the table skip tabulate's per-cell
+    ANSI stripping and wide-character measurement.
+    """
+    joined = "".join(texts).replace(_NULL_MARKER, "")
+    if not (joined.isascii() and joined.isprintable()):
+        return False
+    # NUL cannot occur in the texts now, so it marks every cell boundary.
+    edges = "\0" + "\0".join(texts) + "\0"
+    return " \0" not in edges and "\0 " not in edges
+
+
+def _render_plain_table(headers: list, columns: list, colalign: list) -> str:
+    """Render the rounded_outline layout tabulate would produce for plain cells.
+
+    Args:
+        headers: Header texts (uncolored).
+        columns: (prefixes, texts) per column, as from _table_column_parts.
+        colalign: 'left' or 'right' per column.
+    """
+    padded = []
+    header_cells = []
+    widths = []
+    for header, (prefixes, texts), align in zip(headers, columns, colalign):
+        # tabulate reserves two extra columns beside each header.
+        width = max(len(header) + 2, max(map(len, texts)))
+        right = align == "right"
+        cells = [
+            (f"{prefix}{text}{_RESET}" if prefix else text, width - len(text))
+            for prefix, text in zip(prefixes, texts)
+        ]
+        if right:
+            padded.append([" " * pad + cell for cell, pad in cells])
+        else:
+            padded.append([cell + " " * pad for cell, pad in cells])
+        fill = " " * (width - len(header))
+        header_cell = f"{_HEADER}{header}{_RESET}"
+        header_cells.append(fill + header_cell if right else header_cell + fill)
+        widths.append(width)
+
+    def rule(left: str, sep: str, right: str) -> str:
+        return left + sep.join("─" * (w + 2) for w in widths) + right
+
+    lines = [rule("╭", "┬", "╮"), "│ " + " │ ".join(header_cells) + " │", rule("├", "┼", "┤")]
+    lines.extend("│ " + " │ ".join(row) + " │" for row in zip(*padded))
+    lines.append(rule("╰", "┴", "╯"))
+    return "\n".join(lines)
 
 
 def format_table_with_colored_header(df: pd.DataFrame) -> str:
@@ -80,19 +164,26 @@ def format_table_with_colored_header(df: pd.DataFrame) -> str:
     if df.empty:
         return "Empty dataset"
 
-    headers = [f"{_HEADER}{col}{_RESET}" for col in df.columns]
     # Iterate dtypes positionally: df[col] on a duplicated column name (legal
     # in Parquet) returns a DataFrame, which has no .dtype and would crash.
     kinds = [_column_kind(dtype) for dtype in df.dtypes]
     colalign = ["right" if kind == "num" else "left" for kind in kinds]
-
-    rows = [
-        [_format_table_cell(value, kind) for value, kind in zip(row, kinds)]
-        for row in df.itertuples(index=False, name=None)
-    ]
-
+    columns = [_table_column_parts(df.iloc[:, i], kind) for i, kind in enumerate(kinds)]
+    header_texts = [str(col) for col in df.columns]
+
+    # Large previews are almost always plain single-line cells; lay those out
+    # directly. Anything tabulate measures specially (wide or control
+    # characters, embedded newlines, edge whitespace) still goes through it.
+    if _is_plain(header_texts) and all(_is_plain(texts) for _, texts in columns):
+        return _render_plain_table(header_texts, columns, colalign)
+
+    headers = [f"{_HEADER}{col}{_RESET}" for col in header_texts]
+    rows = zip(*[
+        [f"{prefix}{text}{_RESET}" if prefix else text for prefix, text in zip(prefixes, texts)]
+        for prefixes, texts in columns
+    ])
     return tabulate(
-        rows,
+        list(rows),
         headers,
         tablefmt="rounded_outline",
         colalign=colalign,
@@ -101,13 +192,36 @@ def format_table_with_colored_header(df: pd.DataFrame) -> str:
 
 
 # --- JSON (pretty) ---------------------------------------------------------
+_TRUE_TEXT = f"{_TRUE}true{_RESET}"
+_FALSE_TEXT = f"{_FALSE}false{_RESET}"
+_NULL_TEXT = f"{_NULL}null{_RESET}"
+
+# Rendered "<indent><colored key>: " prefixes per nesting depth. Records in
+# a preview repeat the same keys, so each prefix is built once instead of
+# once per record. Bounded: documents keyed by ids are not cached forever.
+_KEY_LEADS = {}
+_KEY_LEADS_MAX = 4096
+
+
 def _colorize_scalar(value) -> str:
-    """Colorize a single JSON scalar value."""
-    # Check bool before int/float since bool is a subclass of int.
-    if isinstance(value, bool):
-        return f"{_TRUE}true{_RESET}" if value else f"{_FALSE}false{_RESET}"
+    """Colorize a single JSON scalar value.
+
+    Exact str/int/bool types (everything json.loads produces besides
+    floats) are encoded directly rather than through json.dumps(), which
+    dominates the cost of rendering large previews.
+    """
+    kind = type(value)
+    if kind is str:
+        return _STR + encode_basestring_ascii(value) + _RESET
+    # Check bool before int: bool is a subclass of int.
+    if kind is bool:
+        return _TRUE_TEXT if value else _FALSE_TEXT
+    if kind is int:
+        return _NUM + int.__repr__(value) + _RESET
     if value is None:
-        return f"{_NULL}null{_RESET}"
+        return _NULL_TEXT
+    if isinstance(value, bool):
+        return _TRUE_TEXT if value else _FALSE_TEXT
     if isinstance(value, (int, float)):
         return f"{_NUM}{json.dumps(value)}{_RESET}"
     if isinstance(value, str):
@@ -116,27 +230,41 @@ def _colorize_scalar(value) -> str:
     return json.dumps(value)
 
 
+def _key_lead(leads: dict, key, depth: int) -> str:
+    """Build (and cache in ``leads``) the rendered prefix of an object key."""
+    if type(key) is not str:
+        # Not cached: 1, 1.0 and True are one dict key but render differently.
+        return f"{'  ' * (depth + 1)}{_KEY}{json.dumps(key)}{_RESET}: "
+    lead = f"{'  ' * (depth + 1)}{_KEY}{encode_basestring_ascii(key)}{_RESET}: "
+    if len(leads) < _KEY_LEADS_MAX:
+        leads[key] = lead
+    return lead
+
+
 def _render_json(value, depth: int) -> str:
     """Recursively render a parsed JSON value with indentation and color."""
-    indent = "  " * (depth + 1)
-    closing_indent = "  " * depth
-
     if isinstance(value, dict):
         if not value:
             return "{}"
-        items = ",\n".join(
-            f"{indent}{_KEY}{json.dumps(key)}{_RESET}: {_render_json(val, depth + 1)}"
+        leads = _KEY_LEADS.get(depth)
+        if leads is None:
+            leads = _KEY_LEADS[depth] = {}
+        items = ",\n".join([
+            (leads.get(key) or _key_lead(leads, key, depth))
+            + (_render_json(val, depth + 1) if isinstance(val, (dict, list)) else _colorize_scalar(val))
             for key, val in value.items()
-        )
-        return "{\n" + items + "\n" + closing_indent + "}"
+        ])
+        return "{\n" + items + "\n" + "  " * depth + "}"
 
     if isinstance(value, list):
         if not value:
             return "[]"
-        items = ",\n".join(
-            f"{indent}{_render_json(item, depth + 1)}" for item in value
-        )
-        return "[\n" + items + "\n" + closing_indent + "]"
+        indent = "  " * (depth + 1)
+        items = ",\n".join([
+            indent + (_render_json(item, depth + 1) if isinstance(item, (dict, list)) else _colorize_scalar(item))
+            for item in value
+        ])
+        return "[\n" + items + "\n" + "  " * depth + "]"
 
     return _colorize_scalar(value)
 
@@ -152,8 +280,30 @@ def colorize_json(json_str: str) -> str:
     Returns:
         Indented, colorized JSON string.
     """
+    from .readers.json import load_json  # orjson when installed
+
     try:
-        parsed = json.loads(json_str)
+        parsed = load_json(json_str)
     except (json.JSONDecodeError, ValueError):
         return json_str
     return _render_json(parsed, 0)
+
+
+def iter_colorized_json_array(items: Iterable) -> Iterator[str]:
+    """Yield the colorize_json() rendering of a JSON array piece by piece.
+
+    Concatenated, the pieces equal colorize_json() of the whole array, but
+    only one element is rendered at a time, so large record sets are never
+    held as a single string.
+
+    Args:
+        items: Parsed JSON values (the array's elements).
+
+    Yields:
+        Rendered text fragments.
+    """
+    first = True
+    for item in items:
+        yield ("[\n" if first else ",\n") + "  " + _render_json(item, 1)
+        first = False
+    yield "[]" if first else "\n]"
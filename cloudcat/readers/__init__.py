@@ -2,9 +2,9 @@
 
 from .csv import read_csv_data, read_csv_data_streaming
 from .json import read_json_data, read_json_data_streaming
-from .parquet import read_parquet_data, read_parquet_data_streaming, HAS_PARQUET
+from .parquet import read_parquet_data, read_parquet_data_streaming, read_parquet_table, HAS_PARQUET
 from .avro import read_avro_data, read_avro_data_streaming, HAS_AVRO
-from .orc import read_orc_data, read_orc_data_streaming, HAS_ORC
+from .orc import read_orc_data, read_orc_data_streaming, read_orc_table, HAS_ORC
 from .text import read_text_data, read_text_data_streaming
 
 __all__ = [
@@ -14,12 +14,14 @@ __all__ = [
     'read_json_data_streaming',
     'read_parquet_data',
     'read_parquet_data_streaming',
+    'read_parquet_table',
     'HAS_PARQUET',
     'read_avro_data',
     'read_avro_data_streaming',
     'HAS_AVRO',
     'read_orc_data',
     'read_orc_data_streaming',
+    'read_orc_table',
     'HAS_ORC',
     'read_text_data',
     'read_text_data_streaming',
@@ -1,12 +1,14 @@
 """Avro data reader."""
 
 from typing import Optional, Tuple, Union, BinaryIO
+import io
+import itertools
 import sys
 import pandas as pd
 import click
 from colorama import Fore, Style
 
-from ..streaming import StreamingStats
+from ..streaming import StreamingStats, PrefixedStream
 
 # Try to import Avro support
 try:
@@ -16,6 +18,23 @@ except ImportError:
     fastavro = None
     HAS_AVRO = False
 
+# Optional: Arrow builds frames from flat records in C++
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Avro types whose Arrow conversion gives the same pandas column as
+# pd.DataFrame(records); anything else (logical, nested, multi-type unions)
+# keeps the pandas path.
+_ARROW_SAFE_TYPES = frozenset(
+    ('null', 'boolean', 'int', 'long', 'float', 'double', 'string', 'bytes')
+)
+
+# Column projection decodes the file header and first record from a probe of
+# this many leading bytes.
+_PROJECTION_PROBE_BYTES = 1024 * 1024
+
 
 def read_avro_data(
     stream: Union[BinaryIO, str],
@@ -54,7 +73,8 @@ def read_avro_data_streaming(
     """Read Avro data with streaming support.
 
     Avro naturally supports streaming via fastavro.reader() iterator.
-    Column filtering is applied at the record level for efficiency. With
+    Selected columns are projected through a reader schema, so the other
+    fields are skipped during decoding rather than dropped afterwards. With
     ``where``, records are filtered in batches as they stream and reading
     stops at ``num_rows`` matches.
 
@@ -88,19 +108,22 @@ def read_avro_data_streaming(
     col_names = [c.strip() for c in columns.split(',')] if columns else None
     stats.columns_requested = col_names
 
-    def _consume_filtered(reader):
+    def _consume_filtered(f):
         """Stream records through the WHERE filter, stopping at num_rows matches."""
         from ..filtering import apply_where_filter
+        # col_names already includes the WHERE columns (the CLI adds them),
+        # so the filter sees every field it references.
+        reader, full_schema_record = _open_projected(f, col_names)
         batch_size = 1000
         matched_frames = []
         batch = []
-        full_schema_record = None
         matched = 0
         scanned = 0
 
         def _flush():
             nonlocal matched
-            frame = pd.DataFrame(batch)
+            selected = [k for k in full_schema_record if k in col_names] if col_names else None
+            frame = _records_to_frame(batch, reader.writer_schema, selected)
             hits = apply_where_filter(frame, where)
             if not hits.empty:
                 if num_rows > 0 and matched + len(hits) > num_rows:
@@ -110,9 +133,8 @@ def read_avro_data_streaming(
 
         for record in reader:
             if full_schema_record is None:
-                full_schema_record = record.copy()
-            batch.append({k: v for k, v in record.items() if k in col_names}
-                         if col_names else record)
+                full_schema_record = record
+            batch.append(record)
             scanned += 1
             if len(batch) >= batch_size:
                 _flush()
@@ -130,22 +152,17 @@ def read_avro_data_streaming(
             frame = pd.DataFrame(columns=col_names) if col_names else pd.DataFrame()
         return frame, full_schema_record
 
-    def _consume(reader):
+    def _consume(f):
         """Materialize records (and the first full record for schema)."""
-        records = []
-        full_schema_record = None
-        for i, record in enumerate(reader):
-            if num_rows > 0 and i >= num_rows:
-                break
-            # Store first full record for schema
-            if full_schema_record is None:
-                full_schema_record = record.copy()
-            # Apply column filtering at record level for efficiency
-            if col_names:
-                records.append({k: v for k, v in record.items() if k in col_names})
-            else:
-                records.append(record)
-        return records, full_schema_record
+        reader, full_schema_record = _open_projected(f, col_names)
+        records = list(itertools.islice(reader, num_rows) if num_rows > 0 else reader)
+        if not records:
+            return pd.DataFrame(), full_schema_record
+        full_schema_record = full_schema_record or records[0]
+        # Project while building the frame (in record field order) instead
+        # of rebuilding a filtered dict per record.
+        selected = [k for k in full_schema_record if k in col_names] if col_names else None
+        return _records_to_frame(records, reader.writer_schema, selected), full_schema_record
 
     consume = _consume_filtered if where else _consume
 
@@ -154,7 +171,7 @@ def read_avro_data_streaming(
     bytes_read = 0
     if hasattr(stream, 'read'):
         start_pos = stream.tell() if hasattr(stream, 'tell') else 0
-        result, full_schema_record = consume(fastavro.reader(stream))
+        result, full_schema_record = consume(stream)
         # Try to get bytes read from stream position
         if hasattr(stream, 'tell'):
             try:
@@ -163,7 +180,7 @@ def read_avro_data_streaming(
                 bytes_read = 0
     else:
         with open(stream, 'rb') as f:
-            result, full_schema_record = consume(fastavro.reader(f))
+            result, full_schema_record = consume(f)
 
     stats.bytes_read = bytes_read
 
@@ -180,13 +197,7 @@ def read_avro_data_streaming(
         if not valid_cols:
             raise ValueError(f"None of the requested columns exist. Available: {', '.join(available)}")
 
-    # Convert to DataFrame (the filtered consumer already returns one)
-    if isinstance(result, pd.DataFrame):
-        df = result
-    elif result:
-        df = pd.DataFrame(result)
-    else:
-        df = pd.DataFrame()
+    df = result
 
     # Get full schema from the first complete record
     if full_schema_record:
@@ -195,3 +206,67 @@ def read_avro_data_streaming(
         full_schema = df.dtypes
 
     return df, full_schema, stats
+
+
+def _is_arrow_safe(avro_type) -> bool:
+    """True for a primitive Avro type, or a union of one with null."""
+    if isinstance(avro_type, list):
+        return len([t for t in avro_type if t != 'null']) <= 1 and all(
+            _is_arrow_safe(t) for t in avro_type
+        )
+    return isinstance(avro_type, str) and avro_type in _ARROW_SAFE_TYPES
+
+
+def _records_to_frame(
+    records: list, writer_schema, columns: Optional[list] = None
+) -> pd.DataFrame:
+    """Build a DataFrame from decoded records.
+
+    When every field is a flat primitive, Arrow transposes the records into
+    columns in C++, about twice as fast as pd.DataFrame(records) and with
+    the same dtypes. Other schemas use pandas, which keeps nested values as
+    Python lists and dicts.
+    """
+    fields = writer_schema.get('fields') if isinstance(writer_schema, dict) else None
+    if pa is not None and fields and all(_is_arrow_safe(f['type']) for f in fields):
+        try:
+            table = pa.Table.from_pylist(records)
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
+        else:
+            if columns is not None:
+                table = table.select(columns)
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+    return pd.DataFrame(records, columns=columns)
+
+
+def _open_projected(f, col_names: Optional[list]):
+    """Open a fastavro reader that decodes only the requested columns.
+
+    The selected top-level fields become a reader schema, so fastavro skips
+    the other fields' values instead of building them into every record.
+    The header and first record are decoded with the full schema from a
+    probe of the leading bytes, for the full-schema display and the missing
+    column check; when that probe fails (a first block larger than the
+    probe, or a schema the projection can't be derived from) every column
+    is decoded as before.
+
+    Returns:
+        Tuple of (reader, first full record or None).
+    """
+    if not col_names:
+        return fastavro.reader(f), None
+    head = f.read(_PROJECTION_PROBE_BYTES)
+    stream = PrefixedStream(head, f)
+    try:
+        probe = fastavro.reader(io.BytesIO(head))
+        first_record = next(probe, None)
+        writer_schema = probe.writer_schema
+        fields = [field for field in writer_schema['fields'] if field['name'] in col_names]
+        projected = dict(writer_schema, fields=fields)
+        fastavro.parse_schema(projected)
+    except Exception:
+        return fastavro.reader(stream), None
+    if first_record is None or not fields:
+        return fastavro.reader(stream), first_record
+    return fastavro.reader(stream, reader_schema=projected), first_record
@@ -6,7 +6,181 @@ import pandas as pd
 import click
 from colorama import Fore, Style
 
-from ..streaming import StreamingStats, BytesTrackingStream
+from ..streaming import StreamingStats, BytesTrackingStream, PrefixedStream
+
+# Column pushdown: when a --columns read will parse more rows than this, the
+# full schema comes from a sample of the first _SCHEMA_SAMPLE_ROWS rows and
+# the read itself parses only the requested columns (usecols).
+_SCHEMA_SAMPLE_ROWS = 1000
+_SCHEMA_SAMPLE_BYTES = 1024 * 1024
+
+
+def _sample_schema(stream, pd_args: dict):
+    """Sample the head of a stream for the full (all-column) schema.
+
+    Returns:
+        (stream, schema) where stream replays the sampled head and schema is
+        None if the head could not be sampled on its own (no complete line,
+        or a quoted field running past the sample); callers then read every
+        column as before.
+    """
+    parts = []
+    size = 0
+    while size < _SCHEMA_SAMPLE_BYTES:
+        part = stream.read(_SCHEMA_SAMPLE_BYTES - size)
+        if not part:
+            break
+        parts.append(part)
+        size += len(part)
+    if not parts:
+        return stream, None
+    head = parts[0][:0].join(parts)
+    replay = PrefixedStream(head, stream)
+
+    newline = b'\n' if isinstance(head, bytes) else '\n'
+    cut = head.rfind(newline)
+    if cut < 0:
+        return replay, None
+    sample = head[:cut + 1]
+    sample_io = io.BytesIO(sample) if isinstance(sample, bytes) else io.StringIO(sample)
+    try:
+        sample_df = pd.read_csv(sample_io, nrows=_SCHEMA_SAMPLE_ROWS, **pd_args)
+    except Exception:
+        return replay, None
+    if not sample_df.columns.is_unique:
+        return replay, None
+    return replay, sample_df.dtypes
+
+
+# pandas' default NA and boolean spellings, so the Arrow engine below types
+# a file the way pd.read_csv would.
+_NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null',
+]
+_TRUE_VALUES = ['True', 'TRUE', 'true']
+_FALSE_VALUES = ['False', 'FALSE', 'false']
+_ARROW_BLOCK_BYTES = 16 * 1024 * 1024
+
+# Row-limited reads of more rows than this buffer just enough of the stream
+# for the rows (read _ARROW_HEAD_READ_BYTES at a time) and parse it with
+# Arrow too; smaller previews stay on pandas' chunked reader, which stops
+# within a few KB of the last row.
+_ARROW_HEAD_MIN_ROWS = 10000
+_ARROW_HEAD_READ_BYTES = 1024 * 1024
+
+
+def _read_csv_arrow(data: bytes, pd_args: dict, num_rows: int = 0) -> Optional[pd.DataFrame]:
+    """Parse a whole CSV buffer with PyArrow's multithreaded reader.
+
+    With ``num_rows``, only the first that many rows are converted.
+
+    Returns:
+        The DataFrame, or None when the result could differ from
+        pd.read_csv (multi-character delimiter, duplicate or empty headers,
+        integers beyond int64, or columns Arrow would type beyond
+        int/float/bool/string, e.g. dates pandas leaves as text); callers
+        then parse with pandas.
+    """
+    delimiter = pd_args.get('delimiter') or ','
+    if len(delimiter) != 1:
+        return None
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+
+    try:
+        table = pacsv.read_csv(
+            pa.BufferReader(data),
+            read_options=pacsv.ReadOptions(block_size=_ARROW_BLOCK_BYTES, use_threads=True),
+            parse_options=pacsv.ParseOptions(delimiter=delimiter),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=pd_args.get('usecols'),
+                null_values=_NULL_VALUES,
+                true_values=_TRUE_VALUES,
+                false_values=_FALSE_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return None
+
+    names = table.column_names
+    # pandas renames duplicate headers (a.1) and empty ones (Unnamed: 0)
+    if len(set(names)) != len(names) or '' in names:
+        return None
+    for field in table.schema:
+        t = field.type
+        if not (pa.types.is_int64(t) or pa.types.is_float64(t) or pa.types.is_boolean(t)
+                or pa.types.is_string(t) or pa.types.is_large_string(t)):
+            return None
+        if pa.types.is_float64(t) and _beyond_int64(table.column(field.name)):
+            return None
+    if num_rows > 0:
+        table = table.slice(0, num_rows)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _beyond_int64(column) -> bool:
+    """True if a float64 column holds finite values outside the int64 range.
+
+    Arrow reads an integer too wide for int64 as float64, losing precision,
+    where pandas keeps it exact (uint64, or object beyond that). Any value
+    that large is left to pandas, integer literal or not.
+    """
+    import pyarrow.compute as pc
+
+    magnitude = pc.abs(column)
+    finite = pc.filter(magnitude, pc.is_finite(magnitude))
+    largest = pc.max(finite).as_py()
+    return largest is not None and largest >= 2.0 ** 63
+
+
+def _read_csv_arrow_head(stream, num_rows: int, pd_args: dict):
+    """Parse the first ``num_rows`` rows with Arrow, reading only their bytes.
+
+    The stream is read until it holds num_rows + 1 newlines (the header and
+    the rows); the complete lines read are parsed in one go. Where Arrow
+    cannot match pandas (see _read_csv_arrow), pandas parses those lines
+    instead, typing each column over all the rows as pd.read_csv with nrows
+    does; its chunked reader would type every 1000-row chunk on its own.
+    Newlines inside quoted values can leave fewer rows than requested,
+    which falls back.
+
+    Returns:
+        (df, stream) where df is None when the lines read hold too few rows,
+        cannot be parsed on their own, or the stream yields text; the
+        returned stream then replays everything read, for the chunked path.
+    """
+    parts = []
+    newlines = 0
+    at_end = False
+    while newlines <= num_rows:
+        part = stream.read(_ARROW_HEAD_READ_BYTES)
+        if not part:
+            at_end = True
+            break
+        if not isinstance(part, bytes):
+            return None, PrefixedStream(part[:0].join(parts + [part]), stream)
+        parts.append(part)
+        newlines += part.count(b'\n')
+    data = b''.join(parts)
+    replay = PrefixedStream(data, stream)
+    if not data:
+        return None, replay
+    head = data if at_end else data[:data.rfind(b'\n') + 1]
+    df = _read_csv_arrow(head, pd_args, num_rows)
+    if df is None:
+        try:
+            df = pd.read_csv(io.BytesIO(head), nrows=num_rows, **pd_args)
+        except Exception:
+            return None, replay  # e.g. a quoted value cut at the last newline
+    if len(df) < num_rows and not at_end:
+        return None, replay  # quoted newlines: the lines held fewer rows
+    return df, replay
 
 
 def read_csv_data(
@@ -81,6 +255,19 @@ def read_csv_data_streaming(
     if delimiter:
         pd_args['delimiter'] = delimiter
 
+    # Push the column projection into the parser when the read covers more
+    # rows than the schema sample would.
+    sample_schema = None
+    if col_names and hasattr(stream, 'read') and (
+        where or num_rows <= 0 or num_rows > _SCHEMA_SAMPLE_ROWS
+    ):
+        tracked, sample_schema = _sample_schema(tracked, pd_args)
+        usecols = [c for c in col_names if c in sample_schema.index] if sample_schema is not None else []
+        if usecols:
+            pd_args['usecols'] = usecols
+        else:
+            sample_schema = None  # let the full read report missing columns
+
     if where:
         # Filter-as-you-stream: scan chunks, keep only matching rows, stop
         # once num_rows matches are collected (num_rows == 0 scans the whole
@@ -115,7 +302,13 @@ def read_csv_data_streaming(
 
         stats.where_applied = True
         stats.rows_scanned = scanned
-        return _apply_column_filter(full_df, col_names, stats)
+        return _apply_column_filter(full_df, col_names, stats, sample_schema)
+
+    # A long row-limited read is parsed by Arrow from just enough of the stream
+    if num_rows > _ARROW_HEAD_MIN_ROWS and hasattr(tracked, 'read'):
+        full_df, tracked = _read_csv_arrow_head(tracked, num_rows, pd_args)
+        if full_df is not None:
+            return _apply_column_filter(full_df, col_names, stats, sample_schema)
 
     # Use chunked reading for streaming when we have a row limit
     if num_rows > 0:
@@ -151,34 +344,53 @@ def read_csv_data_streaming(
                     stats.bytes_read = 0
                 except (OSError, ValueError):
                     raise e
+                tracked = BytesTrackingStream(stream, stats)
             else:
                 raise e
             pd_args.pop('chunksize', None)
             pd_args['nrows'] = num_rows
             full_df = pd.read_csv(tracked, **pd_args)
             stats.is_streaming = False
-            return _apply_column_filter(full_df, col_names, stats)
+            return _apply_column_filter(full_df, col_names, stats, sample_schema)
 
         if chunks:
             full_df = pd.concat(chunks, ignore_index=True)
         else:
             full_df = pd.DataFrame()
     else:
-        # No row limit - read all data
-        full_df = pd.read_csv(tracked, **pd_args)
+        # No row limit - read all data. The whole file is parsed anyway, so
+        # buffer it and let Arrow's parallel parser take it when it can.
+        data = tracked.read() if hasattr(tracked, 'read') else None
+        if isinstance(data, bytes):
+            full_df = _read_csv_arrow(data, pd_args)
+            if full_df is None:
+                full_df = pd.read_csv(io.BytesIO(data), **pd_args)
+        elif data is not None:
+            full_df = pd.read_csv(io.StringIO(data), **pd_args)
+        else:
+            full_df = pd.read_csv(tracked, **pd_args)
         stats.is_streaming = False
 
-    return _apply_column_filter(full_df, col_names, stats)
+    return _apply_column_filter(full_df, col_names, stats, sample_schema)
 
 
 def _apply_column_filter(
     full_df: pd.DataFrame,
     col_names: Optional[list],
-    stats: StreamingStats
+    stats: StreamingStats,
+    sample_schema: Optional[pd.Series] = None
 ) -> Tuple[pd.DataFrame, pd.Series, StreamingStats]:
-    """Apply column filtering and return results."""
+    """Apply column filtering and return results.
+
+    With ``sample_schema`` (column pushdown), full_df holds only the
+    requested columns; their dtypes from the actual read override the
+    sampled ones.
+    """
     # Store the full schema
-    full_schema = full_df.dtypes
+    if sample_schema is not None:
+        full_schema = pd.Series({**sample_schema.to_dict(), **full_df.dtypes.to_dict()}, dtype=object)
+    else:
+        full_schema = full_df.dtypes
 
     # Apply column filtering if specified
     if col_names:
@@ -9,6 +9,36 @@ from colorama import Fore, Style
 
 from ..streaming import StreamingStats
 
+# Optional faster JSON parser
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+# Column pushdown for JSON arrays: the full schema comes from the first
+# _SCHEMA_SAMPLE_ROWS records; the frame itself only builds requested keys.
+_SCHEMA_SAMPLE_ROWS = 1000
+
+
+def load_json(data: Union[str, bytes]):
+    """Parse a JSON document, with orjson when it is installed.
+
+    Falls back to the stdlib parser for input orjson rejects but json
+    accepts (NaN/Infinity literals, integers wider than 64 bits), so results
+    never depend on which parser is present.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 def read_json_data(
     stream: Union[BinaryIO, io.StringIO, str],
@@ -89,7 +119,7 @@ def read_json_data_streaming(
     # Try streaming approach for JSON Lines first
     if hasattr(stream, 'read'):
         # Peek at first character to detect format
-        first_bytes = stream.read(1)
+        first_bytes, skipped = _read_first_char(stream)
         if isinstance(first_bytes, bytes):
             first_char = first_bytes.decode('utf-8', errors='replace') if first_bytes else ''
         else:
@@ -98,18 +128,22 @@ def read_json_data_streaming(
         if first_char == '{':
             # Likely JSON Lines - try line-by-line streaming
             df, full_schema = _read_json_lines_streaming(stream, first_bytes, num_rows, stats, where)
+            stats.bytes_read += skipped
             return _apply_column_filter(df, full_schema, col_names, stats)
         elif first_char == '[':
             # JSON array - must read fully
             stats.is_streaming = False
+            # Bytes go to the parser as-is: no decode/re-encode copies.
             rest = stream.read()
             if isinstance(rest, bytes):
                 content = first_bytes + rest
-                content = content.decode('utf-8', errors='replace')
+                stats.bytes_read = skipped + len(content)
             else:
                 content = first_char + rest
-            stats.bytes_read = len(content.encode('utf-8'))
-            df, full_schema = _read_json_array(content, full_read_rows)
+                stats.bytes_read = skipped + len(content.encode('utf-8'))
+            df, full_schema = _read_json_array(
+                content, full_read_rows, None if where else col_names
+            )
             if where:
                 df = _filter_after_full_read(df, num_rows, where, stats)
             return _apply_column_filter(df, full_schema, col_names, stats)
@@ -118,10 +152,12 @@ def read_json_data_streaming(
             stats.is_streaming = False
             rest = stream.read()
             if isinstance(rest, bytes):
-                content = (first_bytes + rest).decode('utf-8', errors='replace')
+                raw = first_bytes + rest
+                stats.bytes_read = skipped + len(raw)
+                content = raw.decode('utf-8', errors='replace')
             else:
                 content = first_char + rest
-            stats.bytes_read = len(content.encode('utf-8'))
+                stats.bytes_read = skipped + len(content.encode('utf-8'))
             df, full_schema = _read_json_fallback(content, full_read_rows)
             if where:
                 df = _filter_after_full_read(df, num_rows, where, stats)
@@ -137,19 +173,57 @@ def read_json_data_streaming(
         return _apply_column_filter(df, full_schema, col_names, stats)
 
 
+# Leading characters skipped before format detection: JSON whitespace and a
+# byte order mark (common in files from Windows tooling).
+_LEADING_BLANKS = frozenset((b' ', b'\t', b'\r', b'\n', ' ', '\t', '\r', '\n', '\ufeff'))
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+
+def _read_first_char(stream):
+    """Read the first significant character of a JSON stream.
+
+    Leading whitespace and a UTF-8 BOM are consumed one character at a
+    time, so JSON Lines that start with blank lines or a BOM still stream
+    instead of being read whole by the unknown-format fallback.
+
+    Returns:
+        (first, skipped): the first significant byte (or str character),
+        empty at end of stream, and the number of bytes consumed before it.
+        A lead byte that does not start a BOM is returned with the two bytes
+        read after it.
+    """
+    skipped = 0
+    first = stream.read(1)
+    while first:
+        if first == _UTF8_BOM[:1]:
+            rest = stream.read(2)
+            if rest != _UTF8_BOM[1:]:
+                return first + rest, skipped
+            skipped += len(_UTF8_BOM)
+        elif first in _LEADING_BLANKS:
+            skipped += len(first) if isinstance(first, bytes) else len(first.encode('utf-8'))
+        else:
+            return first, skipped
+        first = stream.read(1)
+    return first, skipped
+
+
 def _parse_json_lines(lines: list) -> pd.DataFrame:
-    """Parse a batch of JSONL strings into a DataFrame (lenient fallback)."""
-    content = '\n'.join(lines)
-    try:
-        return pd.read_json(io.StringIO(content), lines=True)
-    except Exception:
-        records = []
-        for line in lines:
-            try:
-                records.append(json.loads(line))
-            except json.JSONDecodeError:
-                pass
-        return pd.DataFrame(records) if records else pd.DataFrame()
+    """Parse a batch of JSONL strings into a DataFrame, skipping bad lines.
+
+    Each line goes through load_json (orjson when installed) and the frame
+    is built from the records, as for JSON arrays. pd.read_json is avoided:
+    besides being slower, it coerces values (zero-padded ID strings to
+    integers, date-like columns to datetimes), so the same records would
+    display differently as JSON Lines than as an array.
+    """
+    records = []
+    for line in lines:
+        try:
+            records.append(load_json(line))
+        except json.JSONDecodeError:
+            pass
+    return pd.DataFrame(records) if records else pd.DataFrame()
 
 
 def _read_json_lines_streaming(
@@ -190,7 +264,7 @@ def _read_json_lines_streaming(
 
     def _is_standalone_json(text: str) -> bool:
         try:
-            json.loads(text)
+            load_json(text)
             return True
         except (json.JSONDecodeError, ValueError):
             return False
@@ -286,20 +360,37 @@ def _read_json_lines_streaming(
     return df, df.dtypes
 
 
-def _read_json_array(content: str, num_rows: int) -> Tuple[pd.DataFrame, pd.Series]:
-    """Read a JSON array."""
-    parsed = json.loads(content)
+def _read_json_array(
+    content: Union[str, bytes], num_rows: int, col_names: Optional[list] = None
+) -> Tuple[pd.DataFrame, pd.Series]:
+    """Read a JSON array.
+
+    The record list is cut to ``num_rows`` before the DataFrame is built.
+    With ``col_names`` and more records than the schema sample, only the
+    requested keys are materialized; the other columns' dtypes come from
+    the sample.
+    """
+    try:
+        parsed = load_json(content)
+    except UnicodeDecodeError:
+        parsed = load_json(content.decode('utf-8', errors='replace'))
 
-    if isinstance(parsed, list):
-        df = pd.DataFrame(parsed)
-    elif isinstance(parsed, dict):
-        df = pd.DataFrame([parsed])
-    else:
+    if isinstance(parsed, dict):
+        parsed = [parsed]
+    elif not isinstance(parsed, list):
         raise ValueError("JSON must be an array or object")
 
-    if num_rows > 0 and len(df) > num_rows:
-        df = df.head(num_rows)
+    if num_rows > 0:
+        parsed = parsed[:num_rows]
+
+    if col_names and len(parsed) > _SCHEMA_SAMPLE_ROWS and all(isinstance(r, dict) for r in parsed):
+        sample = pd.DataFrame(parsed[:_SCHEMA_SAMPLE_ROWS])
+        wanted = [c for c in col_names if c in sample.columns]
+        if wanted:
+            df = pd.DataFrame(parsed, columns=wanted)
+            return df, pd.Series({**sample.dtypes.to_dict(), **df.dtypes.to_dict()}, dtype=object)
 
+    df = pd.DataFrame(parsed)
     return df, df.dtypes
 
 
@@ -318,17 +409,18 @@ def _read_json_fallback(content: str, num_rows: int) -> Tuple[pd.DataFrame, pd.S
 
     try:
         if first_char == '{':
-            # Could be JSON Lines or single object
-            lines = [line.strip() for line in content_stripped.split('\n') if line.strip()]
-            if len(lines) > 1 and all(line.startswith('{') for line in lines[:min(5, len(lines))]):
+            # Could be JSON Lines or single object. Detection only looks at
+            # the first lines, so bound the split instead of splitting the
+            # whole document (a pretty-printed object never needs the rest).
+            head = [line.strip() for line in content_stripped.split('\n', 5)[:5]]
+            head = [line for line in head if line]
+            if len(head) > 1 and all(line.startswith('{') for line in head):
                 # JSON Lines
-                if num_rows > 0:
-                    df = pd.read_json(io.StringIO(content), lines=True, nrows=num_rows)
-                else:
-                    df = pd.read_json(io.StringIO(content), lines=True)
+                lines = [line.strip() for line in content_stripped.split('\n') if line.strip()]
+                df = _parse_json_lines(lines[:num_rows] if num_rows > 0 else lines)
             else:
                 # Single JSON object
-                parsed = json.loads(content)
+                parsed = load_json(content)
                 df = pd.DataFrame([parsed]) if isinstance(parsed, dict) else pd.DataFrame(parsed)
                 if num_rows > 0 and len(df) > num_rows:
                     df = df.head(num_rows)
@@ -1,13 +1,14 @@
 """ORC data reader."""
 
 from typing import Optional, Tuple, Union, BinaryIO, Any
+import io
 import os
 import sys
-import tempfile
 import pandas as pd
 from colorama import Fore, Style
 
 from ..streaming import StreamingStats
+from .schema import arrow_schema_to_pandas_dtypes
 
 # Try to import ORC support
 try:
@@ -95,7 +96,7 @@ def read_orc_data_streaming(
             pyarrow_fs, pyarrow_path, num_rows, col_names, stats, where
         )
 
-    # Fallback: use stream with temp file approach
+    # Fallback: parse the downloaded stream in memory
     return _read_with_stream(stream, num_rows, col_names, stats, where)
 
 
@@ -144,10 +145,19 @@ def _read_orc_rows(
             return pd.concat(frames, ignore_index=True)
         if first_frame is not None:
             return first_frame.head(0)
-        return orc_file.read(columns=col_names).to_pandas().head(0)
+        return _empty_table(orc_file, col_names).to_pandas()
+
+    return _read_orc_table(orc_file, num_rows, col_names).to_pandas(
+        split_blocks=True, self_destruct=True
+    )
+
+
+def _read_orc_table(orc_file, num_rows: int, col_names: Optional[list]):
+    """Read up to num_rows from an open ORCFile as an Arrow table, by stripe."""
+    import pyarrow as pa
 
     if num_rows <= 0:
-        return orc_file.read(columns=col_names).to_pandas()
+        return orc_file.read(columns=col_names)
 
     batches = []  # list of pyarrow.RecordBatch
     rows_read = 0
@@ -161,14 +171,16 @@ def _read_orc_rows(
         rows_read += stripe.num_rows
 
     if not batches:
-        # Empty file: return a correctly-typed empty frame.
-        return orc_file.read(columns=col_names).to_pandas().head(0)
-    return pa.Table.from_batches(batches).to_pandas()
+        return _empty_table(orc_file, col_names)
+    return pa.Table.from_batches(batches)
 
 
-def _full_schema_dtypes(orc_file) -> pd.Series:
-    """Derive the full (all-column) schema dtypes without reading any data."""
-    return orc_file.schema.empty_table().to_pandas().dtypes
+def _empty_table(orc_file, col_names: Optional[list]):
+    """Zero-row table with the file's (projected) columns, from the footer."""
+    table = orc_file.schema.empty_table()
+    if col_names:
+        table = table.select([c for c in col_names if c in table.column_names])
+    return table
 
 
 def _read_with_native_fs(
@@ -191,7 +203,7 @@ def _read_with_native_fs(
         full_df = _read_orc_rows(orc_file, num_rows, col_names, stats, where)
 
         # Full schema is derived from metadata only (no extra data read).
-        full_schema = _full_schema_dtypes(orc_file)
+        full_schema = arrow_schema_to_pandas_dtypes(orc_file.schema)
 
         # Estimate bytes read (ORC metadata access is limited)
         # Use file size from metadata if available
@@ -211,35 +223,71 @@ def _read_with_stream(
     stats.used_native_fs = False
     stats.is_streaming = False
 
-    # For ORC, we need a temporary file
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_path = temp_file.name
+    orc_file = _open_stream(stream, stats)
 
-    try:
-        # If stream is a file-like object, copy to temp file
-        if hasattr(stream, 'read'):
-            data = stream.read()
-            stats.bytes_read = len(data)
-            with open(temp_path, 'wb') as f:
-                f.write(data)
+    # Read data with column projection, stopping early by stripe.
+    full_df = _read_orc_rows(orc_file, num_rows, col_names, stats, where)
+
+    # Full schema is derived from metadata only (no extra data read).
+    full_schema = arrow_schema_to_pandas_dtypes(orc_file.schema)
+
+    return full_df, full_schema, stats
+
+
+def _open_stream(stream: Union[BinaryIO, str], stats: StreamingStats):
+    """Open a stream or path as an ORCFile, recording bytes read.
+
+    A pyarrow NativeFile is opened as is: it is already random-access, and
+    its owner accounts for the bytes it transfers.
+    """
+    import pyarrow as pa
+    if isinstance(stream, pa.NativeFile):
+        return orc.ORCFile(stream)
+    if hasattr(stream, 'read'):
+        # Parse the already-downloaded bytes in memory; no temp-file round
+        # trip. A decompressed BytesIO is viewed in place rather than copied.
+        if isinstance(stream, io.BytesIO):
+            data = stream.getbuffer()[stream.tell():]
         else:
-            temp_path = stream
-            stats.bytes_read = os.path.getsize(temp_path) if os.path.exists(temp_path) else 0
+            data = stream.read()
+        stats.bytes_read = len(data)
+        source = pa.BufferReader(data)
+    else:
+        source = stream
+        stats.bytes_read = os.path.getsize(source) if os.path.exists(source) else 0
+    return orc.ORCFile(source)
 
-        # Read the ORC file
-        orc_file = orc.ORCFile(temp_path)
 
-        # Read data with column projection, stopping early by stripe.
-        full_df = _read_orc_rows(orc_file, num_rows, col_names, stats, where)
+def read_orc_table(
+    stream: Union[BinaryIO, str],
+    num_rows: int,
+    columns: Optional[str] = None
+) -> Tuple[Any, pd.Series]:
+    """Read ORC from a stream as an Arrow table, without converting it.
 
-        # Full schema is derived from metadata only (no extra data read).
-        full_schema = _full_schema_dtypes(orc_file)
+    For callers combining many files: concatenating the tables and
+    converting once avoids a pandas conversion per file plus a pandas
+    concat copy of every column.
+
+    Args:
+        stream: File-like object or file path containing ORC data.
+        num_rows: Maximum number of rows to read (0 for all).
+        columns: Comma-separated list of columns to select.
 
-        return full_df, full_schema, stats
+    Returns:
+        Tuple of (pyarrow.Table, schema Series).
 
-    finally:
-        try:
-            if hasattr(stream, 'read'):
-                os.unlink(temp_path)
-        except OSError:
-            pass
+    Raises:
+        SystemExit: If pyarrow with ORC support is not installed.
+    """
+    if not HAS_ORC:
+        sys.stderr.write(
+            Fore.RED + "Error: pyarrow with ORC support is required.\n" +
+            "Install it with: pip install pyarrow\n" + Style.RESET_ALL
+        )
+        sys.exit(1)
+
+    col_names = [c.strip() for c in columns.split(',')] if columns else None
+    orc_file = _open_stream(stream, StreamingStats())
+    table = _read_orc_table(orc_file, num_rows, col_names)
+    return table, arrow_schema_to_pandas_dtypes(orc_file.schema)
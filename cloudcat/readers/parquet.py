@@ -4,11 +4,11 @@ from typing import Optional, Tuple, Union, BinaryIO, Any
 import io
 import os
 import sys
-import tempfile
 import pandas as pd
 from colorama import Fore, Style
 
 from ..streaming import StreamingStats
+from .schema import arrow_schema_to_pandas_dtypes
 
 # Try to import Parquet support
 try:
@@ -103,7 +103,7 @@ def read_parquet_data_streaming(
             pyarrow_fs, pyarrow_path, num_rows, col_names, stats, where
         )
 
-    # Fallback: use stream with temp file approach
+    # Fallback: read the (possibly decompressed) stream into memory
     return _read_with_stream(stream, num_rows, col_names, stats, where)
 
 
@@ -180,18 +180,38 @@ def _row_group_may_match(metadata, rg_idx: int, or_groups, name_to_index) -> boo
         return True  # never let a statistics quirk skip real data
 
 
+def _read_row_group_head(parquet_file, index: int, rows: int, col_names: Optional[list]):
+    """Read only the first ``rows`` rows of a row group.
+
+    Decodes batch by batch and stops once enough rows are in hand, instead
+    of decoding the whole (often 100k+ row) group just to slice it.
+    """
+    batches = []
+    needed = rows
+    for batch in parquet_file.iter_batches(batch_size=rows, row_groups=[index], columns=col_names):
+        batches.append(batch.slice(0, needed))
+        needed -= batches[-1].num_rows
+        if needed <= 0:
+            break
+    if not batches:
+        return parquet_file.read_row_group(index, columns=col_names)
+    return pa.Table.from_batches(batches)
+
+
 def _collect_row_groups(
     parquet_file,
     num_rows: int,
     col_names: Optional[list],
     stats: StreamingStats,
-    where: Optional[str]
+    where: Optional[str],
+    as_table: bool = False
 ) -> Tuple[pd.DataFrame, list]:
     """Read row groups (skipping non-matching ones) into a DataFrame.
 
     Returns (df, read_group_indices). With ``where``, groups are filtered as
     they are read and reading stops at ``num_rows`` matches; without it, the
-    original early-stop-by-row-count behavior applies.
+    original early-stop-by-row-count behavior applies, and ``as_table``
+    returns the Arrow table unconverted.
     """
     metadata = parquet_file.metadata
     or_groups = None
@@ -218,7 +238,11 @@ def _collect_row_groups(
             stats.row_groups_skipped += 1
             continue
 
-        table = parquet_file.read_row_group(i, columns=col_names)
+        remaining = num_rows - rows_read
+        if not where and num_rows > 0 and remaining < metadata.row_group(i).num_rows:
+            table = _read_row_group_head(parquet_file, i, remaining, col_names)
+        else:
+            table = parquet_file.read_row_group(i, columns=col_names)
         read_groups.append(i)
 
         if where:
@@ -247,18 +271,33 @@ def _collect_row_groups(
         elif first_table is not None:
             df = first_table.head(0)
         else:
-            df = parquet_file.schema_arrow.empty_table().to_pandas()
-            if col_names:
-                df = df[[c for c in col_names if c in df.columns]]
+            df = _empty_table(parquet_file, col_names).to_pandas()
         return df, read_groups
 
     if tables:
-        df = pa.concat_tables(tables).to_pandas()
+        # concat_tables is zero-copy; split_blocks skips pandas' block
+        # consolidation copy and self_destruct frees each Arrow column as it
+        # is converted, so the conversion never holds both full copies.
+        table = pa.concat_tables(tables)
+        tables.clear()
+        if as_table:
+            return table, read_groups
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
     else:
-        df = pd.DataFrame()
+        df = _empty_table(parquet_file, col_names)
+        if not as_table:
+            df = df.to_pandas()
     return df, read_groups
 
 
+def _empty_table(parquet_file, col_names: Optional[list]):
+    """Zero-row table with the file's (projected) columns."""
+    table = parquet_file.schema_arrow.empty_table()
+    if col_names:
+        table = table.select([c for c in col_names if c in table.column_names])
+    return table
+
+
 def _read_with_native_fs(
     filesystem: Any,
     path: str,
@@ -283,7 +322,7 @@ def _read_with_native_fs(
     df, read_groups = _collect_row_groups(parquet_file, num_rows, col_names, stats, where)
 
     # Get full schema
-    full_schema = _get_schema_from_metadata(parquet_file)
+    full_schema = arrow_schema_to_pandas_dtypes(parquet_file.schema_arrow)
 
     # Estimate bytes read from metadata (only the groups actually fetched)
     stats.bytes_read = _estimate_bytes_read(metadata, col_names, read_groups)
@@ -298,49 +337,81 @@ def _read_with_stream(
     stats: StreamingStats,
     where: Optional[str] = None
 ) -> Tuple[pd.DataFrame, pd.Series, StreamingStats]:
-    """Read Parquet from a stream (fallback for compressed files)."""
+    """Read Parquet from a stream (fallback for compressed files).
+
+    The footer sits at the end of the file, so the stream is read into
+    memory and wrapped in a BufferReader: ParquetFile seeks within the
+    buffer directly, with no temp-file write and read-back. A BytesIO (the
+    decompressed buffer) is viewed in place instead of copied by read().
+    """
     stats.used_native_fs = False
     stats.is_streaming = False
 
-    # For Parquet, we need a temporary file to properly read the metadata
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_path = temp_file.name
+    parquet_file = _open_stream(stream, stats)
 
-    try:
-        # If stream is a file-like object, copy to temp file
-        if hasattr(stream, 'read'):
-            data = stream.read()
-            stats.bytes_read = len(data)
-            with open(temp_path, 'wb') as f:
-                f.write(data)
-        else:
-            # Assume it's already a path
-            temp_path = stream
-            stats.bytes_read = os.path.getsize(temp_path) if os.path.exists(temp_path) else 0
+    df, _read_groups = _collect_row_groups(parquet_file, num_rows, col_names, stats, where)
 
-        parquet_file = pq.ParquetFile(temp_path)
+    full_schema = arrow_schema_to_pandas_dtypes(parquet_file.schema_arrow)
+    return df, full_schema, stats
 
-        df, _read_groups = _collect_row_groups(parquet_file, num_rows, col_names, stats, where)
 
-        full_schema = _get_schema_from_metadata(parquet_file)
-        return df, full_schema, stats
+def _open_stream(stream: Union[BinaryIO, str], stats: StreamingStats):
+    """Open a stream or path as a ParquetFile, recording bytes read.
 
-    finally:
-        try:
-            if hasattr(stream, 'read'):
-                os.unlink(temp_path)
-        except OSError:
-            pass
+    A pyarrow NativeFile is opened as is: it is already random-access, and
+    its owner accounts for the bytes it transfers.
+    """
+    if isinstance(stream, pa.NativeFile):
+        return pq.ParquetFile(stream)
+    if isinstance(stream, io.BytesIO):
+        data = stream.getbuffer()[stream.tell():]
+        stats.bytes_read = len(data)
+        source = pa.BufferReader(data)
+    elif hasattr(stream, 'read'):
+        data = stream.read()
+        stats.bytes_read = len(data)
+        source = pa.BufferReader(data)
+    else:
+        # Assume it's already a path
+        source = stream
+        stats.bytes_read = os.path.getsize(source) if os.path.exists(source) else 0
+    return pq.ParquetFile(source)
+
+
+def read_parquet_table(
+    stream: Union[BinaryIO, str],
+    num_rows: int,
+    columns: Optional[str] = None
+) -> Tuple[Any, pd.Series]:
+    """Read Parquet from a stream as an Arrow table, without converting it.
 
+    For callers combining many files: concatenating the tables and
+    converting once avoids a pandas conversion per file plus a pandas
+    concat copy of every column.
+
+    Args:
+        stream: File-like object or file path containing Parquet data.
+        num_rows: Maximum number of rows to read (0 for all).
+        columns: Comma-separated list of columns to select.
 
-def _get_schema_from_metadata(parquet_file) -> pd.Series:
-    """Extract the full schema from Parquet metadata without reading any data.
+    Returns:
+        Tuple of (pyarrow.Table, schema Series).
 
-    Uses the Arrow schema (already loaded with the file footer) rather than
-    reading row group 0, which would transfer real column data just to learn
-    the dtypes.
+    Raises:
+        SystemExit: If pyarrow is not installed.
     """
-    return parquet_file.schema_arrow.empty_table().to_pandas().dtypes
+    if not HAS_PARQUET:
+        sys.stderr.write(
+            Fore.RED + "Error: pyarrow package is required for Parquet support.\n" +
+            "Install it with: pip install pyarrow\n" + Style.RESET_ALL
+        )
+        sys.exit(1)
+
+    col_names = [c.strip() for c in columns.split(',')] if columns else None
+    stats = StreamingStats()
+    parquet_file = _open_stream(stream, stats)
+    table, _read_groups = _collect_row_groups(parquet_file, num_rows, col_names, stats, None, as_table=True)
+    return table, arrow_schema_to_pandas_dtypes(parquet_file.schema_arrow)
 
 
 def _estimate_bytes_read(
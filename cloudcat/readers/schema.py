@@ -0,0 +1,19 @@
+"""Schema helpers shared by the columnar readers and table adapters."""
+
+import pandas as pd
+
+
+def arrow_schema_to_pandas_dtypes(arrow_schema) -> pd.Series:
+    """Pandas dtypes for every column of an Arrow schema, reading no rows.
+
+    Parquet and ORC footers (and Delta/Iceberg metadata) carry the Arrow
+    schema, so the full schema costs nothing beyond opening the file. Never
+    decode a row group or stripe just to learn the dtypes.
+
+    Args:
+        arrow_schema: A pyarrow.Schema.
+
+    Returns:
+        Series mapping column name to pandas dtype.
+    """
+    return arrow_schema.empty_table().to_pandas().dtypes
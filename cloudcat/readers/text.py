@@ -1,12 +1,23 @@
 """Plain text data reader."""
 
 from typing import Optional, Tuple, Union, BinaryIO
+import numpy as np
 import pandas as pd
 import click
 from colorama import Fore, Style
 
 from ..streaming import StreamingStats
 
+# Line breaks str.splitlines() honours besides LF and CRLF (a bare CR is
+# checked separately): VT, FF, FS/GS/RS, and NEL, LS and PS in UTF-8.
+_OTHER_LINE_BREAKS = (
+    b'\x0b', b'\x0c', b'\x1c', b'\x1d', b'\x1e', b'\xc2\x85', b'\xe2\x80\xa8', b'\xe2\x80\xa9',
+)
+
+# Read size for whole-file reads; each chunk is split while the next one
+# downloads.
+_READ_CHUNK_BYTES = 8 * 1024 * 1024
+
 
 def read_text_data(
     stream: Union[BinaryIO, str],
@@ -92,21 +103,14 @@ def read_text_data_streaming(
         else:
             # No row limit - read all
             stats.is_streaming = False
-            content = stream.read()
-            if isinstance(content, bytes):
-                bytes_read = len(content)
-                content = content.decode('utf-8', errors='replace')
-            else:
-                bytes_read = len(content.encode('utf-8'))
-            lines = content.splitlines()
+            bytes_read, lines = _read_all_lines(stream)
     else:
         # File path - read all (binary read so non-UTF-8 bytes degrade gracefully)
         stats.is_streaming = False
         with open(stream, 'rb') as f:
             raw = f.read()
             bytes_read = len(raw)
-            content = raw.decode('utf-8', errors='replace')
-            lines = content.splitlines()
+            lines = _split_lines(raw)
 
         if num_rows > 0:
             lines = lines[:num_rows]
@@ -114,7 +118,7 @@ def read_text_data_streaming(
     stats.bytes_read = bytes_read
 
     # Create DataFrame with a single 'line' column
-    full_df = pd.DataFrame({'line': lines, 'line_number': range(1, len(lines) + 1)})
+    full_df = pd.DataFrame({'line': lines, 'line_number': np.arange(1, len(lines) + 1)})
 
     # Store the full schema
     full_schema = full_df.dtypes
@@ -132,6 +136,133 @@ def read_text_data_streaming(
     return df, full_schema, stats
 
 
+def _read_all_lines(stream: BinaryIO):
+    """Read a whole stream and split it into lines, pipelined with the read.
+
+    Chunks are read one ahead on a worker thread, so splitting a chunk
+    (NumPy and Arrow, see _split_lines) overlaps the download of the next
+    one; a network read costs about max(download, split) instead of their
+    sum. Only whole lines are split per chunk; a partial last line waits
+    for the rest of it. If any chunk needs the decode + splitlines
+    fallback, the whole content takes it, exactly as a single read would.
+
+    Returns:
+        Tuple of (bytes read, lines).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    first = stream.read(_READ_CHUNK_BYTES)
+    if not isinstance(first, bytes):
+        content = first + stream.read()
+        return len(content.encode('utf-8')), content.splitlines()
+
+    blocks = []  # (buffer, start, stop) of every block split so far
+    arrays = []  # None once any block needs the fallback
+
+    def split(raw, start=0, stop=None):
+        nonlocal arrays
+        stop = len(raw) if stop is None else stop
+        blocks.append((raw, start, stop))
+        if arrays is not None:
+            array = _split_arrow(raw, start, stop)
+            if array is None:
+                arrays = None
+            else:
+                arrays.append(array)
+
+    # Blocks end at a newline, so no CRLF pair and no UTF-8 sequence is
+    # ever split between two of them. A line running across chunks is
+    # joined from its pieces; whole lines are split in place.
+    pending = []
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        chunk = first
+        while chunk:
+            ahead = pool.submit(stream.read, _READ_CHUNK_BYTES)
+            cut = chunk.rfind(b'\n') + 1
+            if not cut:
+                pending.append(chunk)
+            else:
+                start = 0
+                if pending:
+                    start = chunk.find(b'\n') + 1
+                    split(b''.join(pending + [chunk[:start]]))
+                    pending = []
+                if start < cut:
+                    split(chunk, start, cut)
+                if cut < len(chunk):
+                    pending = [chunk[cut:]]
+            chunk = ahead.result()
+    if pending:
+        split(b''.join(pending))
+
+    bytes_read = sum(stop - start for _, start, stop in blocks)
+    if not arrays:
+        return bytes_read, _split_lines(b''.join(raw[start:stop] for raw, start, stop in blocks))
+    if len(arrays) == 1:
+        return bytes_read, arrays[0].to_pandas()
+    import pyarrow as pa
+    return bytes_read, pa.chunked_array(arrays).to_pandas()
+
+
+def _split_lines(raw: bytes):
+    """Split raw bytes into lines the way ``str.splitlines()`` would.
+
+    Line boundaries are found with NumPy and the lines become one Arrow
+    string array over a single buffer, so a large file costs no Python
+    object per line. Content with invalid UTF-8 or line breaks other than
+    LF and CRLF goes through decode + splitlines instead.
+
+    Returns:
+        A string Series, or a list of str on the fallback path.
+    """
+    lines = _split_arrow(raw)
+    if lines is None:
+        return raw.decode('utf-8', errors='replace').splitlines()
+    return lines.to_pandas()
+
+
+def _split_arrow(raw: bytes, start: int = 0, stop: Optional[int] = None):
+    """Split raw[start:stop] into an Arrow string array of lines.
+
+    The array points into ``raw`` itself; the range is never copied out.
+
+    Returns:
+        The array, or None when the content needs decode + splitlines:
+        pyarrow is missing, the UTF-8 is invalid, or it holds line breaks
+        other than LF and CRLF.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return None
+    if stop is None:
+        stop = len(raw)
+    bare_cr = raw.find(b'\r', start, stop) != -1 and \
+        raw.count(b'\r', start, stop) != raw.count(b'\r\n', start, stop)
+    if bare_cr or any(
+        # lead byte first: cheap
+        raw.find(sep[:1], start, stop) != -1 and raw.find(sep, start, stop) != -1
+        for sep in _OTHER_LINE_BREAKS
+    ):
+        return None
+
+    view = np.frombuffer(raw, dtype=np.uint8, count=stop - start, offset=start)
+    newlines = np.flatnonzero(view == ord('\n')) + start
+    offsets = np.concatenate(([start], newlines + 1))
+    if offsets[-1] < stop:
+        offsets = np.append(offsets, stop)  # unterminated last line
+    binary = pa.Array.from_buffers(
+        pa.large_binary(), len(offsets) - 1,
+        [None, pa.py_buffer(offsets.astype(np.int64)), pa.py_buffer(raw)],
+    )
+    try:
+        lines = binary.cast(pa.large_string())
+    except pa.ArrowInvalid:
+        return None
+    return pc.utf8_rtrim(lines, characters='\r\n')
+
+
 def _read_text_filtered(
     stream: BinaryIO,
     num_rows: int,
@@ -11,16 +11,20 @@ _EXPORTS = {
     'parse_cloud_path': 'base',
     'get_stream': 'base',
     'list_directory': 'base',
+    'iter_directory': 'base',
     'get_file_size': 'base',
+    'get_range': 'base',
     # gcs
     'get_gcs_client': 'gcs',
     'get_gcs_stream': 'gcs',
     'list_gcs_directory': 'gcs',
+    'iter_gcs_directory': 'gcs',
     'HAS_GCS': 'gcs',
     # s3
     'get_s3_client': 's3',
     'get_s3_stream': 's3',
     'list_s3_directory': 's3',
+    'iter_s3_directory': 's3',
     'HAS_S3': 's3',
     # azure
     'get_azure_datalake_service_client': 'azure',
@@ -1,13 +1,15 @@
 """Azure Data Lake Storage Gen2 (ADLS Gen2) client and operations."""
 
+import functools
 import io
 import os
 import sys
-from typing import List, Tuple
+import threading
+from typing import List, Optional, Tuple
 
 from colorama import Fore, Style
 
-from ..config import cloud_config
+from ..config import cloud_config, MULTIREAD_WORKERS
 
 # Try to import Azure Data Lake client
 try:
@@ -28,6 +30,79 @@ except ImportError:
 # Combined availability check
 HAS_AZURE = HAS_AZURE_DATALAKE or HAS_AZURE_BLOB
 
+# Service clients are cached per (account, access key) and share one
+# DefaultAzureCredential, whose token discovery (CLI, managed identity, ...)
+# is the slow part of building a client.
+_client_lock = threading.Lock()
+
+# Downloads fetch 4 MiB per GET (the SDK's first GET defaults to 32 MiB,
+# which a small preview mostly throws away). A whole-object read fetches
+# those ranges on _DOWNLOAD_CONCURRENCY connections at once.
+_GET_SIZE = 4 * 1024 * 1024
+_DOWNLOAD_CONCURRENCY = 4
+
+# azure-core's requests adapter pools 10 connections per host; beyond that,
+# connections are discarded ("Connection pool is full") and every further
+# ranged GET pays a new TLS handshake. Size it for every multi-file worker
+# running a concurrent download at once, plus headroom for range reads.
+_POOL_CONNECTIONS = MULTIREAD_WORKERS * _DOWNLOAD_CONCURRENCY + 4
+
+
+@functools.lru_cache(maxsize=None)
+def _default_azure_credential():
+    """Build the DefaultAzureCredential once per process."""
+    from azure.identity import DefaultAzureCredential
+    return DefaultAzureCredential()
+
+
+def _transport_options() -> dict:
+    """Client kwargs for an HTTP transport pooling _POOL_CONNECTIONS.
+
+    A plain requests session with retries left to the SDK pipeline, as in
+    azure-core's own setup. Empty if the transport cannot be built, in which
+    case the SDK's default transport is used.
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        from azure.core.pipeline.transport import RequestsTransport
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+            pool_maxsize=_POOL_CONNECTIONS,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return {'transport': RequestsTransport(session=session)}
+    except Exception:
+        return {}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_datalake_client(account_url: str, access_key: Optional[str]):
+    """Build a DataLakeServiceClient (access key, else DefaultAzureCredential)."""
+    return DataLakeServiceClient(
+        account_url=account_url,
+        credential=access_key or _default_azure_credential(),
+        max_single_get_size=_GET_SIZE,
+        max_chunk_get_size=_GET_SIZE,
+        **_transport_options(),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _build_blob_client(account_url: str, access_key: Optional[str]):
+    """Build a BlobServiceClient (access key, else DefaultAzureCredential)."""
+    return BlobServiceClient(
+        account_url=account_url,
+        credential=access_key or _default_azure_credential(),
+        max_single_get_size=_GET_SIZE,
+        max_chunk_get_size=_GET_SIZE,
+        **_transport_options(),
+    )
+
 
 def get_azure_datalake_service_client():
     """Get an Azure DataLakeServiceClient with optional account configuration.
@@ -63,14 +138,10 @@ def get_azure_datalake_service_client():
     # Check for access key (CLI option or environment variable)
     access_key = cloud_config.azure_access_key or os.environ.get('AZURE_STORAGE_ACCESS_KEY')
 
-    if access_key:
-        # Use access key authentication
-        return DataLakeServiceClient(account_url=account_url, credential=access_key)
-    else:
-        # Fall back to DefaultAzureCredential (az login, managed identity, etc.)
-        from azure.identity import DefaultAzureCredential
-        credential = DefaultAzureCredential()
-        return DataLakeServiceClient(account_url=account_url, credential=credential)
+    # Access key authentication, else DefaultAzureCredential (az login,
+    # managed identity, etc.)
+    with _client_lock:
+        return _build_datalake_client(account_url, access_key or None)
 
 
 def _get_blob_service_client():
@@ -98,12 +169,8 @@ def _get_blob_service_client():
     account_url = f"https://{account_name}.blob.core.windows.net"
     access_key = cloud_config.azure_access_key or os.environ.get('AZURE_STORAGE_ACCESS_KEY')
 
-    if access_key:
-        return BlobServiceClient(account_url=account_url, credential=access_key)
-    else:
-        from azure.identity import DefaultAzureCredential
-        credential = DefaultAzureCredential()
-        return BlobServiceClient(account_url=account_url, credential=credential)
+    with _client_lock:
+        return _build_blob_client(account_url, access_key or None)
 
 
 # Keep old function name as alias for backwards compatibility.
@@ -112,6 +179,48 @@ def _get_blob_service_client():
 get_azure_blob_service_client = get_azure_datalake_service_client
 
 
+class _DownloadChunksReader(io.RawIOBase):
+    """Raw, read-only stream over a StorageStreamDownloader's chunks.
+
+    Lets readers consume an Azure download as it arrives instead of after
+    readall() has buffered the whole object. Reading everything before any
+    chunk was taken uses the downloader's own readall(), which fetches the
+    remaining ranges concurrently.
+    """
+
+    def __init__(self, downloader):
+        self._downloader = downloader
+        self._chunks = None
+        self._chunk = memoryview(b'')
+
+    def readable(self) -> bool:
+        return True
+
+    def readall(self) -> bytes:
+        if self._chunks is None:
+            self._chunks = iter(())
+            return self._downloader.readall()
+        return super().readall()
+
+    def readinto(self, buffer) -> int:
+        if self._chunks is None:
+            self._chunks = self._downloader.chunks()
+        while not self._chunk:
+            try:
+                self._chunk = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        n = min(len(buffer), len(self._chunk))
+        buffer[:n] = self._chunk[:n]
+        self._chunk = self._chunk[n:]
+        return n
+
+
+def _stream_download(downloader) -> io.BufferedReader:
+    """Wrap a StorageStreamDownloader as a buffered binary stream."""
+    return io.BufferedReader(_DownloadChunksReader(downloader))
+
+
 def _is_non_hns_error(error: Exception) -> bool:
     """Return True if the error indicates the account is not HNS-enabled.
 
@@ -121,13 +230,10 @@ def _is_non_hns_error(error: Exception) -> bool:
     return 'EndpointUnsupportedAccountFeatures' in error_str or 'BlobStorageEvents' in error_str
 
 
-def _get_azure_stream_blob(container_name: str, file_path: str) -> io.BytesIO:
-    """Download a file using the Azure Blob API (works with any account)."""
+def _get_azure_stream_blob(container_name: str, file_path: str) -> io.BufferedReader:
+    """Stream a file using the Azure Blob API (works with any account)."""
     blob_client = _get_blob_service_client().get_blob_client(container_name, file_path)
-    buffer = io.BytesIO()
-    buffer.write(blob_client.download_blob().readall())
-    buffer.seek(0)
-    return buffer
+    return _stream_download(blob_client.download_blob(max_concurrency=_DOWNLOAD_CONCURRENCY))
 
 
 def _get_azure_file_size_blob(container_name: str, file_path: str) -> int:
@@ -136,28 +242,26 @@ def _get_azure_file_size_blob(container_name: str, file_path: str) -> int:
     return blob_client.get_blob_properties().size
 
 
-def get_azure_stream(container_name: str, file_path: str) -> io.BytesIO:
+def get_azure_stream(container_name: str, file_path: str) -> io.BufferedReader:
     """Get a file stream from Azure Data Lake Storage Gen2.
 
     Tries the Data Lake API first, then falls back to the Blob API for
-    non-HNS storage accounts.
+    non-HNS storage accounts. The download is streamed chunk by chunk; the
+    first request is issued here, so account errors surface immediately.
 
     Args:
         container_name: Azure filesystem (container) name.
         file_path: File path within the filesystem.
 
     Returns:
-        BytesIO buffer containing the file content.
+        Readable binary stream over the file content.
     """
     if HAS_AZURE_DATALAKE:
         try:
             datalake_service_client = get_azure_datalake_service_client()
             file_system_client = datalake_service_client.get_file_system_client(file_system=container_name)
             file_client = file_system_client.get_file_client(file_path)
-            buffer = io.BytesIO()
-            buffer.write(file_client.download_file().readall())
-            buffer.seek(0)
-            return buffer
+            return _stream_download(file_client.download_file(max_concurrency=_DOWNLOAD_CONCURRENCY))
         except Exception as e:
             if _is_non_hns_error(e) and HAS_AZURE_BLOB:
                 return _get_azure_stream_blob(container_name, file_path)
@@ -169,6 +273,47 @@ def get_azure_stream(container_name: str, file_path: str) -> io.BytesIO:
     raise ValueError("No Azure storage client is available.")
 
 
+def _get_azure_range_blob(container_name: str, file_path: str, start: int, end: int) -> bytes:
+    """Read a byte range using the Azure Blob API (works with any account)."""
+    blob_client = _get_blob_service_client().get_blob_client(container_name, file_path)
+    return blob_client.download_blob(offset=start, length=end - start).readall()
+
+
+def get_azure_range(container_name: str, file_path: str, start: int, end: int) -> bytes:
+    """Read the byte range [start, end) of an Azure Data Lake file.
+
+    Tries the Data Lake API first, then falls back to the Blob API for
+    non-HNS storage accounts.
+
+    Args:
+        container_name: Azure filesystem (container) name.
+        file_path: File path within the filesystem.
+        start: First byte offset (inclusive).
+        end: Last byte offset (exclusive).
+
+    Returns:
+        The requested bytes.
+    """
+    if end <= start:
+        return b''
+
+    if HAS_AZURE_DATALAKE:
+        try:
+            datalake_service_client = get_azure_datalake_service_client()
+            file_system_client = datalake_service_client.get_file_system_client(file_system=container_name)
+            file_client = file_system_client.get_file_client(file_path)
+            return file_client.download_file(offset=start, length=end - start).readall()
+        except Exception as e:
+            if _is_non_hns_error(e) and HAS_AZURE_BLOB:
+                return _get_azure_range_blob(container_name, file_path, start, end)
+            raise
+
+    if HAS_AZURE_BLOB:
+        return _get_azure_range_blob(container_name, file_path, start, end)
+
+    raise ValueError("No Azure storage client is available.")
+
+
 def get_azure_file_size(container_name: str, file_path: str) -> int:
     """Get the size of an Azure Data Lake file without downloading it.
 
@@ -199,7 +344,9 @@ def get_azure_file_size(container_name: str, file_path: str) -> int:
     raise ValueError("No Azure storage client is available.")
 
 
-def _list_azure_directory_datalake(container_name: str, prefix: str) -> List[Tuple[str, int]]:
+def _list_azure_directory_datalake(
+    container_name: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> List[Tuple[str, int]]:
     """List files using Azure Data Lake Storage API (requires HNS enabled)."""
     datalake_service_client = get_azure_datalake_service_client()
     file_system_client = datalake_service_client.get_file_system_client(file_system=container_name)
@@ -212,13 +359,15 @@ def _list_azure_directory_datalake(container_name: str, prefix: str) -> List[Tup
     file_list = []
     paths = file_system_client.get_paths(path=prefix.rstrip('/') if prefix else None)
     for path in paths:
-        if not path.is_directory:
+        if not path.is_directory and (not suffixes or path.name.lower().endswith(suffixes)):
             file_list.append((path.name, path.content_length))
 
     return file_list
 
 
-def _list_azure_directory_blob(container_name: str, prefix: str) -> List[Tuple[str, int]]:
+def _list_azure_directory_blob(
+    container_name: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> List[Tuple[str, int]]:
     """List files using Azure Blob Storage API (works with any storage account)."""
     blob_service_client = _get_blob_service_client()
     container_client = blob_service_client.get_container_client(container_name)
@@ -232,13 +381,16 @@ def _list_azure_directory_blob(container_name: str, prefix: str) -> List[Tuple[s
     blobs = container_client.list_blobs(name_starts_with=prefix if prefix else None)
     for blob in blobs:
         # Skip "directory" blobs (size 0, name ends with /)
-        if blob.size > 0 and not blob.name.endswith('/'):
+        if blob.size > 0 and not blob.name.endswith('/') \
+                and (not suffixes or blob.name.lower().endswith(suffixes)):
             file_list.append((blob.name, blob.size))
 
     return file_list
 
 
-def list_azure_directory(container_name: str, prefix: str) -> List[Tuple[str, int]]:
+def list_azure_directory(
+    container_name: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> List[Tuple[str, int]]:
     """List files in an Azure storage directory.
 
     Tries Data Lake API first (for HNS-enabled accounts), then falls back
@@ -247,6 +399,7 @@ def list_azure_directory(container_name: str, prefix: str) -> List[Tuple[str, in
     Args:
         container_name: Azure filesystem (container) name.
         prefix: Directory prefix.
+        suffixes: Optional lowercase filename suffixes to keep.
 
     Returns:
         List of (filename, size) tuples.
@@ -254,17 +407,17 @@ def list_azure_directory(container_name: str, prefix: str) -> List[Tuple[str, in
     # Try Data Lake API first (better performance for HNS accounts)
     if HAS_AZURE_DATALAKE:
         try:
-            return _list_azure_directory_datalake(container_name, prefix)
+            return _list_azure_directory_datalake(container_name, prefix, suffixes)
         except Exception as e:
             # Fall back to the Blob API for non-HNS accounts
             if _is_non_hns_error(e) and HAS_AZURE_BLOB:
-                return _list_azure_directory_blob(container_name, prefix)
+                return _list_azure_directory_blob(container_name, prefix, suffixes)
             # Re-raise other errors
             raise
 
     # Fall back to Blob API if Data Lake not available
     if HAS_AZURE_BLOB:
-        return _list_azure_directory_blob(container_name, prefix)
+        return _list_azure_directory_blob(container_name, prefix, suffixes)
 
     # Neither API available
     sys.stderr.write(
@@ -2,7 +2,7 @@
 
 import io
 import os
-from typing import Tuple, List, Union, BinaryIO
+from typing import Iterator, Tuple, List, Optional, Union, BinaryIO
 
 
 def _parse_local_path(raw: str) -> Tuple[str, str, str]:
@@ -160,13 +160,51 @@ def get_file_size(service: str, bucket: str, object_path: str) -> int:
         raise ValueError(f"Unsupported service: {service}")
 
 
-def list_directory(service: str, bucket: str, prefix: str) -> List[Tuple[str, int]]:
+def get_range(service: str, bucket: str, object_path: str, start: int, end: int) -> bytes:
+    """Read the byte range [start, end) of a file without downloading the rest.
+
+    Args:
+        service: Cloud service identifier ('gcs', 's3', or 'azure').
+        bucket: Bucket or container name.
+        object_path: Object path within the bucket.
+        start: First byte offset (inclusive).
+        end: Last byte offset (exclusive).
+
+    Returns:
+        The requested bytes.
+
+    Raises:
+        ValueError: If the service is not supported.
+    """
+    if service == 'local':
+        from .local import get_local_range
+        return get_local_range(bucket, object_path, start, end)
+    elif service == 'gcs':
+        from .gcs import get_gcs_range
+        return get_gcs_range(bucket, object_path, start, end)
+    elif service == 's3':
+        from .s3 import get_s3_range
+        return get_s3_range(bucket, object_path, start, end)
+    elif service == 'azure':
+        from .azure import get_azure_range
+        return get_azure_range(bucket, object_path, start, end)
+    else:
+        raise ValueError(f"Unsupported service: {service}")
+
+
+def list_directory(
+    service: str, bucket: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> List[Tuple[str, int]]:
     """List files in a cloud storage directory.
 
     Args:
         service: Cloud service identifier ('gcs', 's3', or 'azure').
         bucket: Bucket or container name.
         prefix: Directory prefix.
+        suffixes: Optional lowercase filename suffixes (e.g. ('.csv', '.csv.gz')).
+            When given, only matching files are kept; the match is
+            case-insensitive and applied page by page as the listing streams
+            in, so non-matching keys are never accumulated.
 
     Returns:
         List of (filename, size) tuples.
@@ -176,15 +214,44 @@ def list_directory(service: str, bucket: str, prefix: str) -> List[Tuple[str, in
     """
     if service == 'local':
         from .local import list_local_directory
-        return list_local_directory(bucket, prefix)
+        return list_local_directory(bucket, prefix, suffixes)
     elif service == 'gcs':
         from .gcs import list_gcs_directory
-        return list_gcs_directory(bucket, prefix)
+        return list_gcs_directory(bucket, prefix, suffixes)
     elif service == 's3':
         from .s3 import list_s3_directory
-        return list_s3_directory(bucket, prefix)
+        return list_s3_directory(bucket, prefix, suffixes)
     elif service == 'azure':
         from .azure import list_azure_directory
-        return list_azure_directory(bucket, prefix)
+        return list_azure_directory(bucket, prefix, suffixes)
     else:
         raise ValueError(f"Unsupported service: {service}")
+
+
+def iter_directory(
+    service: str, bucket: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> Optional[Iterator[Tuple[str, int]]]:
+    """Lazily list a directory in name order, where the service allows it.
+
+    S3 and GCS return keys in lexicographic order one page at a time, so a
+    caller can stop once it has what it needs and skip the remaining LIST
+    requests. Other services (local walks, ADLS path listings) are not
+    name-ordered and must be listed in full with list_directory.
+
+    Args:
+        service: Cloud service identifier.
+        bucket: Bucket or container name.
+        prefix: Directory prefix.
+        suffixes: Optional lowercase filename suffixes to keep.
+
+    Returns:
+        Iterator of (filename, size) tuples in name order, or None if the
+        service cannot list lazily in order.
+    """
+    if service == 'gcs':
+        from .gcs import iter_gcs_directory
+        return iter_gcs_directory(bucket, prefix, suffixes)
+    elif service == 's3':
+        from .s3 import iter_s3_directory
+        return iter_s3_directory(bucket, prefix, suffixes)
+    return None
@@ -1,8 +1,10 @@
 """Google Cloud Storage client and operations."""
 
+import functools
 import io
 import sys
-from typing import List, Tuple
+import threading
+from typing import Iterator, List, Optional, Tuple
 
 from colorama import Fore, Style
 
@@ -16,10 +18,31 @@ except ImportError:
     gcs = None
     HAS_GCS = False
 
+# Clients are cached per (project, credentials file): building one re-reads
+# and parses the service-account key and re-runs credential discovery.
+_client_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_gcs_client(project: Optional[str], credentials_path: Optional[str]):
+    """Build a GCS client for the given project and credentials file."""
+    kwargs = {}
+    if project:
+        kwargs['project'] = project
+    if credentials_path:
+        # Use explicit credentials file
+        from google.oauth2 import service_account
+        kwargs['credentials'] = service_account.Credentials.from_service_account_file(
+            credentials_path
+        )
+    return gcs.Client(**kwargs)
+
 
 def get_gcs_client():
     """Get a GCS client with optional project/credentials configuration.
 
+    The client is cached per configuration, so repeated calls are cheap.
+
     Returns:
         google.cloud.storage.Client instance.
 
@@ -33,40 +56,34 @@ def get_gcs_client():
         )
         sys.exit(1)
 
-    kwargs = {}
-    if cloud_config.gcp_project:
-        kwargs['project'] = cloud_config.gcp_project
-    if cloud_config.gcp_credentials:
-        # Use explicit credentials file
-        from google.oauth2 import service_account
-        credentials = service_account.Credentials.from_service_account_file(
-            cloud_config.gcp_credentials
-        )
-        kwargs['credentials'] = credentials
+    with _client_lock:
+        return _build_gcs_client(cloud_config.gcp_project, cloud_config.gcp_credentials)
 
-    return gcs.Client(**kwargs)
 
+# Bytes fetched per ranged GET by the streaming blob reader. Large enough to
+# amortize request latency, small enough that a row-limited preview of a big
+# object stops after one or two requests.
+_STREAM_CHUNK_BYTES = 8 * 1024 * 1024
 
-def get_gcs_stream(bucket_name: str, object_name: str) -> io.BytesIO:
+
+def get_gcs_stream(bucket_name: str, object_name: str) -> io.BufferedIOBase:
     """Get a file stream from GCS.
 
+    The object is read lazily in _STREAM_CHUNK_BYTES ranged requests, so
+    parsing overlaps the download and readers that stop early never fetch
+    the rest of the object.
+
     Args:
         bucket_name: GCS bucket name.
         object_name: Object path within the bucket.
 
     Returns:
-        BytesIO buffer containing the file content.
+        Readable (and seekable) binary stream over the object.
     """
     client = get_gcs_client()
     bucket = client.bucket(bucket_name)
     blob = bucket.blob(object_name)
-
-    # Create a streaming buffer
-    buffer = io.BytesIO()
-    blob.download_to_file(buffer)
-    buffer.seek(0)
-
-    return buffer
+    return blob.open('rb', chunk_size=_STREAM_CHUNK_BYTES)
 
 
 def get_gcs_file_size(bucket_name: str, object_name: str) -> int:
@@ -86,15 +103,44 @@ def get_gcs_file_size(bucket_name: str, object_name: str) -> int:
     return blob.size
 
 
-def list_gcs_directory(bucket_name: str, prefix: str) -> List[Tuple[str, int]]:
-    """List files in a GCS directory.
+def get_gcs_range(bucket_name: str, object_name: str, start: int, end: int) -> bytes:
+    """Read the byte range [start, end) of a GCS object.
 
     Args:
         bucket_name: GCS bucket name.
-        prefix: Directory prefix.
+        object_name: Object path within the bucket.
+        start: First byte offset (inclusive).
+        end: Last byte offset (exclusive).
 
     Returns:
-        List of (filename, size) tuples.
+        The requested bytes.
+    """
+    if end <= start:
+        return b''
+    client = get_gcs_client()
+    blob = client.bucket(bucket_name).blob(object_name)
+    # GCS range ends are inclusive.
+    return blob.download_as_bytes(start=start, end=end - 1)
+
+
+def iter_gcs_directory(
+    bucket_name: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> Iterator[Tuple[str, int]]:
+    """Yield the files in a GCS directory, one listing page at a time.
+
+    GCS lists objects in lexicographic name order and fetches the next page
+    only when iteration reaches it, so a caller that stops early skips the
+    remaining LIST requests.
+
+    Args:
+        bucket_name: GCS bucket name.
+        prefix: Directory prefix.
+        suffixes: Optional lowercase filename suffixes to keep. Matched
+            client-side: match_glob is case-sensitive and needs a newer
+            google-cloud-storage than we require.
+
+    Yields:
+        (filename, size) tuples.
     """
     client = get_gcs_client()
     bucket = client.bucket(bucket_name)
@@ -105,7 +151,22 @@ def list_gcs_directory(bucket_name: str, prefix: str) -> List[Tuple[str, int]]:
     if prefix and not prefix.endswith('/'):
         prefix = prefix + '/'
 
-    blobs = bucket.list_blobs(prefix=prefix)
+    for blob in bucket.list_blobs(prefix=prefix):
+        if not blob.name.endswith('/') and (not suffixes or blob.name.lower().endswith(suffixes)):
+            yield blob.name, blob.size
 
-    # Return a list of files with their size
-    return [(blob.name, blob.size) for blob in blobs if not blob.name.endswith('/')]
+
+def list_gcs_directory(
+    bucket_name: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> List[Tuple[str, int]]:
+    """List files in a GCS directory.
+
+    Args:
+        bucket_name: GCS bucket name.
+        prefix: Directory prefix.
+        suffixes: Optional lowercase filename suffixes to keep.
+
+    Returns:
+        List of (filename, size) tuples.
+    """
+    return list(iter_gcs_directory(bucket_name, prefix, suffixes))
@@ -9,7 +9,7 @@ an absolute filesystem path.
 """
 
 import os
-from typing import BinaryIO, List, Tuple
+from typing import BinaryIO, List, Optional, Tuple
 
 
 def get_local_stream(bucket: str, file_path: str) -> BinaryIO:
@@ -30,7 +30,16 @@ def get_local_file_size(bucket: str, file_path: str) -> int:
     return os.path.getsize(file_path)
 
 
-def list_local_directory(bucket: str, prefix: str) -> List[Tuple[str, int]]:
+def get_local_range(bucket: str, file_path: str, start: int, end: int) -> bytes:
+    """Read the byte range [start, end) of a local file."""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        return f.read(max(0, end - start))
+
+
+def list_local_directory(
+    bucket: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> List[Tuple[str, int]]:
     """Recursively list files under a local directory.
 
     Mirrors the cloud listing contract: returns (path, size) tuples for
@@ -39,6 +48,7 @@ def list_local_directory(bucket: str, prefix: str) -> List[Tuple[str, int]]:
     Args:
         bucket: Unused (kept for the storage-dispatch signature).
         prefix: Directory path.
+        suffixes: Optional lowercase filename suffixes to keep.
 
     Returns:
         List of (absolute_path, size) tuples.
@@ -50,6 +60,8 @@ def list_local_directory(bucket: str, prefix: str) -> List[Tuple[str, int]]:
     file_list = []
     for dirpath, _dirnames, filenames in os.walk(root):
         for name in filenames:
+            if suffixes and not name.lower().endswith(suffixes):
+                continue  # filtered before the stat() call
             full = os.path.join(dirpath, name)
             try:
                 file_list.append((full, os.path.getsize(full)))
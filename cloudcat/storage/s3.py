@@ -1,26 +1,62 @@
 """Amazon S3 client and operations."""
 
+import functools
+import io
 import sys
-from typing import List, Tuple, BinaryIO
+import threading
+from typing import Iterator, List, Optional, Tuple, BinaryIO
 
 from colorama import Fore, Style
 
-from ..config import cloud_config
+from ..config import cloud_config, MULTIREAD_WORKERS
 
 # Try to import S3 client
 try:
     import boto3
     import botocore
+    from botocore.config import Config as BotocoreConfig
     HAS_S3 = True
 except ImportError:
     boto3 = None
     botocore = None
+    BotocoreConfig = None
     HAS_S3 = False
 
+# Whole-object reads of at least this size switch from the single streaming
+# GET to the transfer manager's concurrent ranged GETs.
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_MULTIPART_CONCURRENCY = 4
+
+# botocore keeps 10 pooled connections per client by default; with more
+# concurrent downloads than that, surplus connections are discarded
+# ("Connection pool is full") and re-established per request. Size it for
+# every multi-file worker running a ranged download at once, plus headroom
+# for the main thread's range/footer reads.
+_S3_MAX_POOL_CONNECTIONS = MULTIREAD_WORKERS * _MULTIPART_CONCURRENCY + 4
+
+# Clients are cached per profile and shared by every call (boto3 clients are
+# thread-safe). Building one re-resolves credentials and loads the service
+# model, which dominated listing and multi-file loops. The lock serializes
+# creation only: boto3's default session is not safe to build clients from
+# concurrently.
+_client_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_s3_client(profile: Optional[str]):
+    """Build an S3 client for the given AWS profile (None = default chain)."""
+    config = BotocoreConfig(max_pool_connections=_S3_MAX_POOL_CONNECTIONS)
+    if profile:
+        session = boto3.Session(profile_name=profile)
+        return session.client('s3', config=config)
+    return boto3.client('s3', config=config)
+
 
 def get_s3_client():
     """Get an S3 client with optional profile configuration.
 
+    The client is cached per profile, so repeated calls are cheap.
+
     Returns:
         boto3 S3 client instance.
 
@@ -34,11 +70,53 @@ def get_s3_client():
         )
         sys.exit(1)
 
-    if cloud_config.aws_profile:
-        session = boto3.Session(profile_name=cloud_config.aws_profile)
-        return session.client('s3')
-    else:
-        return boto3.client('s3')
+    with _client_lock:
+        return _build_s3_client(cloud_config.aws_profile)
+
+
+class _S3ObjectStream:
+    """An S3 StreamingBody whose whole-object read() downloads in parallel.
+
+    Sized reads and iteration stream from the original GET, so row-limited
+    readers still stop early. A read() of everything, before any data was
+    consumed, of an object of at least _MULTIPART_THRESHOLD bytes instead
+    runs boto3's transfer manager, which splits the object into ranged GETs
+    over several connections. Everything else is delegated to the body.
+    """
+
+    def __init__(self, client, bucket_name: str, object_name: str, response: dict):
+        self._client = client
+        self._bucket_name = bucket_name
+        self._object_name = object_name
+        self._body = response['Body']
+        self._size = response.get('ContentLength') or 0
+        self._consumed = False
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        if amt is not None and amt >= 0:
+            self._consumed = self._consumed or amt > 0
+            return self._body.read(amt)
+        if not self._consumed and self._size >= _MULTIPART_THRESHOLD:
+            self._consumed = True
+            self._body.close()
+            from boto3.s3.transfer import TransferConfig
+            config = TransferConfig(
+                multipart_threshold=_MULTIPART_THRESHOLD,
+                multipart_chunksize=_MULTIPART_THRESHOLD,
+                max_concurrency=_MULTIPART_CONCURRENCY,
+            )
+            buffer = io.BytesIO()
+            self._client.download_fileobj(self._bucket_name, self._object_name, buffer, Config=config)
+            return buffer.getvalue()
+        self._consumed = True
+        return self._body.read()
+
+    def __iter__(self):
+        self._consumed = True
+        return iter(self._body)
+
+    def __getattr__(self, name):
+        return getattr(self._body, name)
 
 
 def get_s3_stream(bucket_name: str, object_name: str) -> BinaryIO:
@@ -49,11 +127,12 @@ def get_s3_stream(bucket_name: str, object_name: str) -> BinaryIO:
         object_name: Object key within the bucket.
 
     Returns:
-        Streaming body from S3 response.
+        Streaming body from the S3 response; reading a large object whole
+        uses concurrent ranged GETs.
     """
     s3 = get_s3_client()
     response = s3.get_object(Bucket=bucket_name, Key=object_name)
-    return response['Body']
+    return _S3ObjectStream(s3, bucket_name, object_name, response)
 
 
 def get_s3_file_size(bucket_name: str, object_name: str) -> int:
@@ -71,15 +150,43 @@ def get_s3_file_size(bucket_name: str, object_name: str) -> int:
     return response['ContentLength']
 
 
-def list_s3_directory(bucket_name: str, prefix: str) -> List[Tuple[str, int]]:
-    """List files in an S3 directory.
+def get_s3_range(bucket_name: str, object_name: str, start: int, end: int) -> bytes:
+    """Read the byte range [start, end) of an S3 object.
 
     Args:
         bucket_name: S3 bucket name.
-        prefix: Directory prefix.
+        object_name: Object key within the bucket.
+        start: First byte offset (inclusive).
+        end: Last byte offset (exclusive).
 
     Returns:
-        List of (filename, size) tuples.
+        The requested bytes.
+    """
+    if end <= start:
+        return b''
+    s3 = get_s3_client()
+    # HTTP Range ends are inclusive.
+    response = s3.get_object(Bucket=bucket_name, Key=object_name, Range=f'bytes={start}-{end - 1}')
+    return response['Body'].read()
+
+
+def iter_s3_directory(
+    bucket_name: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> Iterator[Tuple[str, int]]:
+    """Yield the files in an S3 directory, one listing page at a time.
+
+    ListObjectsV2 returns keys in UTF-8 binary (i.e. name) order, so a
+    caller that stops iterating early skips the remaining LIST requests.
+    ListObjectsV2 has no suffix filter, so ``suffixes`` is applied to each
+    page as it arrives.
+
+    Args:
+        bucket_name: S3 bucket name.
+        prefix: Directory prefix.
+        suffixes: Optional lowercase filename suffixes to keep.
+
+    Yields:
+        (filename, size) tuples.
     """
     s3 = get_s3_client()
 
@@ -90,16 +197,24 @@ def list_s3_directory(bucket_name: str, prefix: str) -> List[Tuple[str, int]]:
         prefix = prefix + '/'
 
     paginator = s3.get_paginator('list_objects_v2')
-    pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
-
-    # Return a list of files with their size
-    file_list = []
-    for page in pages:
-        if 'Contents' in page:
-            file_list.extend([
-                (item['Key'], item['Size'])
-                for item in page['Contents']
-                if not item['Key'].endswith('/')
-            ])
-
-    return file_list
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        for item in page.get('Contents', ()):
+            key = item['Key']
+            if not key.endswith('/') and (not suffixes or key.lower().endswith(suffixes)):
+                yield key, item['Size']
+
+
+def list_s3_directory(
+    bucket_name: str, prefix: str, suffixes: Optional[Tuple[str, ...]] = None
+) -> List[Tuple[str, int]]:
+    """List files in an S3 directory.
+
+    Args:
+        bucket_name: S3 bucket name.
+        prefix: Directory prefix.
+        suffixes: Optional lowercase filename suffixes to keep.
+
+    Returns:
+        List of (filename, size) tuples.
+    """
+    return list(iter_s3_directory(bucket_name, prefix, suffixes))
@@ -1,13 +1,14 @@
 """Streaming utilities for efficient cloud data access."""
 
 from .stats import StreamingStats, format_bytes
-from .tracking import BytesTrackingStream
+from .tracking import BytesTrackingStream, PrefixedStream
 from .filesystems import get_pyarrow_filesystem, supports_pyarrow_fs
 
 __all__ = [
     'StreamingStats',
     'format_bytes',
     'BytesTrackingStream',
+    'PrefixedStream',
     'get_pyarrow_filesystem',
     'supports_pyarrow_fs',
 ]
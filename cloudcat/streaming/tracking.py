@@ -230,3 +230,50 @@ class DecompressingTrackingStream:
         """Context manager exit."""
         self.close()
         return False
+
+
+class PrefixedStream:
+    """Replay already-read head bytes/text before the rest of a stream."""
+
+    def __init__(self, head, stream):
+        self._head = head
+        self._stream = stream
+
+    def read(self, n: int = -1):
+        if not self._head:
+            return self._stream.read(n)
+        if n is None or n < 0:
+            data, self._head = self._head, self._head[:0]
+            return data + self._stream.read()
+        data, self._head = self._head[:n], self._head[n:]
+        if len(data) < n:
+            data += self._stream.read(n - len(data))  # no short read at the seam
+        return data
+
+    def __iter__(self) -> Iterator:
+        """Yield lines lazily: the head's first, then the rest of the stream."""
+        newline = b'\n' if isinstance(self._head, bytes) else '\n'
+        while self._head:
+            cut = self._head.find(newline) + 1 or len(self._head)
+            line, self._head = self._head[:cut], self._head[cut:]
+            if not line.endswith(newline):
+                # The head ended mid-line; finish the line from the stream.
+                if hasattr(self._stream, 'readline'):
+                    line += self._stream.readline()
+                else:
+                    line += next(iter(self._stream), line[:0])
+            yield line
+        # Not ``yield from``: closing this generator early (a reader that
+        # stops after the first line) would then close the stream too.
+        for line in self._stream:
+            yield line
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    @property
+    def closed(self) -> bool:
+        return False
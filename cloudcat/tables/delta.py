@@ -7,6 +7,7 @@ import click
 import pandas as pd
 from colorama import Fore, Style
 
+from ..readers.schema import arrow_schema_to_pandas_dtypes
 from ..streaming import StreamingStats
 from . import table_uri
 from .pushdown import to_arrow_expression, finalize
@@ -94,8 +95,8 @@ def read(
     else:
         table = dataset.to_table(columns=cols, filter=expression)
 
-    df = table.to_pandas()
-    full_schema = dataset.schema.empty_table().to_pandas().dtypes
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    full_schema = arrow_schema_to_pandas_dtypes(dataset.schema)
 
     df, stats = finalize(df, num_rows, offset, where, stats)
     return df, full_schema, stats
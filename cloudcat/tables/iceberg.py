@@ -11,6 +11,7 @@ import click
 import pandas as pd
 from colorama import Fore, Style
 
+from ..readers.schema import arrow_schema_to_pandas_dtypes
 from ..streaming import StreamingStats
 from . import table_uri, latest_iceberg_metadata
 from .pushdown import PUSHABLE_OPS, convert_value, finalize
@@ -127,8 +128,8 @@ def read(
         scan_kwargs['limit'] = target
     # where present but not pushable: no limit — read all, filter locally.
 
-    df = table.scan(**scan_kwargs).to_arrow().to_pandas()
-    full_schema = arrow_schema.empty_table().to_pandas().dtypes
+    df = table.scan(**scan_kwargs).to_arrow().to_pandas(split_blocks=True, self_destruct=True)
+    full_schema = arrow_schema_to_pandas_dtypes(arrow_schema)
 
     df, stats = finalize(df, num_rows, offset, where, stats)
     return df, full_schema, stats
@@ -1,3 +1,4 @@
+import io
 import pytest
 import pandas as pd
 from click.testing import CliRunner
@@ -159,10 +160,11 @@ class TestCLI:
         assert result.exit_code == 0
         mock_read.assert_called_with("gcs", "bucket", "file.json", "json", 20, None, None, 10, where=None)
 
+    @patch('cloudcat.tables.detect_table_format', return_value=None)
     @patch('cloudcat.cli.find_first_non_empty_file')
     @patch('cloudcat.cli.read_data_streaming')
     @patch('cloudcat.cli.parse_cloud_path')
-    def test_directory_path_first_mode(self, mock_parse, mock_read, mock_find):
+    def test_directory_path_first_mode(self, mock_parse, mock_read, mock_find, _mock_table):
         mock_parse.return_value = ("gcs", "bucket", "folder/")
         mock_find.return_value = ("folder/data.csv", 1024)  # Now returns tuple (path, size)
         mock_df = pd.DataFrame({"name": ["John"], "age": [25]})
@@ -176,11 +178,13 @@ class TestCLI:
         assert result.exit_code == 0
         mock_find.assert_called_once()
 
+    @patch('cloudcat.tables.detect_table_format', return_value=None)
     @patch('cloudcat.cli.get_files_for_multiread')
     @patch('cloudcat.cli.read_data_from_multiple_files')
     @patch('cloudcat.cli.parse_cloud_path')
     @patch('cloudcat.cli.find_first_non_empty_file')
-    def test_directory_path_all_mode(self, mock_find, mock_parse, mock_read_multi, mock_get_files):
+    def test_directory_path_all_mode(self, mock_find, mock_parse, mock_read_multi, mock_get_files,
+                                     _mock_table):
         mock_parse.return_value = ("s3", "bucket", "folder/")
         mock_find.return_value = ("folder/data.csv", 1024)  # Now returns tuple (path, size)
         mock_get_files.return_value = [("file1.csv", 1024), ("file2.csv", 2048)]
@@ -210,6 +214,7 @@ class TestCLI:
         result = self.runner.invoke(main, [
             '--path', 'gcs://bucket/file.csv',
             '--input-format', 'csv',
+            '--num-rows', '1',  # limit hit, so the file may hold more rows
             '--count'
         ])
 
@@ -217,6 +222,31 @@ class TestCLI:
         mock_count.assert_called_once()
         assert "Total records:" in result.output
 
+    @patch('cloudcat.cli.get_file_size')
+    @patch('cloudcat.cli.get_stream')
+    def test_count_reuses_the_preview_download(self, mock_stream, mock_size):
+        data = b"a,b\n" + b"".join(b"%d,x\n" % i for i in range(500))
+        mock_stream.side_effect = lambda *a: io.BytesIO(data)
+        mock_size.return_value = len(data)
+
+        result = self.runner.invoke(main, ['s3://bucket/file.csv', '-n', '5', '--count'])
+
+        assert result.exit_code == 0, result.output
+        assert "Total records: 500" in result.output
+        assert mock_stream.call_count == 1
+
+    @pytest.mark.parametrize("num_rows,scans", [("100", False), ("2", True)])
+    def test_count_of_a_fully_read_directory_needs_no_scan(self, tmp_path, num_rows, scans):
+        for name in ("a.csv", "b.csv"):
+            (tmp_path / name).write_text("x\n1\n2\n3\n")
+
+        with patch('cloudcat.cli.get_record_count_multiple_files', return_value=6) as scan:
+            result = self.runner.invoke(main, [str(tmp_path), '-n', num_rows, '--count', '-y'])
+
+        assert result.exit_code == 0, result.output
+        assert "Total records: 6" in result.output
+        assert scan.called == scans
+
     @patch('cloudcat.cli.get_record_count')
     @patch('cloudcat.cli.read_data_streaming')
     @patch('cloudcat.cli.parse_cloud_path')
@@ -104,6 +104,30 @@ class TestSchemaOnlyToStdout:
         assert "Schema:" in res.stdout  # schema is the requested output -> stdout
         assert "John" not in res.output  # no data rows
 
+    @pytest.mark.parametrize("fmt", ["parquet", "orc"])
+    def test_columnar_schema_only_reads_just_the_footer(self, tmp_path, fmt):
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({"name": ["John", "Jane"], "age": [25, 30],
+                          "ts": pa.array([0, 1], pa.timestamp("ms"))})
+        path = tmp_path / f"data.{fmt}"
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, path)
+        else:
+            import pyarrow.orc as orc
+            orc.write_table(table, path)
+        args = [str(path), "--schema", "schema_only", "--no-color"]
+
+        runner = CliRunner()
+        with patch.object(cli, "read_data_streaming", side_effect=AssertionError("rows read")):
+            footer = runner.invoke(main, args)
+        with patch.object(cli, "_read_footer_schema", return_value=None):
+            full = runner.invoke(main, args)
+        assert footer.exit_code == 0, footer.output
+        assert full.exit_code == 0, full.output
+        assert "age: int64" in footer.stdout
+        assert footer.stdout == full.stdout
+
 
 class TestCountNonNumeric:
     def test_unknown_count_does_not_crash_formatting(self):
@@ -115,7 +139,69 @@ class TestCountNonNumeric:
              patch.object(cli, "get_record_count", return_value="Unknown (fastavro not installed)"):
             result = res.invoke(main, [
                 "--path", "s3://b/f.csv", "--input-format", "csv",
-                "--count", "--schema", "dont_show",
+                "--count", "--schema", "dont_show", "--num-rows", "2",
             ])
         assert result.exit_code == 0
         assert "Unknown (fastavro not installed)" in result.output
+
+
+class TestDirectoryListedOnce:
+    @pytest.mark.parametrize("extra,expected", [
+        (["--count", "-y"], "Total records: 3"),
+        ([], "│   3 │"),  # format inference + file selection
+    ])
+    def test_multi_file_read_lists_directory_once(self, tmp_path, extra, expected):
+        (tmp_path / "a.csv").write_text("x\n1\n2\n")
+        (tmp_path / "b.csv").write_text("x\n3\n")
+        calls = []
+        real_list = cli.list_directory
+
+        def counting_list(service, bucket, prefix, *args):
+            calls.append(prefix)
+            return real_list(service, bucket, prefix, *args)
+
+        with patch.object(cli, "list_directory", counting_list), \
+             patch.object(cli, "iter_directory", side_effect=AssertionError("second listing")):
+            res = CliRunner().invoke(main, [str(tmp_path) + "/", "--no-color"] + extra)
+
+        assert res.exit_code == 0, res.output
+        assert expected in res.output
+        assert len(calls) == 1
+
+
+class TestCountFromCompleteRead:
+    def test_short_file_is_counted_from_the_preview_read(self):
+        with patch.object(cli, "get_record_count", side_effect=AssertionError("recounted")):
+            res = _patched(main, ["--path", "s3://b/f.csv", "--count", "--schema", "dont_show"])
+        assert res.exit_code == 0
+        assert "Total records: 4" in res.output
+
+    def test_limit_hit_still_counts_the_file(self):
+        with patch.object(cli, "get_record_count", return_value=1000) as mock_count:
+            res = _patched(main, ["--path", "s3://b/f.csv", "--count", "-n", "4", "--schema", "dont_show"])
+        assert res.exit_code == 0
+        mock_count.assert_called_once()
+        assert "Total records: 1,000" in res.output
+
+    def test_where_or_empty_offset_window_is_not_a_count(self):
+        import pandas as pd
+        assert cli._count_from_complete_read(pd.DataFrame({"a": [1, 2]}), 10, 3, None) == 5
+        assert cli._count_from_complete_read(pd.DataFrame({"a": [1]}), 10, 0, "a > 0") is None
+        assert cli._count_from_complete_read(pd.DataFrame({"a": []}), 10, 7, None) is None
+        assert cli._count_from_complete_read(pd.DataFrame({"a": [1, 2]}), 0, 0, None) == 2
+
+
+class TestStreamedOutput:
+    @pytest.mark.parametrize("fmt", ["json", "jsonp", "csv"])
+    def test_chunked_rendering_matches_whole_frame(self, fmt):
+        import pandas as pd
+        df = pd.DataFrame({"a": range(7), "b": list("abcdefg")})
+        whole = cli._render_data(df, fmt)
+        with patch.object(cli, "_RENDER_CHUNK_ROWS", 3):
+            assert cli._render_data(df, fmt) == whole
+
+    def test_stdout_ends_with_a_single_newline(self):
+        res = _patched(main, ["--path", "s3://b/f.csv", "-o", "csv", "--schema", "dont_show"])
+        assert res.exit_code == 0
+        assert res.stdout.endswith("active\n")
+        assert res.stdout.startswith("name,age,status\n")
@@ -4,6 +4,7 @@ import pytest
 import io
 import gzip
 from cloudcat.compression import (
+    classify_path,
     detect_compression,
     decompress_stream,
     strip_compression_extension,
@@ -101,6 +102,19 @@ class TestStripCompressionExtension:
     def test_preserves_path(self):
         assert strip_compression_extension("path/to/data.csv.gz") == "path/to/data.csv"
 
+    @pytest.mark.parametrize("path,expected", [
+        ("dir/Data.CSV.GZ", ("csv", "gzip", "dir/Data.CSV")),
+        ("part-0.snappy.parquet", ("parquet", None, "part-0.snappy.parquet")),
+        ("part-0.orc.snappy", ("orc", None, "part-0.orc")),
+        ("events.jsonl.zst", ("json", "zstd", "events.jsonl")),
+        ("notes.txt", ("text", None, "notes.txt")),
+        ("archive.tar.bz2", (None, "bz2", "archive.tar")),
+    ])
+    def test_classify_path_agrees_with_wrappers(self, path, expected):
+        assert classify_path(path) == expected
+        assert detect_compression(path) == expected[1]
+        assert strip_compression_extension(path) == expected[2]
+
 
 class TestDecompressStream:
     """Tests for decompress_stream function."""
@@ -130,6 +144,48 @@ class TestDecompressStream:
         result = decompress_stream(stream, "bz2")
         assert result.read() == original
 
+    @pytest.mark.parametrize("compression", ["gzip", "bz2", "zstd", "lz4"])
+    def test_compressed_source_is_read_incrementally(self, compression):
+        import bz2
+        original = b"row\n" * 50000
+        if compression == "gzip":
+            compressed = gzip.compress(original[:1000]) + gzip.compress(original[1000:])
+        elif compression == "bz2":
+            compressed = bz2.compress(original)
+        elif compression == "zstd":
+            zstd = pytest.importorskip("zstandard")
+            compressed = zstd.ZstdCompressor().compress(original)
+        else:
+            lz4 = pytest.importorskip("lz4.frame")
+            compressed = lz4.compress(original)
+
+        class NoReadAll(io.BytesIO):
+            def read(self, size=-1):
+                assert size is not None and size >= 0, "whole payload read at once"
+                return super().read(size)
+
+        result = decompress_stream(NoReadAll(compressed), compression)
+        assert result.read() == original
+        assert result.seekable()
+
+    @pytest.mark.skipif(not HAS_ZSTD, reason="zstandard not installed")
+    def test_zstd_context_is_reused_per_thread(self):
+        import threading
+        import zstandard as zstd
+        from cloudcat import compression
+        payloads = [b"first" * 100, b"second" * 100]
+        for payload in payloads:
+            result = decompress_stream(zstd.ZstdCompressor().compress(payload), "zstd")
+            assert result.read() == payload
+        dctx = compression._thread_zstd_decompressor()
+        assert compression._thread_zstd_decompressor() is dctx
+
+        other = []
+        worker = threading.Thread(target=lambda: other.append(compression._thread_zstd_decompressor()))
+        worker.start()
+        worker.join()
+        assert other[0] is not dctx
+
     @pytest.mark.skipif(not HAS_ZSTD, reason="zstandard not installed")
     def test_zstd_decompression(self):
         import zstandard as zstd
@@ -184,3 +240,47 @@ class TestDecompressStream:
         stream = io.BytesIO(b"fake data")
         with pytest.raises(ValueError, match="python-snappy package is required"):
             decompress_stream(stream, "snappy")
+
+    def test_gzip_uses_isal_when_available(self, monkeypatch):
+        import sys
+        import types
+        import cloudcat.compression as compression
+        opened = []
+
+        class IGzipFile(gzip.GzipFile):
+            def __init__(self, *args, **kwargs):
+                opened.append(kwargs)
+                super().__init__(*args, **kwargs)
+
+        isal = types.ModuleType("isal")
+        isal.igzip = types.SimpleNamespace(IGzipFile=IGzipFile)
+        monkeypatch.setitem(sys.modules, "isal", isal)
+        monkeypatch.setattr(compression, "HAS_ISAL", True)
+
+        data = b"a,b\n1,2\n" * 100
+        result = decompress_stream(io.BytesIO(gzip.compress(data)), "gzip")
+        assert result.read() == data
+        assert opened and opened[0]["mode"] == "rb"
+
+    def test_large_seekable_gzip_is_decompressed_in_parallel(self, monkeypatch):
+        import sys
+        import types
+        import cloudcat.compression as compression
+        calls = []
+
+        def open_parallel(source, parallelization):
+            calls.append(parallelization)
+            return gzip.GzipFile(fileobj=source, mode="rb")
+
+        monkeypatch.setitem(sys.modules, "rapidgzip", types.SimpleNamespace(open=open_parallel))
+        monkeypatch.setattr(compression, "HAS_RAPIDGZIP", True)
+        monkeypatch.setattr(compression, "_PARALLEL_GZIP_MIN_BYTES", 64)
+
+        data = bytes(range(256)) * 64
+        payload = gzip.compress(data)
+        assert decompress_stream(io.BytesIO(payload), "gzip").read() == data
+        assert len(calls) == 1 and calls[0] >= 1
+
+        small = gzip.compress(b"a")
+        assert decompress_stream(io.BytesIO(small), "gzip").read() == b"a"
+        assert len(calls) == 1  # below the threshold: serial inflate
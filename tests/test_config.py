@@ -7,6 +7,7 @@ from cloudcat.config import (
     SKIP_PATTERNS,
     COMPRESSION_EXTENSIONS,
     FORMAT_EXTENSION_MAP,
+    FORMAT_EXTENSIONS,
 )
 
 
@@ -109,3 +110,17 @@ class TestConstants:
         assert re.search(FORMAT_EXTENSION_MAP['json'], 'file.json')
         assert re.search(FORMAT_EXTENSION_MAP['json'], 'file.jsonl')
         assert re.search(FORMAT_EXTENSION_MAP['json'], 'file.ndjson')
+
+    def test_format_extensions_agree_with_extension_map(self):
+        import re
+        for fmt, exts in FORMAT_EXTENSIONS.items():
+            for ext in exts:
+                for comp in ['', *COMPRESSION_EXTENSIONS]:
+                    assert re.search(FORMAT_EXTENSION_MAP[fmt], f'file{ext}{comp}'), (fmt, ext, comp)
+
+    def test_skip_patterns_split_into_suffixes(self):
+        from cloudcat.cli import _split_skip_patterns
+        suffixes, regex = _split_skip_patterns([r'_SUCCESS$', r'\.crc$', r'^part-\d+\.tmp$'])
+        assert suffixes == ('_SUCCESS', '.crc')
+        assert regex.search('part-00.tmp')
+        assert not regex.search('part-00.csv')
@@ -119,6 +119,61 @@ class TestDataReading:
         assert len(df) == 3
         assert list(df.columns) == ["name", "age"]
 
+    @pytest.mark.parametrize("data,arrow_used", [
+        (b"a,b,c,d\n1,x,true,\n2,NA,False,3.5\n", True),
+        (b"a,b\n1,2024-01-01\n2,2024-01-02\n", False),  # Arrow would parse dates
+        (b"a,a\n1,2\n", False),  # pandas renames the duplicate to a.1
+        (b"a,b\n1,2,3\n", False),  # ragged row: pandas' own handling applies
+        (b",b\n1,2\n", False),  # pandas names the empty header Unnamed: 0
+        (b"a\n18446744073709551615\n", False),  # beyond int64: pandas keeps uint64
+        (b"a\n-1.5e300\n2.5\n", False),  # too large for int64 either way
+        (b"a\n1.5\nnan\ninf\n", True),
+    ])
+    def test_read_csv_all_rows_matches_pandas(self, data, arrow_used):
+        pytest.importorskip("pyarrow.csv")
+        expected = pd.read_csv(io.BytesIO(data))
+        with patch.object(pd, "read_csv", wraps=pd.read_csv) as pandas_parse:
+            df, schema = read_csv_data(io.BytesIO(data), 0)
+        pd.testing.assert_frame_equal(df, expected)
+        assert schema.to_dict() == expected.dtypes.to_dict()
+        assert pandas_parse.called != arrow_used
+
+    @pytest.mark.parametrize("data,arrow_used", [
+        (b"a,b,c\n1,x,true\n2,NA,False\n3,y,true\n4,z,", True),
+        (b"a,b\n1,2024-01-01\n2,2024-01-02\n3,2024-01-03\n", False),  # dates: pandas
+        (b'a,b\n1,"x\ny"\n2,z\n3,w\n', True),
+        (b'a,b\n1,"x\n\ny"\n2,z\n3,w\n', False),  # quoted newlines hid row 2
+    ])
+    def test_read_csv_long_row_limit_matches_pandas(self, data, arrow_used):
+        pytest.importorskip("pyarrow.csv")
+        import cloudcat.readers.csv as csv_reader
+        expected = pd.read_csv(io.BytesIO(data), nrows=2)
+        with patch.object(csv_reader, "_ARROW_HEAD_MIN_ROWS", 1), \
+             patch.object(csv_reader, "_ARROW_HEAD_READ_BYTES", 8), \
+             patch.object(pd, "read_csv", wraps=pd.read_csv) as pandas_parse:
+            df, schema = read_csv_data(io.BytesIO(data), 2)
+        pd.testing.assert_frame_equal(df, expected)
+        assert pandas_parse.called != arrow_used
+
+    @pytest.mark.parametrize("header,first_row", [
+        (b",b", b"1,2"),  # pandas names the empty header Unnamed: 0
+        (b"a,b", b"18446744073709551615,2"),  # beyond int64: pandas keeps uint64
+    ])
+    def test_read_csv_long_preview_keeps_pandas_headers_and_integers(self, header, first_row):
+        pytest.importorskip("pyarrow.csv")
+        import cloudcat.readers.csv as csv_reader
+        from cloudcat.readers.csv import read_csv_data_streaming
+        num_rows = csv_reader._ARROW_HEAD_MIN_ROWS + 1
+        rows = b"".join(b"%d,%d\n" % (i, i) for i in range(num_rows + 10))
+        data = header + b"\n" + first_row + b"\n" + rows
+        expected = pd.read_csv(io.BytesIO(data), nrows=num_rows)
+        with patch.object(csv_reader, "_read_csv_arrow_head",
+                          wraps=csv_reader._read_csv_arrow_head) as arrow_head:
+            df, schema, _ = read_csv_data_streaming(io.BytesIO(data), num_rows)
+        assert arrow_head.called
+        pd.testing.assert_frame_equal(df, expected)
+        assert schema.to_dict() == expected.dtypes.to_dict()
+
     def test_read_json_all_rows(self):
         json_data = '{"name": "John"}\n{"name": "Jane"}\n{"name": "Bob"}'
         stream = io.StringIO(json_data)
@@ -126,4 +181,129 @@ class TestDataReading:
         df, schema = read_json_data(stream, 0)  # 0 means read all rows
         
         assert len(df) == 3
-        assert list(df.columns) == ["name"]
\ No newline at end of file
+        assert list(df.columns) == ["name"]
+
+    def test_get_record_count_parquet_footer_only_without_native_fs(self, tmp_path):
+        # With no pyarrow.fs, the count comes from range reads of the footer;
+        # the full-download stream must never be opened.
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+        import cloudcat.streaming
+        path = tmp_path / "file.parquet"
+        pq.write_table(pa.table({"col1": list(range(5000))}), path, row_group_size=100)
+
+        with patch.object(cloudcat.streaming, "supports_pyarrow_fs", return_value=False), \
+             patch('cloudcat.cli.get_stream', side_effect=AssertionError("full download")):
+            count = get_record_count("local", "", str(path), "parquet")
+
+        assert count == 5000
+
+    def test_get_record_count_orc_tail_only_without_native_fs(self, tmp_path):
+        # Without pyarrow.fs, the count comes from range reads of the ORC
+        # tail; the full-download stream must never be opened.
+        pa = pytest.importorskip("pyarrow")
+        orc = pytest.importorskip("pyarrow.orc")
+        import cloudcat.cli as cli
+        import cloudcat.streaming
+        path = tmp_path / "file.orc"
+        import random
+        rng = random.Random(0)
+        orc.write_table(pa.table({"col1": [rng.getrandbits(62) for _ in range(50000)]}), str(path))
+        size = path.stat().st_size
+        ranges = []
+        real_get_range = cli.get_range
+
+        def get_range(*args):
+            ranges.append(args[-1] - args[-2])
+            return real_get_range(*args)
+
+        with patch.object(cloudcat.streaming, "supports_pyarrow_fs", return_value=False), \
+             patch('cloudcat.cli.get_range', get_range), \
+             patch('cloudcat.cli.get_stream', side_effect=AssertionError("full download")):
+            count = get_record_count("local", "", str(path), "orc")
+
+        assert count == 50000
+        assert sum(ranges) < size
+
+    @pytest.mark.parametrize("data", [
+        b"a,b\n1,2\n3,4\n",
+        b"a,b\n1,2\n3,4",
+        b"\n\na,b\r\n1,2\r\n\r\n  \n3,4\r\n",
+        b'a,b\n1,"x\ny"\n3,4\n',
+        b"a,b\n",
+    ])
+    def test_get_record_count_csv_matches_pandas(self, data):
+        import cloudcat.cli as cli
+        expected = sum(len(c) for c in pd.read_csv(io.BytesIO(data), chunksize=10000))
+        with patch('cloudcat.cli.get_stream', side_effect=lambda *a: io.BytesIO(data)), \
+             patch.object(cli, "_COUNT_CHUNK_BYTES", 3):
+            assert get_record_count("s3", "bucket", "file.csv", "csv") == expected
+
+    @pytest.mark.parametrize("data,expected", [
+        (b'{"a": 1}\n\n{"a": 2}\n{"a": 3}', 3),
+        (b'\xef\xbb\xbf\n{"a": 1}\r\n{"a": 2}\r\n', 2),
+        (b'{\n  "a": 1,\n  "b": 2\n}\n', 1),
+        (b'[{"a": 1}, {"a": 2}]', 2),
+    ])
+    def test_get_record_count_json_shapes(self, data, expected):
+        with patch('cloudcat.cli.get_stream', side_effect=lambda *a: io.BytesIO(data)):
+            assert get_record_count("s3", "bucket", "file.json", "json") == expected
+
+    @pytest.mark.parametrize("chunk_bytes", [4, None])
+    @pytest.mark.parametrize("data,expected", [
+        (b"one\n\nthree\n", 3),
+        (b"a\n\nb\n", 3),
+        (b"one\r\ntwo  \r\n  ", 3),
+        (b"one\rtwo\rthree", 3),
+        (b"", 0),
+    ])
+    def test_get_record_count_text_counts_every_line(self, data, expected, chunk_bytes):
+        # chunk_bytes=None keeps the default, so blank lines fall inside one block
+        import cloudcat.cli as cli
+        chunk_bytes = chunk_bytes or cli._COUNT_CHUNK_BYTES
+        with patch('cloudcat.cli.get_stream', side_effect=lambda *a: io.BytesIO(data)), \
+             patch.object(cli, "_COUNT_CHUNK_BYTES", chunk_bytes):
+            assert get_record_count("s3", "bucket", "app.log", "text") == expected
+
+    @pytest.mark.parametrize("fmt,data", [
+        ("csv", b"a,b\n1,2\n3,4\n"),
+        ("json", b'{"a": 1}\n{"a": 2}\n'),
+        ("text", b"one\ntwo\n"),
+    ])
+    def test_get_record_count_decompresses_row_formats_as_it_counts(self, fmt, data):
+        import gzip
+        ext = {"csv": "csv", "json": "json", "text": "log"}[fmt]
+        with patch('cloudcat.cli.get_stream', side_effect=lambda *a: io.BytesIO(gzip.compress(data))), \
+             patch('cloudcat.cli.decompress_stream', side_effect=AssertionError("buffered")):
+            assert get_record_count("s3", "bucket", f"file.{ext}.gz", fmt) == 2
+
+    @pytest.mark.parametrize("fmt", ["parquet", "orc"])
+    def test_get_record_count_columnar_download_skips_temp_files(self, tmp_path, fmt):
+        pa = pytest.importorskip("pyarrow")
+        import gzip
+        import tempfile
+        import cloudcat.streaming
+        table = pa.table({"col1": list(range(250))})
+        buf = io.BytesIO()
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, buf)
+        else:
+            orc = pytest.importorskip("pyarrow.orc")
+            orc.write_table(table, buf)
+        path = tmp_path / f"file.{fmt}.gz"
+        path.write_bytes(gzip.compress(buf.getvalue()))
+
+        with patch.object(cloudcat.streaming, "supports_pyarrow_fs", return_value=False), \
+             patch.object(tempfile, "NamedTemporaryFile", side_effect=AssertionError("temp file")):
+            assert get_record_count("local", "", str(path), fmt) == 250
+
+    @pytest.mark.parametrize("data,expected", [
+        (b'{\n  "a": 1\n}\n', 1),
+        (b'\xef\xbb\xbf [\n  {"a": 1},\n  {"a": 2}\n]', 2),
+        (b'  \n', 0),
+    ])
+    def test_get_record_count_json_documents_download_once(self, data, expected):
+        with patch('cloudcat.cli.get_stream', side_effect=lambda *a: io.BytesIO(data)) as opened:
+            assert get_record_count("s3", "bucket", "file.json", "json") == expected
+        assert opened.call_count == 1
@@ -146,3 +146,60 @@ class TestFileFiltering:
     def test_unsupported_service_raises_error(self):
         with pytest.raises(ValueError, match="Unsupported service"):
             get_files_for_multiread("ftp", "bucket", "prefix")
+
+    @patch('cloudcat.cli.list_directory')
+    def test_format_filter_is_case_insensitive_and_compression_aware(self, mock_list_dir):
+        mock_list_dir.return_value = [
+            ("part-0.CSV.GZ", 1024),
+            ("part-1.csv.zst", 2048),
+            ("part-2.json", 4096),
+            ("part-1.csv.crc", 16),
+        ]
+
+        files = get_files_for_multiread("gcs", "bucket", "prefix", input_format="csv")
+
+        assert files == [("part-0.CSV.GZ", 1024), ("part-1.csv.zst", 2048)]
+
+    @patch('cloudcat.cli.list_directory')
+    def test_listing_is_selected_in_name_order(self, mock_list_dir):
+        mock_list_dir.return_value = [
+            ("part-2.csv", 30),
+            ("_SUCCESS", 0),
+            ("part-0.csv", 10),
+            ("part-1.csv", 20),
+        ]
+
+        files = get_files_for_multiread("s3", "bucket", "prefix", input_format="csv")
+        first, _ = find_first_non_empty_file("s3", "bucket", "prefix", quiet=True)
+
+        assert [name for name, _ in files] == ["part-0.csv", "part-1.csv", "part-2.csv"]
+        assert first == "part-0.csv"
+
+    def test_ordered_listing_stops_paging_at_the_size_cap(self):
+        mb = 1024 * 1024
+        pulled = []
+
+        def lazy_listing(service, bucket, prefix, suffixes):
+            for entry in [("a/_SUCCESS", 0), ("a/p0.csv", mb), ("a/p1.csv", mb),
+                          ("a/p2.csv", mb), ("a/p3.csv", mb)]:
+                pulled.append(entry[0])
+                yield entry
+            raise AssertionError("listed past the size cap")
+
+        with patch('cloudcat.cli.iter_directory', side_effect=lazy_listing), \
+             patch('cloudcat.cli.list_directory', side_effect=AssertionError("full listing")):
+            files = get_files_for_multiread("s3", "bucket", "a/", input_format="csv",
+                                            max_size_mb=2, stop_listing_early=True)
+
+        assert files == [("a/p0.csv", mb), ("a/p1.csv", mb)]
+        assert pulled[-1] == "a/p2.csv"
+
+    @patch('cloudcat.cli.list_directory')
+    def test_ordered_listing_without_matches_falls_back_to_full_listing(self, mock_list_dir):
+        mock_list_dir.return_value = [("a/part-0.json", 64)]
+
+        with patch('cloudcat.cli.iter_directory', return_value=iter([])):
+            files = get_files_for_multiread("gcs", "bucket", "a/", input_format="csv",
+                                            stop_listing_early=True)
+
+        assert files == [("a/part-0.json", 64)]
@@ -218,6 +218,29 @@ class TestApplyWhereFilter:
         assert len(result) == 2
         assert set(result["name"]) == {"Jane", "Alice"}
 
+    def test_text_operators_match_literally_and_skip_missing(self):
+        df = pd.DataFrame({"path": ["a.b(1)", "axb", None], "n": [10, 21, 30]})
+        assert apply_where_filter(df, "path contains .b(").index.tolist() == [0]
+        assert apply_where_filter(df, "path contains none").empty
+        assert apply_where_filter(df, "path endswith B(1)").index.tolist() == [0]
+        # Non-string columns are still compared on their text form.
+        assert apply_where_filter(df, "n startswith 2").index.tolist() == [1]
+
+    def test_expression_is_parsed_once_across_chunks(self, sample_df):
+        from unittest.mock import patch
+        import cloudcat.filtering as filtering
+        filtering._parse_where_groups.cache_clear()
+        with patch.object(filtering, "parse_where_clause", wraps=filtering.parse_where_clause) as parse:
+            for _ in range(3):
+                apply_where_filter(sample_df, "city=NYC AND name startswith j")
+        assert parse.call_count == 2
+        # Callers get a fresh, mutable copy of the cached parse.
+        groups = filtering.parse_where_expression("city=NYC AND name startswith j")
+        groups[0].append(("x", "=", "1"))
+        assert filtering.parse_where_expression("city=NYC AND name startswith j") == [
+            [("city", "=", "NYC"), ("name", "startswith", "j")]
+        ]
+
 
 class TestWhereClauseUppercaseOperators:
     """Tests for WHERE clause with uppercase operators."""
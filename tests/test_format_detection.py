@@ -63,3 +63,8 @@ class TestFormatDetection:
         assert detect_format_from_path("data.backup.csv") == "csv"
         assert detect_format_from_path("file.v1.2.json") == "json"
         assert detect_format_from_path("table.final.parquet") == "parquet"
+
+    def test_spark_snappy_codec_names(self):
+        assert detect_format_from_path("part-00000-abc.snappy.parquet") == "parquet"
+        assert detect_format_from_path("part-00000.parquet.snappy") == "parquet"
+        assert detect_format_from_path("part-00000.snappy.orc") == "orc"
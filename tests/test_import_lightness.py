@@ -21,6 +21,9 @@ HEAVY_MODULES = (
     "tabulate",
     "deltalake",
     "pyiceberg",
+    "zstandard",
+    "lz4",
+    "snappy",
 )
 
 CHECK = (
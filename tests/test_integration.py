@@ -159,4 +159,218 @@ class TestIntegration:
             read_data_from_multiple_files(
                 "ftp", "bucket", file_list, "csv", 0, None
             )
-        assert "Unsupported service: ftp" in str(excinfo.value)
\ No newline at end of file
+        assert "Unsupported service: ftp" in str(excinfo.value)
+
+    def test_multifile_downloads_overlap_and_keep_order(self):
+        import threading
+        import cloudcat.cli as cli
+
+        # Every download blocks until all three are in flight at once, so a
+        # sequential implementation would break the barrier.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_stream(service, bucket, path):
+            barrier.wait()
+            return io.BytesIO(f"n\n{path[1]}\n".encode())
+
+        file_list = [("f1.csv", 4), ("f2.csv", 4), ("f3.csv", 4)]
+        with patch.object(cli, "get_stream", fake_stream):
+            result_df, _, total_rows = read_data_from_multiple_files(
+                "s3", "bucket", file_list, "csv", 0, None
+            )
+
+        assert list(result_df["n"]) == [1, 2, 3]
+        assert total_rows == 3
+
+    def test_row_limited_multifile_read_stops_pulling_bytes(self):
+        import cloudcat.cli as cli
+
+        class NetworkBody:
+            """Lazy body like an S3 StreamingBody: counts bytes pulled."""
+            def __init__(self, data):
+                self._buf = io.BytesIO(data)
+                self.pulled = 0
+
+            def read(self, n=-1):
+                chunk = self._buf.read(n)
+                self.pulled += len(chunk)
+                return chunk
+
+        data = b"n\n" + b"".join(b"%d\n" % i for i in range(200_000))
+        bodies = []
+
+        def fake_stream(service, bucket, path):
+            bodies.append(NetworkBody(data))
+            return bodies[-1]
+
+        file_list = [("f1.csv", len(data)), ("f2.csv", len(data))]
+        with patch.object(cli, "get_stream", fake_stream):
+            result_df, _, _ = read_data_from_multiple_files(
+                "s3", "bucket", file_list, "csv", 5, None
+            )
+
+        assert list(result_df["n"]) == [0, 1, 2, 3, 4]
+        assert all(body.pulled < len(data) for body in bodies)
+
+    @patch('cloudcat.cli.get_stream')
+    @patch('cloudcat.readers.read_csv_data')
+    def test_limit_trims_frames_before_concat(self, mock_read_csv, mock_get_stream):
+        mock_get_stream.side_effect = [io.StringIO(), io.StringIO()]
+        df1 = pd.DataFrame({"id": [1, 2, 3]})
+        df2 = pd.DataFrame({"id": [4, 5, 6]})
+        schema = pd.Series({"id": "int64"})
+        mock_read_csv.side_effect = [(df1, schema), (df2, schema)]
+
+        file_list = [("file1.csv", 1024), ("file2.csv", 1024)]
+        with patch('pandas.concat', wraps=pd.concat) as spy:
+            result_df, _, _ = read_data_from_multiple_files(
+                "gcs", "bucket", file_list, "csv", 4, None, offset=1
+            )
+
+        assert list(result_df["id"]) == [2, 3, 4, 5]
+        assert list(result_df.index) == [0, 1, 2, 3]
+        assert sum(len(frame) for frame in spy.call_args.args[0]) == 4
+
+    @patch('cloudcat.cli.get_stream')
+    @patch('cloudcat.readers.read_csv_data')
+    def test_single_frame_skips_concat(self, mock_read_csv, mock_get_stream):
+        mock_get_stream.side_effect = [io.StringIO(), io.StringIO()]
+        df1 = pd.DataFrame({"id": [1, 2, 3]})
+        mock_read_csv.side_effect = [(df1, df1.dtypes), (df1, df1.dtypes)]
+
+        with patch('pandas.concat', side_effect=AssertionError("concat")):
+            result_df, _, _ = read_data_from_multiple_files(
+                "gcs", "bucket", [("a.csv", 1), ("b.csv", 1)], "csv", 2, None, offset=1
+            )
+
+        assert list(result_df["id"]) == [2, 3]
+        assert list(result_df.index) == [0, 1]
+
+    def test_row_limited_parquet_preview_reads_in_place(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+        import cloudcat.cli as cli
+
+        file_list = []
+        for i in range(3):
+            path = tmp_path / f"part-{i}.parquet"
+            pq.write_table(pa.table({"id": list(range(i * 100, i * 100 + 100))}), path,
+                           row_group_size=10)
+            file_list.append((str(path), path.stat().st_size))
+
+        opened = []
+        real_parquet_file = pq.ParquetFile
+
+        def tracking_parquet_file(source, *args, **kwargs):
+            opened.append(source)
+            return real_parquet_file(source, *args, **kwargs)
+
+        with patch.object(cli, "get_stream", side_effect=AssertionError("full download")), \
+             patch.object(pq, "ParquetFile", tracking_parquet_file):
+            result_df, _, _ = read_data_from_multiple_files(
+                "local", "", file_list, "parquet", 5, None, offset=98
+            )
+
+        assert list(result_df["id"]) == [98, 99, 100, 101, 102]
+        assert set(opened) == {file_list[0][0], file_list[1][0]}
+
+    def test_offset_skips_columnar_files_by_footer_count(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+        import cloudcat.readers.parquet as parquet_reader
+
+        file_list = []
+        for i in range(3):
+            path = tmp_path / f"part-{i}.parquet"
+            pq.write_table(pa.table({"id": list(range(i * 100, i * 100 + 100))}), path)
+            file_list.append((str(path), path.stat().st_size))
+
+        read_paths = []
+        real_read = parquet_reader._read_with_native_fs
+
+        def tracking_read(filesystem, path, *args, **kwargs):
+            read_paths.append(path)
+            return real_read(filesystem, path, *args, **kwargs)
+
+        with patch.object(parquet_reader, "_read_with_native_fs", tracking_read):
+            result_df, full_schema, _ = read_data_from_multiple_files(
+                "local", "", file_list, "parquet", 3, None, offset=250
+            )
+
+        assert list(result_df["id"]) == [250, 251, 252]
+        assert read_paths == [file_list[2][0]]
+        assert list(full_schema.index) == ["id"]
+
+    @patch('cloudcat.cli.get_stream')
+    @patch('cloudcat.readers.read_csv_data')
+    def test_schema_merge_promotes_numeric_mismatches(self, mock_read_csv, mock_get_stream):
+        mock_get_stream.side_effect = [io.StringIO(), io.StringIO(), io.StringIO()]
+        df1 = pd.DataFrame({"id": [1], "score": [10], "tag": ["a"]})
+        df2 = pd.DataFrame({"id": [2], "score": [9.5], "tag": [True]})
+        mock_read_csv.side_effect = [(df1, df1.dtypes), (df2, df2.dtypes), (df1, df1.dtypes)]
+
+        file_list = [("f1.csv", 1), ("f2.csv", 1), ("f3.csv", 1)]
+        result_df, full_schema, _ = read_data_from_multiple_files(
+            "gcs", "bucket", file_list, "csv", 0, None
+        )
+
+        assert full_schema["id"] == result_df["id"].dtype
+        assert full_schema["score"] == result_df["score"].dtype == "float64"
+        assert full_schema["tag"] == "object"
+
+    def test_downloaded_columnar_files_are_decoded_concurrently(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        import gzip
+        import threading
+        import pyarrow.parquet as pq
+        import cloudcat.readers as readers
+
+        file_list = []
+        for i in range(2):
+            buf = io.BytesIO()
+            pq.write_table(pa.table({"id": [i * 10, i * 10 + 1]}), buf)
+            path = tmp_path / f"part-{i}.parquet.gz"
+            path.write_bytes(gzip.compress(buf.getvalue()))
+            file_list.append((str(path), path.stat().st_size))
+
+        # Both decodes must be in flight at once to get past the barrier.
+        barrier = threading.Barrier(2, timeout=10)
+        real_read = readers.read_parquet_table
+
+        def overlapping_read(*args, **kwargs):
+            barrier.wait()
+            return real_read(*args, **kwargs)
+
+        with patch.object(readers, "read_parquet_table", overlapping_read):
+            result_df, _, total_rows = read_data_from_multiple_files(
+                "local", "", file_list, "parquet", 0, None, quiet=True
+            )
+
+        assert list(result_df["id"]) == [0, 1, 10, 11]
+        assert total_rows == 4
+
+    @pytest.mark.parametrize("tables,arrow_concat", [
+        ([{"id": [1, 2], "name": ["a", "b"]}, {"id": [3]}], True),  # missing column
+        ([{"id": [1, 2]}, {"id": [2.5]}], False),  # int64 + float64: pandas promotes
+    ])
+    def test_downloaded_columnar_files_concat_once_like_pandas(self, tmp_path, tables, arrow_concat):
+        pa = pytest.importorskip("pyarrow")
+        import gzip
+        import pyarrow.parquet as pq
+
+        file_list = []
+        for i, columns in enumerate(tables):
+            buf = io.BytesIO()
+            pq.write_table(pa.table(columns), buf)
+            path = tmp_path / f"part-{i}.parquet.gz"
+            path.write_bytes(gzip.compress(buf.getvalue()))
+            file_list.append((str(path), path.stat().st_size))
+        expected = pd.concat([pd.DataFrame(columns) for columns in tables], ignore_index=True)
+
+        with patch.object(pd, "concat", wraps=pd.concat) as pandas_concat:
+            result_df, _, total_rows = read_data_from_multiple_files(
+                "local", "", file_list, "parquet", 0, None, quiet=True
+            )
+
+        pd.testing.assert_frame_equal(result_df, expected)
+        assert pandas_concat.called != arrow_concat
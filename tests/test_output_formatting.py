@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import json
-from cloudcat.formatters import format_table_with_colored_header, colorize_json
+from cloudcat.formatters import format_table_with_colored_header, colorize_json, iter_colorized_json_array
 
 
 class TestOutputFormatting:
@@ -101,4 +101,37 @@ class TestOutputFormatting:
         assert "95.5" in result
         assert "87.2" in result
         assert "100" in result
-        assert "200" in result
\ No newline at end of file
+        assert "200" in result
+
+    def test_iter_colorized_json_array_matches_colorize_json(self):
+        data = [{"name": "John", "tags": ["a", "b"]}, {"name": None, "tags": []}]
+
+        assert "".join(iter_colorized_json_array(data)) == colorize_json(json.dumps(data))
+        assert "".join(iter_colorized_json_array([])) == colorize_json("[]")
+
+    def test_colorize_json_matches_indented_dumps(self):
+        import re
+        data = {"s": "a\"b\\é\n", "i": 10**20, "f": 1.5, "nan": float("nan"),
+                "t": True, "n": None, "nested": [{}, [], [False, -3, "x"]]}
+        plain = re.sub(r"\x1b\[[0-9;]*m", "", colorize_json(json.dumps(data)))
+        assert plain == json.dumps(data, indent=2)
+
+    def test_plain_table_layout_matches_tabulate(self):
+        from tabulate import tabulate
+        from cloudcat.formatters import _column_kind, _format_table_cell
+        df = pd.DataFrame({
+            "id": [1, 22, 333],
+            "a_long_header": ["x", None, "yy"],
+            "ok": pd.array([True, None, False], dtype="boolean"),
+            "f": [1.5, float("nan"), -2.25],
+        })
+        kinds = [_column_kind(dtype) for dtype in df.dtypes]
+        expected = tabulate(
+            [[_format_table_cell(v, k) for v, k in zip(row, kinds)]
+             for row in df.itertuples(index=False, name=None)],
+            [f"\x1b[36m\x1b[1m{col}\x1b[0m" for col in df.columns],
+            tablefmt="rounded_outline",
+            colalign=["right" if k == "num" else "left" for k in kinds],
+            disable_numparse=True,
+        )
+        assert format_table_with_colored_header(df) == expected
@@ -57,3 +57,73 @@ def test_jsonlines_streaming():
         df, schema, stats = cli.read_data_streaming("gcs", "b", "f.json", "json", 2, None, None, 0)
     assert len(df) == 2
     assert df.iloc[0]["a"] == 1
+
+
+def test_custom_delimiter_is_bound_for_csv():
+    tsv = CSV.replace(b",", b"\t")
+    with patch.object(cli, "get_stream", lambda s, b, p: io.BytesIO(tsv)), \
+         patch.object(cli, "get_file_size", lambda s, b, p: len(tsv)):
+        df, _, _ = cli.read_data_streaming("s3", "bucket", "f.tsv", "csv", 2, None, "\t")
+    assert list(df.columns) == ["name", "age", "city"]
+
+
+def test_unsupported_format_fails_before_opening_the_object():
+    with patch.object(cli, "get_stream", side_effect=AssertionError("opened")), \
+         patch.object(cli, "get_file_size", side_effect=AssertionError("stat")):
+        with pytest.raises(ValueError, match="Unsupported format: xml"):
+            cli.read_data_streaming("s3", "bucket", "f.xml", "xml", 2)
+
+
+def test_multi_file_unsupported_format_fails_before_any_download():
+    with patch.object(cli, "get_stream", side_effect=AssertionError("opened")):
+        with pytest.raises(ValueError, match="Unsupported format: xml"):
+            cli.read_data_from_multiple_files("s3", "bucket", [("a.xml", 1), ("b.xml", 1)], "xml", 2)
+
+
+@pytest.mark.parametrize("fmt,data,expected", [
+    ("csv", CSV, ["Bob", "Amy"]),
+    ("csv", b'name\n"John"\n"Jane"\n"Bob"\n"Amy"\n', ["Bob", "Amy"]),  # quoted: parsed
+    ("json", JSONL, [3, 4]),
+    ("text", b"a\nb\nc\nd\n", ["c", "d"]),
+])
+def test_offset_rows_are_skipped_without_parsing(fmt, data, expected):
+    path = {"csv": "f.csv", "json": "f.json", "text": "f.log"}[fmt]
+    with patch.object(cli, "get_stream", lambda s, b, p: io.BytesIO(data)), \
+         patch.object(cli, "get_file_size", lambda s, b, p: len(data)):
+        df, _, stats = cli.read_data_streaming("s3", "bucket", path, fmt, 2, None, None, 2)
+    assert list(df.iloc[:, 0]) == expected
+    assert stats.bytes_read == len(data)
+    # Only the requested page is handed to the parser (quotes force a parse).
+    assert stats.rows_requested == (4 if fmt == "csv" and b'"' in data else 2)
+    if fmt == "text":
+        assert list(df["line_number"]) == [3, 4]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "orc"])
+def test_columnar_preview_without_native_fs_uses_range_reads(fmt):
+    pa = pytest.importorskip("pyarrow")
+    import cloudcat.streaming
+    table = pa.table({"a": list(range(50000)), "b": [str(i) * 5 for i in range(50000)]})
+    buf = io.BytesIO()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(table, buf, row_group_size=5000)
+    else:
+        orc = pytest.importorskip("pyarrow.orc")
+        orc.write_table(table, buf, stripe_size=64 * 1024)
+    data = buf.getvalue()
+    fetched = []
+
+    def get_range(service, bucket, path, start, end):
+        fetched.append(end - start)
+        return data[start:end]
+
+    with patch.object(cloudcat.streaming, "supports_pyarrow_fs", return_value=False), \
+         patch.object(cli, "get_range", get_range), \
+         patch.object(cli, "get_file_size", lambda s, b, p: len(data)), \
+         patch.object(cli, "get_stream", side_effect=AssertionError("full download")):
+        df, schema, stats = cli.read_data_streaming("azure", "c", f"f.{fmt}", fmt, 3, "b", None, 1)
+
+    assert df["b"].tolist() == ["11111", "22222", "33333"]
+    assert list(schema.index) == ["a", "b"]
+    assert stats.bytes_read == sum(fetched) < len(data) / 2
@@ -5,6 +5,7 @@ writing a small file in each format and reading it back.
 """
 
 import io
+import json
 import pytest
 import pandas as pd
 
@@ -16,6 +17,8 @@ from cloudcat.readers import (
     read_orc_data,
     read_text_data,
 )
+from cloudcat.readers.avro import read_avro_data_streaming
+from cloudcat.readers.json import read_json_data_streaming
 
 SAMPLE = pd.DataFrame({
     "a": [1, 2, 3, 4, 5],
@@ -33,6 +36,19 @@ def test_csv_roundtrip_row_limit_and_columns():
     assert set(schema.index) == {"a", "b", "c"}
 
 
+@pytest.mark.parametrize("sample_bytes", [1024 * 1024, 16])
+def test_csv_column_pushdown_keeps_full_schema(sample_bytes, monkeypatch):
+    import cloudcat.readers.csv as csv_reader
+    monkeypatch.setattr(csv_reader, "_SCHEMA_SAMPLE_ROWS", 2)
+    monkeypatch.setattr(csv_reader, "_SCHEMA_SAMPLE_BYTES", sample_bytes)
+    content = SAMPLE.to_csv(index=False).encode()
+    df, schema = read_csv_data(io.BytesIO(content), 0, "c,a")
+    assert list(df.columns) == ["c", "a"]
+    assert df["a"].tolist() == SAMPLE["a"].tolist()
+    assert list(schema.index) == ["a", "b", "c"]
+    assert schema["c"] == SAMPLE["c"].dtype
+
+
 def test_json_array_roundtrip():
     content = SAMPLE.to_json(orient="records").encode()
     df, _ = read_json_data(io.BytesIO(content), 3, "a")
@@ -40,12 +56,64 @@ def test_json_array_roundtrip():
     assert list(df.columns) == ["a"]
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_array_parses_the_same_with_or_without_orjson(use_orjson, monkeypatch):
+    import cloudcat.readers.json as json_reader
+    if use_orjson and not json_reader.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(json_reader, "orjson", None)
+    # NaN is stdlib-only JSON; orjson rejects it and must fall back.
+    content = b'[{"a": 1, "b": NaN}, {"a": 2, "b": 0.5}]'
+    df, _ = read_json_data(io.BytesIO(content), 0)
+    assert list(df["a"]) == [1, 2]
+    assert df["b"].isna().tolist() == [True, False]
+
+
+def test_json_array_bytes_are_parsed_without_decoding():
+    content = '[{"a": "é"}, {"a": "\xff"}]'.encode("utf-8")
+    df, _ = read_json_data(io.BytesIO(content), 0)
+    assert df["a"].tolist() == ["é", "\xff"]
+    # Invalid UTF-8 still degrades to replacement characters.
+    df, _ = read_json_data(io.BytesIO(b'[{"a": "\xff"}]'), 0)
+    assert df["a"].tolist() == ["\ufffd"]
+
+
+def test_json_array_column_pushdown_keeps_full_schema(monkeypatch):
+    import cloudcat.readers.json as json_reader
+    monkeypatch.setattr(json_reader, "_SCHEMA_SAMPLE_ROWS", 2)
+    content = SAMPLE.to_json(orient="records").encode()
+    df, schema = read_json_data(io.BytesIO(content), 4, "c")
+    assert df["c"].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert set(schema.index) == {"a", "b", "c"}
+
+
 def test_jsonlines_roundtrip():
     content = SAMPLE.to_json(orient="records", lines=True).encode()
     df, _ = read_json_data(io.BytesIO(content), 2)
     assert len(df) == 2
 
 
+@pytest.mark.parametrize("prefix", [b"\xef\xbb\xbf", b"\r\n\n  ", b"\xef\xbb\xbf\n"])
+def test_jsonlines_with_leading_blanks_still_stream(prefix):
+    content = prefix + b"".join(b'{"a": %d}\n' % i for i in range(5000))
+    df, _, stats = read_json_data_streaming(io.BytesIO(content), 2)
+    assert df["a"].tolist() == [0, 1]
+    assert stats.is_streaming
+    assert len(prefix) < stats.bytes_read < len(content) / 10
+
+
+@pytest.mark.parametrize("where", [None, "n != 0"])
+def test_jsonlines_values_match_the_array_reading(where):
+    records = [{"zip": "00501", "created_at": "2024-01-01", "n": 1},
+               {"zip": "02134", "created_at": "2024-01-02", "n": 2}]
+    lines = "\n".join(json.dumps(r) for r in records)
+    df, _, _ = read_json_data_streaming(io.BytesIO(lines.encode()), 0, where=where)
+    array, _ = read_json_data(io.BytesIO(json.dumps(records).encode()), 0)
+    pd.testing.assert_frame_equal(df.reset_index(drop=True), array)
+    assert df["zip"].tolist() == ["00501", "02134"]
+
+
 def test_parquet_roundtrip_row_limit_and_columns():
     pa = pytest.importorskip("pyarrow")
     import pyarrow.parquet as pq
@@ -59,6 +127,32 @@ def test_parquet_roundtrip_row_limit_and_columns():
     assert set(schema.index) == {"a", "b", "c"}
 
 
+def test_parquet_stream_is_read_in_memory(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+    import tempfile
+    buf = io.BytesIO()
+    pq.write_table(pa.Table.from_pandas(SAMPLE), buf)
+    buf.seek(0)
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile",
+                        lambda *a, **k: pytest.fail("temp file written"))
+    df, _ = read_parquet_data(buf, 0)
+    assert df["b"].tolist() == SAMPLE["b"].tolist()
+
+
+def test_parquet_preview_decodes_only_the_rows_it_needs(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+    buf = io.BytesIO()
+    big = pd.DataFrame({"a": range(1000), "b": [str(i) for i in range(1000)]})
+    pq.write_table(pa.Table.from_pandas(big), buf, row_group_size=400)
+    monkeypatch.setattr(pq.ParquetFile, "read_row_group",
+                        lambda *a, **k: pytest.fail("whole row group decoded"))
+    buf.seek(0)
+    df, _ = read_parquet_data(buf, 3, "b")
+    assert df["b"].tolist() == ["0", "1", "2"]
+
+
 def test_orc_roundtrip_row_limit_and_columns():
     pa = pytest.importorskip("pyarrow")
     import pyarrow.orc as orc
@@ -71,6 +165,56 @@ def test_orc_roundtrip_row_limit_and_columns():
     assert set(schema.index) == {"a", "b", "c"}
 
 
+@pytest.mark.parametrize("where", [None, "a >= 0"])
+@pytest.mark.parametrize("probe_bytes,projected", [(1 << 20, True), (16, False)])
+def test_avro_columns_are_projected_while_decoding(monkeypatch, probe_bytes, projected, where):
+    fastavro = pytest.importorskip("fastavro")
+    import cloudcat.readers.avro as avro_reader
+    schema = {
+        "type": "record",
+        "name": "r",
+        "fields": [
+            {"name": "a", "type": "int"},
+            {"name": "b", "type": "string"},
+            {"name": "c", "type": "double"},
+        ],
+    }
+    buf = io.BytesIO()
+    fastavro.writer(buf, schema, SAMPLE.to_dict("records"))
+    buf.seek(0)
+    reader_schemas = []
+    real_reader = fastavro.reader
+
+    def reader(fo, reader_schema=None, **kwargs):
+        reader_schemas.append(reader_schema)
+        return real_reader(fo, reader_schema=reader_schema, **kwargs)
+
+    monkeypatch.setattr(avro_reader, "_PROJECTION_PROBE_BYTES", probe_bytes)
+    monkeypatch.setattr(fastavro, "reader", reader)
+    df, full_schema, _ = read_avro_data_streaming(buf, 0, "c,a", where=where)
+    assert list(df.columns) == ["a", "c"]
+    assert df["c"].tolist() == SAMPLE["c"].tolist()
+    assert set(full_schema.index) == {"a", "b", "c"}
+    used = reader_schemas[-1]
+    assert (used is not None and [f["name"] for f in used["fields"]] == ["a", "c"]) == projected
+
+
+def test_orc_stream_is_read_once_in_memory(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.orc as orc
+    import tempfile
+    buf = io.BytesIO()
+    orc.write_table(pa.Table.from_pandas(SAMPLE), buf)
+    buf.seek(0)
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile",
+                        lambda *a, **k: pytest.fail("temp file written"))
+    monkeypatch.setattr(orc.ORCFile, "read",
+                        lambda *a, **k: pytest.fail("whole file decoded"))
+    df, schema = read_orc_data(buf, 2, "b")
+    assert df["b"].tolist() == SAMPLE["b"].tolist()[:2]
+    assert set(schema.index) == {"a", "b", "c"}
+
+
 def test_avro_roundtrip_row_limit_and_columns():
     fastavro = pytest.importorskip("fastavro")
     schema = {
@@ -88,6 +232,43 @@ def test_avro_roundtrip_row_limit_and_columns():
     df, _ = read_avro_data(buf, 2, "a")
     assert len(df) == 2
     assert list(df.columns) == ["a"]
+    buf.seek(0)
+    df, schema = read_avro_data(buf, 0, "c,a")
+    assert list(df.columns) == ["a", "c"]  # record field order, as before
+    assert df["a"].tolist() == SAMPLE["a"].tolist()
+    assert set(schema.index) == {"a", "b", "c"}
+
+
+@pytest.mark.parametrize("extra_field,via_arrow", [
+    ({"name": "d", "type": ["null", "long"]}, True),
+    ({"name": "d", "type": {"type": "array", "items": "long"}}, False),
+])
+def test_avro_frame_matches_pandas_construction(monkeypatch, extra_field, via_arrow):
+    fastavro = pytest.importorskip("fastavro")
+    pytest.importorskip("pyarrow")
+    import cloudcat.readers.avro as avro_reader
+    schema = {
+        "type": "record",
+        "name": "r",
+        "fields": [
+            {"name": "a", "type": ["null", "string"]},
+            {"name": "b", "type": ["boolean", "null"]},
+            extra_field,
+        ],
+    }
+    nested = extra_field["type"] != ["null", "long"]
+    records = [{"a": "x", "b": True, "d": [1] if nested else 1},
+               {"a": None, "b": None, "d": [] if nested else None}]
+    buf = io.BytesIO()
+    fastavro.writer(buf, schema, records)
+    assert avro_reader._is_arrow_safe(extra_field["type"]) == via_arrow
+    buf.seek(0)
+    df, _ = read_avro_data(buf, 0)
+    pd.testing.assert_frame_equal(df, pd.DataFrame(records))
+    monkeypatch.setattr(avro_reader, "pa", None)
+    buf.seek(0)
+    df, _ = read_avro_data(buf, 0)
+    pd.testing.assert_frame_equal(df, pd.DataFrame(records))
 
 
 def test_avro_roundtrip_from_file_path(tmp_path):
@@ -120,3 +301,77 @@ def test_text_non_utf8_degrades_gracefully():
     stream = io.BytesIO(b"good line\n\xff\xfe bad bytes\n")
     df, _ = read_text_data(stream, 0)
     assert len(df) == 2  # both lines present, no UnicodeDecodeError
+
+
+@pytest.mark.parametrize("data", [
+    b"a\nb\r\n\n  c",
+    b"caf\xc3\xa9\n\xef\xbb\xbfx\n",
+    b"a\rb\x0cc\xe2\x80\xa8d\n",  # other splitlines() breaks
+    b"",
+])
+def test_text_read_all_splits_like_splitlines(data):
+    expected = data.decode("utf-8").splitlines()
+    df, schema = read_text_data(io.BytesIO(data), 0)
+    assert list(df["line"]) == expected
+    assert list(df["line_number"]) == list(range(1, len(expected) + 1))
+    assert schema["line_number"] == "int64"
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 3, 7])
+def test_text_read_all_in_chunks_matches_one_read(chunk_bytes, monkeypatch):
+    import cloudcat.readers.text as text_reader
+    data = b"first line\r\nsecond\n\ncaf\xc3\xa9 \xe2\x82\xac\nno newline at end"
+    expected, _ = read_text_data(io.BytesIO(data), 0)
+    monkeypatch.setattr(text_reader, "_READ_CHUNK_BYTES", chunk_bytes)
+    df, _ = read_text_data(io.BytesIO(data), 0)
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_arrow_schema_to_pandas_dtypes_matches_a_decoded_frame():
+    pa = pytest.importorskip("pyarrow")
+    from cloudcat.readers.schema import arrow_schema_to_pandas_dtypes
+    table = pa.Table.from_pandas(SAMPLE, preserve_index=False)
+    dtypes = arrow_schema_to_pandas_dtypes(table.schema)
+    assert dtypes.to_dict() == table.to_pandas().dtypes.to_dict()
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "orc"])
+def test_in_memory_buffer_is_read_in_place_and_released(fmt):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.Table.from_pandas(SAMPLE, preserve_index=False)
+    buf = io.BytesIO()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(table, buf)
+        read = read_parquet_data
+    else:
+        orc = pytest.importorskip("pyarrow.orc")
+        orc.write_table(table, buf)
+        read = read_orc_data
+    buf.seek(0)
+    df, _ = read(buf, 0, "b")
+    assert df["b"].tolist() == SAMPLE["b"].tolist()
+    buf.close()  # raises BufferError if a view of the buffer were still held
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "orc"])
+def test_empty_file_keeps_projected_columns_without_reading(fmt, monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.Table.from_pandas(SAMPLE.head(0), preserve_index=False)
+    buf = io.BytesIO()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(table, buf)
+        monkeypatch.setattr(pq.ParquetFile, "read",
+                            lambda *a, **k: pytest.fail("whole file read"))
+        read = read_parquet_data
+    else:
+        orc = pytest.importorskip("pyarrow.orc")
+        orc.write_table(table, buf)
+        monkeypatch.setattr(orc.ORCFile, "read",
+                            lambda *a, **k: pytest.fail("whole file read"))
+        read = read_orc_data
+    buf.seek(0)
+    df, schema = read(buf, 5, "c,a")
+    assert list(df.columns) == ["c", "a"]
+    assert df.dtypes.to_dict() == schema[["c", "a"]].to_dict()
@@ -7,6 +7,8 @@ no network or credentials are needed.
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from cloudcat.storage import s3 as s3mod
 from cloudcat.storage import gcs as gcsmod
 
@@ -44,6 +46,31 @@ class TestS3Listing:
         assert ("dir/", 0) not in result
         assert ("dir/b.csv", 20) in result
 
+    def test_client_pool_covers_concurrent_downloads(self):
+        from cloudcat.config import MULTIREAD_WORKERS
+        s3mod._build_s3_client.cache_clear()
+        with patch.object(s3mod.boto3, "client") as make_client:
+            s3mod.get_s3_client()
+        s3mod._build_s3_client.cache_clear()
+        _, kwargs = make_client.call_args
+        assert kwargs["config"].max_pool_connections > MULTIREAD_WORKERS
+
+    def test_client_is_built_once_per_profile(self):
+        from cloudcat.config import cloud_config
+        s3mod._build_s3_client.cache_clear()
+        with patch.object(s3mod.boto3, "client") as make_client, \
+             patch.object(s3mod.boto3, "Session") as make_session:
+            first = s3mod.get_s3_client()
+            assert s3mod.get_s3_client() is first
+            cloud_config.aws_profile = "other"
+            try:
+                assert s3mod.get_s3_client() is not first
+            finally:
+                cloud_config.aws_profile = None
+        s3mod._build_s3_client.cache_clear()
+        assert make_client.call_count == 1
+        assert make_session.call_count == 1
+
 
 class TestGCSListing:
     def _bucket_with_blobs(self, blobs):
@@ -73,3 +100,118 @@ class TestGCSListing:
             gcsmod.list_gcs_directory("bucket", "dir")
         _, kwargs = bucket.list_blobs.call_args
         assert kwargs["prefix"] == "dir/"
+
+    def test_suffixes_filter_case_insensitively(self):
+        client, bucket = self._bucket_with_blobs(
+            [("dir/a.CSV", 10), ("dir/b.csv.gz", 20), ("dir/_SUCCESS", 0), ("dir/c.json", 5)]
+        )
+        with patch.object(gcsmod, "get_gcs_client", return_value=client):
+            result = gcsmod.list_gcs_directory("bucket", "dir/", (".csv", ".csv.gz"))
+        assert result == [("dir/a.CSV", 10), ("dir/b.csv.gz", 20)]
+
+
+class TestFormatFilteredListing:
+    def test_local_listing_keeps_only_matching_suffixes(self, tmp_path):
+        from cloudcat.storage import list_directory
+        (tmp_path / "a.csv").write_text("x\n1\n")
+        (tmp_path / "b.json").write_text("{}\n")
+        result = list_directory("local", "", str(tmp_path) + "/", (".csv",))
+        assert [name for name, _ in result] == [str(tmp_path / "a.csv")]
+
+    def test_explicit_format_lists_with_suffixes_and_falls_back(self):
+        from cloudcat import cli
+        calls = []
+
+        def fake_list(service, bucket, prefix, suffixes=None):
+            calls.append(suffixes)
+            return [] if suffixes else [("dir/a.json", 10)]
+
+        with patch.object(cli, "list_directory", fake_list):
+            files = cli.get_files_for_multiread("s3", "b", "dir/", "csv", quiet=True)
+        assert calls[0] == cli._FORMAT_SUFFIXES["csv"]
+        assert calls[1] is None
+        assert files == [("dir/a.json", 10)]
+
+    def test_filtered_request_reuses_cached_full_listing(self):
+        from cloudcat import cli
+        calls = []
+
+        def fake_list(service, bucket, prefix, suffixes=None):
+            calls.append(suffixes)
+            return [("dir/a.csv", 10), ("dir/b.json", 10)]
+
+        with patch.object(cli, "list_directory", fake_list), \
+             patch.object(cli, "_listing_cache", {}):
+            cli.find_first_non_empty_file("s3", "b", "dir/", quiet=True)
+            files = cli.get_files_for_multiread("s3", "b", "dir/", "csv", quiet=True)
+        assert calls == [None]
+        assert files == [("dir/a.csv", 10)]
+
+
+class TestObjectStreams:
+    def test_gcs_stream_reads_lazily_in_chunks(self):
+        client = MagicMock()
+        blob = client.bucket.return_value.blob.return_value
+        with patch.object(gcsmod, "get_gcs_client", return_value=client):
+            stream = gcsmod.get_gcs_stream("bucket", "dir/a.csv")
+        assert stream is blob.open.return_value
+        blob.open.assert_called_once_with("rb", chunk_size=gcsmod._STREAM_CHUNK_BYTES)
+        blob.download_to_file.assert_not_called()
+
+    def test_azure_download_is_streamed_chunk_by_chunk(self):
+        from cloudcat.storage import azure as azuremod
+        downloader = MagicMock()
+        downloader.chunks.return_value = iter([b"a,b\n1,", b"", b"2\n3,4\n"])
+        stream = azuremod._stream_download(downloader)
+        assert stream.read(2) == b"a,"
+        assert stream.read() == b"b\n1,2\n3,4\n"
+        downloader.readall.assert_not_called()
+
+    def test_azure_whole_read_downloads_concurrently(self):
+        from cloudcat.storage import azure as azuremod
+        client = MagicMock()
+        file_client = client.get_file_system_client.return_value.get_file_client.return_value
+        file_client.download_file.return_value.readall.return_value = b"a,b\n1,2\n"
+        with patch.object(azuremod, "HAS_AZURE_DATALAKE", True), \
+             patch.object(azuremod, "get_azure_datalake_service_client", return_value=client):
+            stream = azuremod.get_azure_stream("fs", "dir/a.csv")
+        assert stream.read() == b"a,b\n1,2\n"
+        file_client.download_file.assert_called_once_with(max_concurrency=azuremod._DOWNLOAD_CONCURRENCY)
+        file_client.download_file.return_value.chunks.assert_not_called()
+
+    def test_azure_client_pool_covers_concurrent_downloads(self):
+        from cloudcat.config import MULTIREAD_WORKERS
+        from cloudcat.storage import azure as azuremod
+        if not azuremod.HAS_AZURE_BLOB:
+            pytest.skip("azure-storage-blob not installed")
+        azuremod._build_blob_client.cache_clear()
+        client = azuremod._build_blob_client("https://acct.blob.core.windows.net", "a2V5")
+        azuremod._build_blob_client.cache_clear()
+        adapter = client._pipeline._transport.session.get_adapter("https://acct.blob.core.windows.net")
+        assert adapter._pool_maxsize > MULTIREAD_WORKERS * azuremod._DOWNLOAD_CONCURRENCY
+
+    def test_azure_transport_falls_back_to_sdk_default(self):
+        from cloudcat.storage import azure as azuremod
+        pytest.importorskip("azure.core")
+        with patch("azure.core.pipeline.transport.RequestsTransport", side_effect=TypeError("changed")):
+            assert azuremod._transport_options() == {}
+
+    def test_s3_whole_read_of_large_object_uses_ranged_download(self):
+        client = MagicMock()
+        body = MagicMock()
+        body.read.side_effect = lambda amt=None: b"x" * (amt or 0)
+        client.get_object.return_value = {"Body": body, "ContentLength": s3mod._MULTIPART_THRESHOLD}
+        client.download_fileobj.side_effect = lambda b, k, f, Config: f.write(b"whole")
+
+        with patch.object(s3mod, "get_s3_client", return_value=client):
+            preview = s3mod.get_s3_stream("bucket", "a.csv")
+            full = s3mod.get_s3_stream("bucket", "a.csv")
+
+        assert preview.read(100) == b"x" * 100  # sized reads stay on the GET body
+        assert preview.read() == b""
+        client.download_fileobj.assert_not_called()
+        assert full.read() == b"whole"
+        body.close.assert_called_once()
+        args, kwargs = client.download_fileobj.call_args
+        assert args[:2] == ("bucket", "a.csv")
+        assert kwargs["Config"].max_concurrency == s3mod._MULTIPART_CONCURRENCY
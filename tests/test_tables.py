@@ -92,6 +92,15 @@ class TestDetection:
     def test_missing_directory_is_not_a_table(self, tmp_path):
         assert detect_table_format("local", "", str(tmp_path / "nope") + "/") is None
 
+    def test_iceberg_detected_when_delta_probe_fails(self, monkeypatch):
+        def list_directory(service, bucket, prefix):
+            if prefix.endswith("_delta_log/"):
+                raise PermissionError("access denied")
+            return [("tbl/metadata/v1.metadata.json", 10)]
+
+        monkeypatch.setattr("cloudcat.tables.list_directory", list_directory)
+        assert detect_table_format("gcs", "bucket", "tbl/") == "iceberg"
+
 
 class TestCounts:
     def test_delta_count_reflects_latest_version_only(self, delta_table):